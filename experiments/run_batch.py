@@ -3,13 +3,22 @@ from __future__ import annotations
 
 import argparse
 import itertools
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
 
 import pandas as pd
 
 from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.experiment.adaptive import AdaptiveScheduler
 from bitrewards_abm.experiment.config import ExperimentConfig, load_experiment_configuration
+from bitrewards_abm.experiment.result_cache import ResultCache, parameters_fingerprint, run_cache_key
+from bitrewards_abm.experiment.shards import RunShardStore, concatenate_csv_shards, run_key
+from bitrewards_abm.experiment.task_queue import FileTaskQueue
+from bitrewards_abm.experiment.variance_reduction import paired_difference_report
+from bitrewards_abm.infrastructure.writer import BackgroundWriter
 from bitrewards_abm.simulation.model import BitRewardsModel
 
 
@@ -58,94 +67,513 @@ def _parameters_for_run(
     return SimulationParameters(**combined)
 
 
-def _seed_for_run(experiment_config: ExperimentConfig, run_id: int) -> int | None:
+def _seed_for_run(experiment_config: ExperimentConfig, run_id: int, rep: int) -> int | None:
+    """Seed for a run: ``random_seed_base + run_id``, or ``+ rep`` with common random numbers.
+
+    Both members of an antithetic pair share the seed of the pair's first run.
+    """
     if experiment_config.random_seed_base is None:
         return None
-    return experiment_config.random_seed_base + run_id
+    pair_offset = rep % 2 if experiment_config.antithetic_pairs else 0
+    if experiment_config.common_random_numbers:
+        return experiment_config.random_seed_base + rep - pair_offset
+    return experiment_config.random_seed_base + run_id - pair_offset
+
+
+class RunTask(NamedTuple):
+    run_id: int
+    rep: int
+    parameter_overrides: Dict[str, object]
+    seed: int | None
+
+
+class RunOutput(NamedTuple):
+    model_dataframe: pd.DataFrame
+    tracing_metrics: dict[str, int]
+    agent_dataframe: pd.DataFrame | None
+    step_seconds: float
+    event_blocked_seconds: float
+    from_cache: bool = False
+
+
+class RunResult(NamedTuple):
+    run_id: int
+    timeseries: pd.DataFrame
+    summary: pd.Series
+    step_seconds: float
+    event_blocked_seconds: float
+    from_cache: bool = False
+
+
+def run_tasks_for_config(experiment_config: ExperimentConfig) -> List[RunTask]:
+    """Enumerate sweep points and replications in serial order; ``run_id`` is the position.
+
+    With ``antithetic_pairs`` every odd rep runs on the antithetic streams of
+    the rep before it, recorded as an ``rng_antithetic`` override.
+    """
+    tasks: List[RunTask] = []
+    for parameter_overrides in parameter_grid(experiment_config.sweeps):
+        for rep in range(experiment_config.runs_per_config):
+            run_id = len(tasks)
+            tasks.append(_make_task(experiment_config, run_id, rep, parameter_overrides, seed_slot=run_id))
+    return tasks
+
+
+def _make_task(
+    experiment_config: ExperimentConfig,
+    run_id: int,
+    rep: int,
+    parameter_overrides: Dict[str, object],
+    seed_slot: int,
+) -> RunTask:
+    overrides = parameter_overrides
+    if experiment_config.antithetic_pairs:
+        overrides = {**parameter_overrides, "rng_antithetic": rep % 2 == 1}
+    return RunTask(run_id, rep, overrides, _seed_for_run(experiment_config, seed_slot, rep))
 
 
 def _run_single_model(
     parameters: SimulationParameters,
     seed: int | None,
-) -> tuple[pd.DataFrame, dict[str, int]]:
-    model = BitRewardsModel(parameters)
-    if seed is not None:
-        model.random.seed(seed)
+    cache: ResultCache | None = None,
+) -> RunOutput:
+    """Simulate one run, or return its outputs from ``cache`` when an identical run is stored there.
+
+    Only seeded runs with in-memory event logs are cached: an unseeded run is
+    not reproducible, and a disk event log is a side effect a hit would not
+    recreate. Hits report zero simulation time.
+    """
+    key = None
+    if cache is not None and seed is not None and parameters.event_log_mode == "memory":
+        key = run_cache_key(parameters, seed)
+        cached = cache.get(key)
+        if cached is not None:
+            model_dataframe, tracing_metrics, agent_dataframe = cached
+            return RunOutput(model_dataframe, tracing_metrics, agent_dataframe, 0.0, 0.0, from_cache=True)
+    model = BitRewardsModel(parameters, seed=seed)
+    started = time.perf_counter()
     for _ in range(parameters.max_steps):
         model.step()
+    model.close_event_logs()
+    step_seconds = time.perf_counter() - started
+    event_blocked_seconds = model.event_writer.blocked_seconds if model.event_writer is not None else 0.0
     model_dataframe = model.datacollector.get_model_vars_dataframe()
     model_dataframe = model_dataframe.reset_index()
     tracing_metrics = dict(model.tracing_metrics) if hasattr(model, "tracing_metrics") else {}
-    return model_dataframe, tracing_metrics
+    agent_dataframe = None
+    if parameters.record_agents:
+        agent_dataframe = model.datacollector.get_agent_vars_dataframe().reset_index()
+    if cache is not None and key is not None:
+        cache.put(key, (model_dataframe, tracing_metrics, agent_dataframe))
+    return RunOutput(model_dataframe, tracing_metrics, agent_dataframe, step_seconds, event_blocked_seconds)
+
+
+def _execute_run(
+    task: RunTask,
+    base_parameters: SimulationParameters,
+    scenario_name: str,
+    out_dir: Path,
+    cache_dir: Path | None = None,
+) -> RunResult:
+    run_id, rep, parameter_overrides, seed = task
+    parameters = _parameters_for_run(base_parameters, parameter_overrides)
+    if parameters.event_log_mode == "disk":
+        parameters.event_log_dir = str(out_dir / "events" / f"run_{run_id}")
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+    model_dataframe, tracing_metrics, agent_dataframe, step_seconds, event_blocked, from_cache = _run_single_model(
+        parameters, seed, cache
+    )
+    if agent_dataframe is not None:
+        agent_dataframe.to_csv(out_dir / f"agents_run{run_id}.csv", index=False)
+
+    model_dataframe["run_id"] = run_id
+    model_dataframe["rep"] = rep
+    model_dataframe["scenario_name"] = scenario_name
+
+    logged_params = parameters_to_log(parameters)
+    combined_parameters = {**logged_params, **parameter_overrides}
+    for key, value in combined_parameters.items():
+        model_dataframe[key] = value
+
+    final_row = model_dataframe.iloc[-1].copy()
+    final_row["run_id"] = run_id
+    final_row["rep"] = rep
+    final_row["scenario_name"] = scenario_name
+    for key, value in combined_parameters.items():
+        final_row[key] = value
+    for column in (
+        "mean_creator_satisfaction",
+        "mean_investor_satisfaction",
+        "mean_user_satisfaction",
+    ):
+        if column in model_dataframe:
+            final_row[f"{column}_over_run"] = float(model_dataframe[column].mean())
+    for key, value in tracing_metrics.items():
+        final_row[f"tracing_{key}"] = value
+
+    return RunResult(run_id, model_dataframe, final_row, step_seconds, event_blocked, from_cache)
+
+
+def _manifest_key(base_parameters: SimulationParameters, task: RunTask) -> str:
+    parameters = _parameters_for_run(base_parameters, task.parameter_overrides)
+    return run_key(task.parameter_overrides, task.rep, task.seed, parameters_fingerprint(parameters))
+
+
+def _record_run(store: RunShardStore, key: str, result: RunResult) -> None:
+    store.record(
+        result.run_id,
+        key,
+        {
+            "timeseries": result.timeseries.to_csv(index=False),
+            "summary": pd.DataFrame([result.summary]).to_csv(index=False),
+        },
+    )
+
+
+def _completed_runs_in_order(
+    tasks: List[RunTask],
+    base_parameters: SimulationParameters,
+    scenario_name: str,
+    out_dir: Path,
+    workers: int,
+    cache_dir: Path | None = None,
+) -> Iterator[RunResult]:
+    """Yield run results in task order, running up to ``workers`` at once.
+
+    At most ``2 * workers`` runs are in flight or waiting to be merged, so a
+    slow early run holds back only that window rather than every later result.
+    """
+    if workers <= 1:
+        for task in tasks:
+            yield _execute_run(task, base_parameters, scenario_name, out_dir, cache_dir)
+        return
+    window = 2 * workers
+    remaining = iter(tasks)
+    pending: Dict[Future, int] = {}
+    finished: Dict[int, RunResult] = {}
+    order = [task.run_id for task in tasks]
+    next_position = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(pending) + len(finished) < window:
+                next_task = next(remaining, None)
+                if next_task is None:
+                    break
+                future = pool.submit(_execute_run, next_task, base_parameters, scenario_name, out_dir, cache_dir)
+                pending[future] = next_task.run_id
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                result = future.result()
+                finished[result.run_id] = result
+            while next_position < len(order) and order[next_position] in finished:
+                yield finished.pop(order[next_position])
+                next_position += 1
 
 
 def run_experiments_for_config(
     config_path: Path,
     out_dir: Path | None = None,
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    writer_queue: int = 0,
+    workers: int = 1,
+    return_timeseries: bool = True,
+    resume: bool = False,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int | None = None,
+    cache_max_age_seconds: float | None = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Run every sweep point and replication of a config and write the CSV outputs.
+
+    Each finished run is persisted straight away as timeseries and summary
+    shards under ``out_dir/shards`` plus a line in its append-only manifest,
+    keyed by (sweep point, rep, seed). ``timeseries.csv`` and
+    ``run_summary.csv`` are then rebuilt from the shards in ``run_id`` order.
+    With ``resume=True`` runs already in the manifest are skipped, so a sweep
+    that died part-way only reruns what is missing; without it the shards
+    are cleared first.
+
+    With ``writer_queue > 0`` shards are encoded and written on a background
+    writer, and the merge loop blocks only while ``writer_queue`` runs are
+    already pending. ``workers > 1`` spreads runs over a process pool;
+    ``run_id`` and seeds are fixed up front, so the outputs match a serial run
+    whatever order runs finish in. Pass ``return_timeseries=False`` to avoid
+    keeping every run's rows in memory; the second return value is then
+    ``None``. Time spent simulating and blocked on writers (including disk
+    event logs) is printed at the end.
+
+    With ``cache_dir`` each seeded run is looked up in a ``ResultCache`` keyed
+    by its resolved parameters, seed and a fingerprint of the model code, so
+    rerunning an unchanged sweep point costs a file read. The cache is pruned
+    to ``cache_max_bytes`` and ``cache_max_age_seconds`` once the batch is done.
+
+    With ``[experiment.adaptive]`` the rep count per sweep point is not fixed:
+    an ``AdaptiveScheduler`` launches rounds of reps until every chosen
+    metric's confidence-interval half-width meets its target or ``max_reps``
+    is reached, and each row of ``run_summary.csv`` gets its point's final
+    rep count, convergence flag and ``ci_half_width_<metric>`` columns.
+    """
     if out_dir is None:
         out_dir = Path("data")
 
     base_parameters, experiment_config = load_experiment_configuration(config_path)
-
-    run_summaries: List[pd.Series] = []
-    timeseries_frames: List[pd.DataFrame] = []
-    run_id = 0
-
-    for parameter_overrides in parameter_grid(experiment_config.sweeps):
-        for rep in range(experiment_config.runs_per_config):
-            parameters = _parameters_for_run(base_parameters, parameter_overrides)
-            seed = _seed_for_run(experiment_config, run_id)
-            model_dataframe, tracing_metrics = _run_single_model(parameters, seed)
-
-            model_dataframe["run_id"] = run_id
-            model_dataframe["rep"] = rep
-            model_dataframe["scenario_name"] = experiment_config.name
-
-            logged_params = parameters_to_log(parameters)
-            combined_parameters = {**logged_params, **parameter_overrides}
-            for key, value in combined_parameters.items():
-                model_dataframe[key] = value
-
-            timeseries_frames.append(model_dataframe)
-
-            final_row = model_dataframe.iloc[-1].copy()
-            final_row["run_id"] = run_id
-            final_row["rep"] = rep
-            final_row["scenario_name"] = experiment_config.name
-            for key, value in combined_parameters.items():
-                final_row[key] = value
-            final_row["mean_creator_satisfaction_over_run"] = float(
-                model_dataframe["mean_creator_satisfaction"].mean()
-            )
-            final_row["mean_investor_satisfaction_over_run"] = float(
-                model_dataframe["mean_investor_satisfaction"].mean()
-            )
-            final_row["mean_user_satisfaction_over_run"] = float(
-                model_dataframe["mean_user_satisfaction"].mean()
-            )
-            for key, value in tracing_metrics.items():
-                final_row[f"tracing_{key}"] = value
-
-            run_summaries.append(final_row)
-            run_id += 1
-
     out_dir.mkdir(parents=True, exist_ok=True)
-    timeseries_df = pd.concat(timeseries_frames, ignore_index=True)
-    run_summary_df = pd.DataFrame(run_summaries)
-
     timeseries_path = out_dir / "timeseries.csv"
     run_summary_path = out_dir / "run_summary.csv"
+    store = RunShardStore(out_dir / "shards")
+    writer = BackgroundWriter(max_pending=writer_queue) if writer_queue > 0 else None
 
-    timeseries_df.to_csv(timeseries_path, index=False)
-    run_summary_df.to_csv(run_summary_path, index=False)
+    completed = store.completed() if resume else {}
+    if not resume:
+        store.reset()
+
+    def already_completed(task: RunTask) -> bool:
+        return completed.get(_manifest_key(base_parameters, task), {}).get("run_id") == task.run_id
+
+    run_summaries: List[pd.Series] = []
+    timeseries_frames: List[pd.DataFrame] = []
+    executed = 0
+    simulate_seconds = 0.0
+    blocked_seconds = 0.0
+    cache_hits = 0
+
+    def run_and_record(round_tasks: List[RunTask]) -> Iterator[RunResult]:
+        nonlocal executed, simulate_seconds, blocked_seconds, cache_hits
+        tasks_by_run_id = {task.run_id: task for task in round_tasks}
+        for result in _completed_runs_in_order(
+            round_tasks, base_parameters, experiment_config.name, out_dir, workers, cache_dir
+        ):
+            executed += 1
+            cache_hits += result.from_cache
+            simulate_seconds += result.step_seconds - result.event_blocked_seconds
+            blocked_seconds += result.event_blocked_seconds
+            key = _manifest_key(base_parameters, tasks_by_run_id[result.run_id])
+            if writer is not None:
+                writer.submit(_record_run, store, key, result)
+            else:
+                _record_run(store, key, result)
+            if return_timeseries:
+                timeseries_frames.append(result.timeseries)
+            run_summaries.append(result.summary)
+            yield result
+
+    started = time.perf_counter()
+    scheduler: AdaptiveScheduler | None = None
+    slot_by_run_id: Dict[int, Tuple[int, int]] = {}
+    if experiment_config.adaptive is None:
+        tasks = run_tasks_for_config(experiment_config)
+        remaining_tasks = [task for task in tasks if not already_completed(task)]
+        if resume:
+            print(f"Resuming: {len(tasks) - len(remaining_tasks)} of {len(tasks)} runs already completed")
+        for _ in run_and_record(remaining_tasks):
+            pass
+    else:
+        # Rounds are scheduled from results, so run_ids follow the schedule while
+        # seeds depend only on (sweep point, rep); a resumed run replays the same
+        # schedule and reads finished runs back from their shards.
+        settings = experiment_config.adaptive
+        points = list(parameter_grid(experiment_config.sweeps))
+        scheduler = AdaptiveScheduler(settings, len(points), rep_step=2 if experiment_config.antithetic_pairs else 1)
+        tasks = []
+        while True:
+            round_tasks: List[RunTask] = []
+            for point, rep in scheduler.next_round():
+                run_id = len(tasks)
+                seed_slot = point * settings.max_reps + rep
+                task = _make_task(experiment_config, run_id, rep, points[point], seed_slot=seed_slot)
+                tasks.append(task)
+                round_tasks.append(task)
+                slot_by_run_id[run_id] = (point, rep)
+            if not round_tasks:
+                break
+            for task in round_tasks:
+                if already_completed(task):
+                    shard_path = store.shard_path(task.run_id, "summary")
+                    summary = pd.read_csv(shard_path, float_precision="round_trip").iloc[0]
+                    scheduler.record(*slot_by_run_id[task.run_id], summary)
+            for result in run_and_record([task for task in round_tasks if not already_completed(task)]):
+                scheduler.record(*slot_by_run_id[result.run_id], result.summary)
+        if resume:
+            print(f"Resuming: reused {len(tasks) - executed} of {len(tasks)} runs already completed")
+
+    if writer is not None:
+        writer.close()
+        blocked_seconds += writer.blocked_seconds
+
+    run_ids = [task.run_id for task in tasks]
+    store.concatenate("timeseries", run_ids, timeseries_path)
+    store.concatenate("summary", run_ids, run_summary_path)
+
+    if executed < len(tasks):
+        run_summary_df = pd.read_csv(run_summary_path, float_precision="round_trip")
+        timeseries_df = pd.read_csv(timeseries_path, float_precision="round_trip") if return_timeseries else None
+    else:
+        run_summary_df = pd.DataFrame(run_summaries)
+        timeseries_df = pd.concat(timeseries_frames, ignore_index=True) if return_timeseries else None
+    if scheduler is not None:
+        run_summary_df = _with_adaptive_precision(run_summary_df, scheduler, slot_by_run_id)
+        run_summary_df.to_csv(run_summary_path, index=False)
 
     print(f"Wrote run summaries to {run_summary_path}")
     print(f"Wrote time series to {timeseries_path}")
+    print(
+        f"Ran {executed} runs on {max(1, workers)} worker(s) in {time.perf_counter() - started:.2f}s; "
+        f"simulated for {simulate_seconds:.2f}s summed over runs; blocked on output writers for {blocked_seconds:.2f}s"
+    )
+    if scheduler is not None:
+        converged = sum(scheduler.converged(point) for point in range(scheduler.point_count))
+        print(
+            f"Adaptive replication used {len(tasks)} runs over {scheduler.point_count} sweep point(s) "
+            f"(max_reps allows {scheduler.point_count * scheduler.settings.max_reps}); "
+            f"{converged} point(s) reached the target half-width"
+        )
+    if cache_dir is not None:
+        print(f"Served {cache_hits} of {executed} runs from the result cache in {cache_dir}")
+        prune_result_cache(cache_dir, cache_max_bytes, cache_max_age_seconds)
+    write_variance_reduction_report(experiment_config, run_summary_df, out_dir)
 
     return run_summary_df, timeseries_df
 
 
+def _with_adaptive_precision(
+    run_summary_df: pd.DataFrame,
+    scheduler: AdaptiveScheduler,
+    slot_by_run_id: Dict[int, Tuple[int, int]],
+) -> pd.DataFrame:
+    """Add each run's sweep-point precision: rep count, convergence and CI half-width per metric."""
+    points = run_summary_df["run_id"].map(lambda run_id: slot_by_run_id[int(run_id)][0])
+    precision = {
+        point: {
+            "adaptive_reps": scheduler.reps(point),
+            "adaptive_converged": scheduler.converged(point),
+            **{f"ci_half_width_{metric}": width for metric, width in scheduler.half_widths(point).items()},
+        }
+        for point in range(scheduler.point_count)
+    }
+    columns = pd.DataFrame([precision[point] for point in points], index=run_summary_df.index)
+    return pd.concat([run_summary_df, columns], axis=1)
+
+
+def write_variance_reduction_report(
+    experiment_config: ExperimentConfig,
+    run_summary_df: pd.DataFrame,
+    out_dir: Path,
+) -> pd.DataFrame | None:
+    """Write ``variance_reduction.csv`` for sweeps run with common random numbers or antithetic pairs."""
+    if not (experiment_config.common_random_numbers or experiment_config.antithetic_pairs):
+        return None
+    if not experiment_config.sweeps:
+        return None
+    report = paired_difference_report(
+        run_summary_df,
+        list(experiment_config.sweeps),
+        antithetic_pairs=experiment_config.antithetic_pairs,
+    )
+    report_path = out_dir / "variance_reduction.csv"
+    report.to_csv(report_path, index=False)
+    if not report.empty:
+        by_metric = report.groupby("metric", sort=False)["variance_reduction"].median().dropna()
+        summary = ", ".join(f"{metric} {value:.0%}" for metric, value in by_metric.items())
+        print(f"Median variance reduction on paired differences: {summary}")
+    print(f"Wrote variance reduction report to {report_path}")
+    return report
+
+
+def prune_result_cache(
+    cache_dir: Path,
+    max_bytes: int | None = None,
+    max_age_seconds: float | None = None,
+) -> int:
+    if max_bytes is None and max_age_seconds is None:
+        return 0
+    cache = ResultCache(cache_dir)
+    removed = cache.evict(max_bytes=max_bytes, max_age_seconds=max_age_seconds)
+    print(f"Evicted {removed} result cache entries; {cache.size_bytes()} bytes remain in {cache_dir}")
+    return removed
+
+
+QUEUE_CONFIG_NAME = "config.toml"
+
+
+def _task_id(run_id: int) -> str:
+    return f"run_{run_id:06d}"
+
+
+def enqueue_config(config_path: Path, queue_dir: Path, stale_after: float = 600.0) -> FileTaskQueue:
+    """Expand a config into a shared task directory that ``work_on_queue`` processes can drain."""
+    _, experiment_config = load_experiment_configuration(config_path)
+    if experiment_config.adaptive is not None:
+        raise ValueError("Adaptive replication schedules runs from results and cannot be queued up front")
+    tasks = run_tasks_for_config(experiment_config)
+    queue = FileTaskQueue.create(
+        queue_dir,
+        {_task_id(task.run_id): task._asdict() for task in tasks},
+        attachments={QUEUE_CONFIG_NAME: config_path.read_text()},
+        stale_after=stale_after,
+    )
+    print(f"Queued {len(tasks)} runs in {queue_dir}")
+    return queue
+
+
+def work_on_queue(
+    queue_dir: Path,
+    stale_after: float = 600.0,
+    poll_interval: float = 5.0,
+    max_tasks: int | None = None,
+    cache_dir: Path | None = None,
+) -> int:
+    """Claim and run tasks until the queue is drained; returns the number of runs completed here.
+
+    Each run writes ``results/<task>.timeseries.csv`` and ``<task>.summary.csv``
+    shards. While other workers still hold claims this worker keeps polling, so
+    it can pick up tasks whose claims go stale when their worker dies.
+    ``cache_dir`` may be shared by every worker, like the queue itself.
+    """
+    queue = FileTaskQueue(queue_dir, stale_after=stale_after)
+    base_parameters, experiment_config = load_experiment_configuration(queue.root / QUEUE_CONFIG_NAME)
+    completed = 0
+    while max_tasks is None or completed < max_tasks:
+        queue.reclaim_stale()
+        claimed = queue.claim()
+        if claimed is None:
+            if queue.is_finished():
+                break
+            time.sleep(poll_interval)
+            continue
+        task = RunTask(**claimed.payload)
+        with queue.keep_alive(claimed):
+            result = _execute_run(task, base_parameters, experiment_config.name, queue.results_dir, cache_dir)
+            queue.write_result(claimed.task_id, "timeseries.csv", result.timeseries.to_csv(index=False))
+            queue.write_result(claimed.task_id, "summary.csv", pd.DataFrame([result.summary]).to_csv(index=False))
+        queue.complete(claimed)
+        completed += 1
+    return completed
+
+
+def merge_queue_results(queue_dir: Path, out_dir: Path) -> None:
+    """Concatenate the result shards, in ``run_id`` order, into ``timeseries.csv`` and ``run_summary.csv``."""
+    queue = FileTaskQueue(queue_dir)
+    _, experiment_config = load_experiment_configuration(queue.root / QUEUE_CONFIG_NAME)
+    task_ids = [_task_id(task.run_id) for task in run_tasks_for_config(experiment_config)]
+    missing = [
+        task_id
+        for task_id in task_ids
+        if not all(queue.result_path(task_id, name).exists() for name in ("timeseries.csv", "summary.csv"))
+    ]
+    if missing:
+        raise RuntimeError(f"{len(missing)} runs have no results yet, e.g. {missing[:5]}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    outputs = {"timeseries.csv": out_dir / "timeseries.csv", "summary.csv": out_dir / "run_summary.csv"}
+    for name, output_path in outputs.items():
+        concatenate_csv_shards((queue.result_path(task_id, name) for task_id in task_ids), output_path)
+    write_variance_reduction_report(experiment_config, pd.read_csv(outputs["summary.csv"]), out_dir)
+    for agent_path in sorted(queue.results_dir.glob("agents_run*.csv")):
+        shutil.copyfile(agent_path, out_dir / agent_path.name)
+    print(f"Wrote run summaries to {outputs['summary.csv']}")
+    print(f"Wrote time series to {outputs['timeseries.csv']}")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run batch experiments for BitRewardsModel.")
     parser.add_argument(
@@ -160,12 +588,103 @@ def parse_args() -> argparse.Namespace:
         default=Path("data"),
         help="Directory where CSV outputs will be written.",
     )
+    parser.add_argument(
+        "--writer-queue",
+        type=int,
+        default=0,
+        help="Write timeseries rows on a background thread with this many pending runs (0 writes inline).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for independent runs (1 runs serially in this process).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip runs already recorded in OUT_DIR/shards/manifest.jsonl and rebuild the combined CSVs.",
+    )
+    queue_mode = parser.add_mutually_exclusive_group()
+    queue_mode.add_argument(
+        "--enqueue",
+        type=Path,
+        metavar="QUEUE_DIR",
+        help="Expand --config into task files under QUEUE_DIR (on a shared filesystem) and exit.",
+    )
+    queue_mode.add_argument(
+        "--work",
+        type=Path,
+        metavar="QUEUE_DIR",
+        help="Claim and run tasks from QUEUE_DIR until none are left; start one per core on any node.",
+    )
+    queue_mode.add_argument(
+        "--merge",
+        type=Path,
+        metavar="QUEUE_DIR",
+        help="Merge the result shards in QUEUE_DIR into --out-dir.",
+    )
+    parser.add_argument(
+        "--stale-after",
+        type=float,
+        default=600.0,
+        help="Seconds without a heartbeat after which a claimed task is handed to another worker.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5.0,
+        help="Seconds a --work process waits between checks while other workers hold the remaining tasks.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Reuse outputs of seeded runs with identical parameters, seed and model code from this directory.",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=None,
+        help="After the batch, evict least recently used cache entries until the cache fits in this many bytes.",
+    )
+    parser.add_argument(
+        "--cache-max-age-days",
+        type=float,
+        default=None,
+        help="After the batch, evict cache entries not used for this many days.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    run_experiments_for_config(args.config, out_dir=args.out_dir)
+    cache_max_age_seconds = args.cache_max_age_days * 86400.0 if args.cache_max_age_days is not None else None
+    if args.enqueue is not None:
+        enqueue_config(args.config, args.enqueue, stale_after=args.stale_after)
+        return
+    if args.work is not None:
+        completed = work_on_queue(
+            args.work, stale_after=args.stale_after, poll_interval=args.poll_interval, cache_dir=args.cache_dir
+        )
+        print(f"Completed {completed} runs from {args.work}")
+        if args.cache_dir is not None:
+            prune_result_cache(args.cache_dir, args.cache_max_bytes, cache_max_age_seconds)
+        return
+    if args.merge is not None:
+        merge_queue_results(args.merge, args.out_dir)
+        return
+    run_experiments_for_config(
+        args.config,
+        out_dir=args.out_dir,
+        writer_queue=args.writer_queue,
+        workers=args.workers,
+        return_timeseries=False,
+        resume=args.resume,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_bytes,
+        cache_max_age_seconds=cache_max_age_seconds,
+    )
 
 
 if __name__ == "__main__":
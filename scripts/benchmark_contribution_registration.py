@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from bitrewards_abm.domain.entities import ContributionType
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def build_model(tracing_accuracy: float, false_positive_rate: float, seed: int) -> BitRewardsModel:
+    params = SimulationParameters(
+        creator_count=1,
+        investor_count=0,
+        user_count=0,
+        tracing_accuracy=tracing_accuracy,
+        tracing_false_positive_rate=false_positive_rate,
+        creator_base_contribution_probability=0.0,
+    )
+    return BitRewardsModel(parameters=params, seed=seed)
+
+
+def run_benchmark(total: int, window: int, tracing_accuracy: float, false_positive_rate: float, seed: int) -> None:
+    model = build_model(tracing_accuracy, false_positive_rate, seed)
+    creator = model.creators[0]
+    print(f"{'dag_size':>10} {'us_per_contribution':>20}")
+    registered = 0
+    while registered < total:
+        batch = min(window, total - registered)
+        start = time.perf_counter()
+        for _ in range(batch):
+            model.register_creator_contribution(
+                creator=creator,
+                contribution_type=ContributionType.CORE_RESEARCH,
+                quality=creator.draw_contribution_quality(),
+                parent_identifier=model.select_parent_for_new_contribution(),
+            )
+        elapsed = time.perf_counter() - start
+        registered += batch
+        print(f"{registered:>10} {1e6 * elapsed / batch:>20.2f}")
+    print(f"false_positive_links={model.tracing_metrics['false_positive_links']}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time contribution registration as the DAG grows (low tracing accuracy stresses false positives)."
+    )
+    parser.add_argument("--contributions", type=int, default=100_000, help="Total contributions to register.")
+    parser.add_argument("--window", type=int, default=10_000, help="Contributions per timing window.")
+    parser.add_argument("--tracing-accuracy", type=float, default=0.35, help="Probability a true link is detected.")
+    parser.add_argument("--false-positive-rate", type=float, default=1.0, help="Probability a missed link is misattributed.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the model random number generator.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    run_benchmark(args.contributions, args.window, args.tracing_accuracy, args.false_positive_rate, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.agents import CreatorAgent
+from bitrewards_abm.simulation.model import BitRewardsModel, gini
+
+MODES = ("tracked", "reload", "rescan")
+
+
+def build_model(creators: int, users: int, steps: int, seed: int) -> BitRewardsModel:
+    params = SimulationParameters(creator_count=creators, user_count=users, max_steps=steps)
+    return BitRewardsModel(parameters=params, seed=seed)
+
+
+def time_run(creators: int, users: int, steps: int, seed: int, mode: str) -> tuple[float, float, int, int]:
+    """Run once and return (run seconds, seconds spent reading the Gini, updates, reloads).
+
+    ``tracked`` is the model as shipped, ``reload`` forces a full tracker reload
+    on every read, and ``rescan`` drops the tracker for one sorted scan per step.
+    """
+    model = build_model(creators, users, steps, seed)
+    statistics = model.agent_statistics
+    if mode == "rescan":
+        statistics.wealth_trackers.clear()
+        statistics._pending_wealth.clear()
+    elif mode == "reload":
+        statistics.wealth_trackers[CreatorAgent].prefers_reset = lambda changes: True  # type: ignore[method-assign]
+    gini_seconds = 0.0
+    read_gini = statistics.wealth_gini
+
+    def timed_read(group: type) -> float:
+        nonlocal gini_seconds
+        started = time.perf_counter()
+        value = read_gini(group)
+        gini_seconds += time.perf_counter() - started
+        return value
+
+    statistics.wealth_gini = timed_read  # type: ignore[method-assign]
+    start = time.perf_counter()
+    for _ in range(steps):
+        model.step()
+        if mode == "rescan":
+            started = time.perf_counter()
+            gini([agent.wealth for agent in model.creators])
+            gini_seconds += time.perf_counter() - started
+    return time.perf_counter() - start, gini_seconds, statistics.gini_updates, statistics.gini_reloads
+
+
+def run_benchmark(creators: int, users: int, steps: int, repeats: int, seed: int) -> None:
+    best: dict[str, tuple[float, float, int, int]] = {}
+    for _ in range(repeats):
+        for mode in MODES:
+            result = time_run(creators, users, steps, seed, mode)
+            if mode not in best or result[1] < best[mode][1]:
+                best[mode] = result
+    print(f"{'mode':>8} {'run_seconds':>12} {'gini_ms':>10} {'updates':>9} {'reloads':>8}")
+    for mode, (run_seconds, gini_seconds, updates, reloads) in best.items():
+        print(f"{mode:>8} {run_seconds:>12.3f} {1e3 * gini_seconds:>10.2f} {updates:>9} {reloads:>8}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time creator wealth Gini reads: tracked updates against forced reloads and a per-step rescan."
+    )
+    parser.add_argument("--creators", type=int, default=20_000, help="Initial creator count.")
+    parser.add_argument("--users", type=int, default=50, help="Initial user count.")
+    parser.add_argument("--steps", type=int, default=30, help="Steps per run.")
+    parser.add_argument("--repeats", type=int, default=2, help="Interleaved runs per mode; the fastest Gini time is reported.")
+    parser.add_argument("--seed", type=int, default=42, help="Model seed shared by every mode.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    run_benchmark(args.creators, args.users, args.steps, args.repeats, args.seed)
+
+
+if __name__ == "__main__":
+    main()
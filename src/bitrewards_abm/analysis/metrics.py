@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterator, List
 
 import pandas as pd
 
+from bitrewards_abm.simulation.events import EventBuffer, EventSink
 from bitrewards_abm.simulation.model import BitRewardsModel
 
 
@@ -15,54 +16,43 @@ class SimulationMetrics:
     tracing_metrics: Dict[str, float]
     role_income_by_step: pd.DataFrame
     gas_vs_royalty_by_role: pd.DataFrame
+    reward_event_sink: EventSink | None = None
 
+    def iter_reward_event_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reward events chunk by chunk, from the model's sink when ``reward_events`` was not loaded."""
+        if not self.reward_events.empty:
+            yield self.reward_events
+        elif self.reward_event_sink is not None:
+            yield from self.reward_event_sink.iter_chunks()
 
-def collect_metrics_from_model(model: BitRewardsModel) -> SimulationMetrics:
-    reward_df = pd.DataFrame(model.reward_events or [])
-    usage_df = pd.DataFrame(model.usage_events or [])
 
-    if reward_df.empty:
-        reward_df = pd.DataFrame(
-            columns=[
-                "step",
-                "payout_type",
-                "channel",
-                "amount",
-                "recipient_id",
-                "recipient_role",
-                "source_contribution_id",
-            ]
-        )
-    if usage_df.empty:
-        usage_df = pd.DataFrame(
-            columns=[
-                "step",
-                "contribution_id",
-                "user_id",
-            ]
-        )
+def _sum_amount_by(chunks: Iterator[pd.DataFrame], keys: List[str]) -> pd.DataFrame:
+    partials = [chunk.groupby(keys, observed=True)["amount"].sum() for chunk in chunks]
+    if not partials:
+        return pd.DataFrame(columns=[*keys, "amount"])
+    if len(partials) == 1:
+        return partials[0].reset_index()
+    combined = pd.concat([partial.reset_index() for partial in partials], ignore_index=True)
+    return combined.groupby(keys, observed=True)["amount"].sum().reset_index()
 
-    if not reward_df.empty:
-        role_income_by_step = (
-            reward_df.groupby(["step", "recipient_role"])["amount"]
-            .sum()
-            .reset_index()
-        )
-    else:
-        role_income_by_step = pd.DataFrame(
-            columns=["step", "recipient_role", "amount"]
-        )
 
-    if not reward_df.empty:
-        gas_vs_royalty_by_role = (
-            reward_df.groupby(["recipient_role", "channel"])["amount"]
-            .sum()
-            .reset_index()
-        )
+def collect_metrics_from_model(model: BitRewardsModel, load_events: bool = True) -> SimulationMetrics:
+    """Summarise a run's event logs.
+
+    The per-role aggregates are computed chunk by chunk, so with a disk-backed
+    event log and ``load_events=False`` memory stays at one chunk; the
+    ``reward_events``/``usage_events`` frames are then left empty and
+    ``SimulationMetrics.iter_reward_event_chunks`` streams the rewards instead.
+    """
+    if load_events:
+        reward_df = model.reward_events.to_dataframe()
+        usage_df = model.usage_events.to_dataframe()
     else:
-        gas_vs_royalty_by_role = pd.DataFrame(
-            columns=["recipient_role", "channel", "amount"]
-        )
+        reward_df = EventBuffer(model.reward_events.columns).to_dataframe()
+        usage_df = EventBuffer(model.usage_events.columns).to_dataframe()
+
+    role_income_by_step = _sum_amount_by(model.reward_events.iter_chunks(), ["step", "recipient_role"])
+    gas_vs_royalty_by_role = _sum_amount_by(model.reward_events.iter_chunks(), ["recipient_role", "channel"])
 
     tracing_metrics = dict(getattr(model, "tracing_metrics", {}))
 
@@ -72,4 +62,5 @@ def collect_metrics_from_model(model: BitRewardsModel) -> SimulationMetrics:
         tracing_metrics=tracing_metrics,
         role_income_by_step=role_income_by_step,
         gas_vs_royalty_by_role=gas_vs_royalty_by_role,
+        reward_event_sink=model.reward_events,
     )
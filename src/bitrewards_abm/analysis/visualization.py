@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import itertools
+from typing import Iterable, Tuple
+
 import matplotlib.pyplot as plt
 import networkx as nx
 import pandas as pd
 
 from bitrewards_abm.analysis.metrics import SimulationMetrics
 from bitrewards_abm.domain.entities import ContributionType
-from bitrewards_abm.infrastructure.graph_store import ContributionGraph
+from bitrewards_abm.infrastructure.graph_store import BaseContributionGraph
 from bitrewards_abm.simulation.model import BitRewardsModel
 
 
@@ -76,7 +79,7 @@ def plot_dag_snapshot(
     max_nodes: int = 50,
     include_true_vs_observed: bool = False,
 ) -> plt.Figure:
-    graph: ContributionGraph = model.contribution_graph
+    graph: BaseContributionGraph = model.contribution_graph
     full_graph = graph.to_networkx()
     nodes = list(full_graph.nodes())
 
@@ -184,24 +187,8 @@ def plot_dag_snapshot(
     return fig
 
 
-def plot_ai_tracing_panel(
-    metrics: SimulationMetrics,
-    model: BitRewardsModel,
-) -> plt.Figure:
-    fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(10, 4))
-    tm = metrics.tracing_metrics or {}
-    labels = ["true_links", "detected_true_links", "false_positive_links", "missed_true_links"]
-    values = [tm.get(key, 0) for key in labels]
-    ax_left.bar(labels, values)
-    ax_left.set_title("AI tracing link metrics")
-    ax_left.set_ylabel("Count")
-    ax_left.tick_params(axis="x", rotation=45)
-    reward_df = metrics.reward_events
-    if reward_df.empty:
-        ax_right.text(0.5, 0.5, "No reward events", ha="center", va="center")
-        ax_right.axis("off")
-        fig.tight_layout()
-        return fig
+def true_ancestor_reward_totals(reward_chunks: Iterable[pd.DataFrame], model: BitRewardsModel) -> Tuple[float, float]:
+    """Split reward amounts by whether the recipient owns a true ancestor of the event's source contribution."""
 
     def is_true_ancestor(recipient_id: int, source_contribution_id: str) -> bool:
         owned = [cid for cid, c in model.contributions.items() if c.owner_id == recipient_id]
@@ -223,13 +210,40 @@ def plot_ai_tracing_panel(
 
     true_amount = 0.0
     non_true_amount = 0.0
-    for _, row in reward_df.iterrows():
-        recipient_id = int(row["recipient_id"])
-        source_cid = str(row["source_contribution_id"])
-        if is_true_ancestor(recipient_id, source_cid):
-            true_amount += float(row["amount"])
-        else:
-            non_true_amount += float(row["amount"])
+    for reward_df in reward_chunks:
+        for _, row in reward_df.iterrows():
+            recipient_id = int(row["recipient_id"])
+            source_cid = str(row["source_contribution_id"])
+            if is_true_ancestor(recipient_id, source_cid):
+                true_amount += float(row["amount"])
+            else:
+                non_true_amount += float(row["amount"])
+    return true_amount, non_true_amount
+
+
+def plot_ai_tracing_panel(
+    metrics: SimulationMetrics,
+    model: BitRewardsModel,
+) -> plt.Figure:
+    fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(10, 4))
+    tm = metrics.tracing_metrics or {}
+    labels = ["true_links", "detected_true_links", "false_positive_links", "missed_true_links"]
+    values = [tm.get(key, 0) for key in labels]
+    ax_left.bar(labels, values)
+    ax_left.set_title("AI tracing link metrics")
+    ax_left.set_ylabel("Count")
+    ax_left.tick_params(axis="x", rotation=45)
+    reward_chunks = metrics.iter_reward_event_chunks()
+    first_chunk = next(reward_chunks, None)
+    if first_chunk is None:
+        ax_right.text(0.5, 0.5, "No reward events", ha="center", va="center")
+        ax_right.axis("off")
+        fig.tight_layout()
+        return fig
+    true_amount, non_true_amount = true_ancestor_reward_totals(
+        itertools.chain([first_chunk], reward_chunks),
+        model,
+    )
     ax_right.bar(["true_ancestors", "non_true"], [true_amount, non_true_amount])
     ax_right.set_title("Rewards to true vs non-true ancestors")
     ax_right.set_ylabel("Total rewards")
@@ -242,8 +256,7 @@ def plot_life_of_contribution(
     metrics: SimulationMetrics,
     contribution_id: str,
 ) -> plt.Figure:
-    reward_df = metrics.reward_events
-    if reward_df.empty or contribution_id not in model.contributions:
+    if contribution_id not in model.contributions:
         fig, ax = plt.subplots(figsize=(8, 4))
         ax.text(0.5, 0.5, "No data for contribution", ha="center", va="center")
         ax.axis("off")
@@ -261,7 +274,11 @@ def plot_life_of_contribution(
         if c.contribution_type is ContributionType.FUNDING and contribution_id in (c.parents or [])
     ]
     funding_owner_ids = {model.contributions[cid].owner_id for cid in funding_contributions}
-    df = reward_df[reward_df["source_contribution_id"].isin(relevant_roots)].copy()
+    matching = [
+        chunk[chunk["source_contribution_id"].isin(relevant_roots)]
+        for chunk in metrics.iter_reward_event_chunks()
+    ]
+    df = pd.concat(matching, ignore_index=True) if matching else pd.DataFrame()
     if df.empty:
         fig, ax = plt.subplots(figsize=(8, 4))
         ax.text(0.5, 0.5, "No rewards associated with this contribution", ha="center", va="center")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 
 class ContributionType(str, Enum):
@@ -37,7 +37,7 @@ class Contribution:
     funding_raised: float = 0.0
     royalty_percent: Optional[float] = None
     usage_count: int = 0
-    lockup_remaining_steps: int = 0
+    lockup_expiry_step: int = 0
     is_performance_verified: bool = False
     kind: Optional[str] = None
     accrued_royalty_value: float = 0.0
@@ -54,6 +54,16 @@ class UsageEvent:
     fee_amount: float
 
 
+class EscrowedReward(NamedTuple):
+    owner_id: int
+    sequence: int
+    contribution_id: str
+    amount: float
+    payout_type: Optional[str]
+    source_contribution_id: Optional[str]
+    channel: Optional[str]
+
+
 @dataclass
 class TreasuryState:
     balance: float = 0.0
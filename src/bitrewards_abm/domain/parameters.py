@@ -29,6 +29,8 @@ class SimulationParameters:
     funding_max_amount: float = 50.0
     royalty_accrual_per_usage: float = 1.0
     royalty_batch_interval: int = 30
+    royalty_settlement_mode: str = "per_root"
+    gas_settlement_mode: str = "per_event"
 
     default_derivative_split: float = 0.5
     supporting_derivative_split: float = 0.5
@@ -83,6 +85,18 @@ class SimulationParameters:
     investor_post_cap_payout_fraction: float = 0.25
     royalty_mode: str = "single_path"
     royalty_keep_fraction: float = 0.5
+    graph_backend: str = "networkx"
+    creator_gini_mode: str = "exact"
+    creator_gini_bin_growth: float = 1.01
+    record_every: int = 1
+    recorded_columns: list[str] | None = None
+    record_agents: bool = False
+    event_log_mode: str = "memory"
+    event_log_dir: str | None = None
+    event_log_chunk_size: int = 65536
+    event_log_writer_queue: int = 0
+    rng_streams: str = "shared"
+    rng_antithetic: bool = False
 
     def get_base_royalty_share_for(self, contribution_type: ContributionType) -> float:
         if contribution_type is ContributionType.CORE_RESEARCH:
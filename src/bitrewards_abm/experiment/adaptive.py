@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+from statistics import NormalDist, fmean, stdev
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from bitrewards_abm.experiment.config import AdaptiveReplication
+
+
+def t_quantile(probability: float, degrees_of_freedom: int) -> float:
+    """Student t quantile: exact for one and two degrees of freedom, Cornish-Fisher expansion above."""
+    if degrees_of_freedom < 1:
+        return math.nan
+    if degrees_of_freedom == 1:
+        return math.tan(math.pi * (probability - 0.5))
+    if degrees_of_freedom == 2:
+        return (2.0 * probability - 1.0) / math.sqrt(2.0 * probability * (1.0 - probability))
+    z = NormalDist().inv_cdf(probability)
+    v = float(degrees_of_freedom)
+    g1 = (z**3 + z) / 4.0
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96.0
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384.0
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160.0
+    return z + g1 / v + g2 / v**2 + g3 / v**3 + g4 / v**4
+
+
+def confidence_half_width(values: Sequence[float], confidence: float) -> float:
+    """Half-width of the two-sided t interval for the mean of ``values``; NaN below two values."""
+    if len(values) < 2:
+        return math.nan
+    return t_quantile(0.5 + confidence / 2.0, len(values) - 1) * stdev(values) / math.sqrt(len(values))
+
+
+class AdaptiveScheduler:
+    """Decide how many replications each sweep point gets from the precision reached so far.
+
+    Work proceeds in rounds. ``next_round`` returns the ``(point, rep)`` slots
+    to run; once their summaries have been passed to ``record`` it is called
+    again. Every point first gets ``min_reps`` reps. After that a point stops
+    when the t-interval half-width of every metric is at or below its target,
+    or at ``max_reps``. Otherwise the classic sample-size estimate
+    ``(t * s / target) ** 2`` gives the reps it still needs, and the round
+    schedules half of that deficit (at least one unit). The estimate is noisy
+    with few reps, so closing the gap in halves avoids overshooting and keeps
+    the total number of runs close to the minimum.
+
+    With ``rep_step = 2`` (antithetic pairs) reps are scheduled in pairs and
+    each pair's mean is one observation.
+    """
+
+    def __init__(self, settings: AdaptiveReplication, point_count: int, rep_step: int = 1) -> None:
+        self.settings = settings
+        self.rep_step = rep_step
+        self._scheduled = [0] * point_count
+        self._values: List[Dict[int, Dict[str, float]]] = [{} for _ in range(point_count)]
+
+    @property
+    def point_count(self) -> int:
+        return len(self._scheduled)
+
+    def reps(self, point: int) -> int:
+        return self._scheduled[point]
+
+    def record(self, point: int, rep: int, summary: Mapping[str, Any]) -> None:
+        self._values[point][rep] = {metric: float(summary[metric]) for metric in self.settings.metrics}
+
+    def _units(self, point: int, metric: str) -> List[float]:
+        values = self._values[point]
+        units: List[float] = []
+        for first in range(0, self._scheduled[point], self.rep_step):
+            members = [values[rep][metric] for rep in range(first, first + self.rep_step) if rep in values]
+            if len(members) == self.rep_step:
+                units.append(fmean(members))
+        return units
+
+    def half_widths(self, point: int) -> Dict[str, float]:
+        return {
+            metric: confidence_half_width(self._units(point, metric), self.settings.confidence)
+            for metric in self.settings.metrics
+        }
+
+    def converged(self, point: int) -> bool:
+        # NaN half-widths compare False, so such points run until max_reps.
+        return all(
+            width <= self.settings.target_half_width[metric] for metric, width in self.half_widths(point).items()
+        )
+
+    def _reps_needed(self, point: int) -> int:
+        needed_units = 0
+        for metric in self.settings.metrics:
+            units = self._units(point, metric)
+            target = self.settings.target_half_width[metric]
+            spread = stdev(units) if len(units) > 1 else math.nan
+            if target <= 0.0 or math.isnan(spread):
+                return self.settings.max_reps
+            t = t_quantile(0.5 + self.settings.confidence / 2.0, len(units) - 1)
+            needed_units = max(needed_units, math.ceil((t * spread / target) ** 2))
+        return needed_units * self.rep_step
+
+    def next_round(self) -> List[Tuple[int, int]]:
+        slots: List[Tuple[int, int]] = []
+        for point in range(self.point_count):
+            scheduled = self._scheduled[point]
+            if scheduled < self.settings.min_reps:
+                target_reps = self.settings.min_reps
+            elif scheduled >= self.settings.max_reps or self.converged(point):
+                continue
+            else:
+                deficit_units = (min(self._reps_needed(point), self.settings.max_reps) - scheduled) / self.rep_step
+                target_reps = scheduled + max(1, math.ceil(deficit_units / 2.0)) * self.rep_step
+            target_reps = min(target_reps, self.settings.max_reps)
+            slots.extend((point, rep) for rep in range(scheduled, target_reps))
+            self._scheduled[point] = target_reps
+        return slots
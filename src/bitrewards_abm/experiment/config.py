@@ -7,6 +7,15 @@ from typing import Dict, List, Tuple
 from bitrewards_abm.domain.parameters import SimulationParameters
 
 
+@dataclass
+class AdaptiveReplication:
+    metrics: List[str]
+    target_half_width: Dict[str, float]
+    confidence: float = 0.95
+    min_reps: int = 4
+    max_reps: int = 64
+
+
 @dataclass
 class ExperimentConfig:
     name: str
@@ -14,6 +23,9 @@ class ExperimentConfig:
     steps_per_run: int | None
     random_seed_base: int | None
     sweeps: Dict[str, List[object]]
+    common_random_numbers: bool = False
+    antithetic_pairs: bool = False
+    adaptive: AdaptiveReplication | None = None
 
 
 def _load_toml(path: Path) -> dict:
@@ -33,6 +45,37 @@ def _build_simulation_parameters(config_data: dict) -> SimulationParameters:
     return SimulationParameters(**init_kwargs)
 
 
+def _build_adaptive_replication(adaptive_section: dict, antithetic_pairs: bool) -> AdaptiveReplication:
+    metrics = list(adaptive_section.get("metrics", ["investor_mean_roi", "creator_wealth_gini"]))
+    target_raw = adaptive_section.get("target_half_width")
+    if target_raw is None:
+        raise ValueError("[experiment.adaptive] needs target_half_width")
+    if isinstance(target_raw, dict):
+        missing = [metric for metric in metrics if metric not in target_raw]
+        if missing:
+            raise ValueError(f"[experiment.adaptive] target_half_width has no value for {missing}")
+        target_half_width = {metric: float(target_raw[metric]) for metric in metrics}
+    else:
+        target_half_width = {metric: float(target_raw) for metric in metrics}
+    adaptive = AdaptiveReplication(
+        metrics=metrics,
+        target_half_width=target_half_width,
+        confidence=float(adaptive_section.get("confidence", 0.95)),
+        min_reps=int(adaptive_section.get("min_reps", 4)),
+        max_reps=int(adaptive_section.get("max_reps", 64)),
+    )
+    rep_step = 2 if antithetic_pairs else 1
+    if adaptive.min_reps < 3 * rep_step:
+        raise ValueError(f"[experiment.adaptive] min_reps must be at least {3 * rep_step}")
+    if adaptive.max_reps < adaptive.min_reps:
+        raise ValueError("[experiment.adaptive] max_reps must not be below min_reps")
+    if antithetic_pairs and (adaptive.min_reps % 2 or adaptive.max_reps % 2):
+        raise ValueError("[experiment.adaptive] min_reps and max_reps must be even with antithetic_pairs")
+    if not 0.0 < adaptive.confidence < 1.0:
+        raise ValueError("[experiment.adaptive] confidence must be between 0 and 1")
+    return adaptive
+
+
 def _build_experiment_config(config_data: dict, config_path: Path) -> ExperimentConfig:
     experiment_section = config_data.get("experiment", {})
 
@@ -62,12 +105,24 @@ def _build_experiment_config(config_data: dict, config_path: Path) -> Experiment
         else:
             sweeps[key] = [value]
 
+    common_random_numbers_value = bool(experiment_section.get("common_random_numbers", False))
+    antithetic_pairs_value = bool(experiment_section.get("antithetic_pairs", False))
+    adaptive_section = experiment_section.get("adaptive")
+    adaptive_value = (
+        _build_adaptive_replication(adaptive_section, antithetic_pairs_value) if adaptive_section is not None else None
+    )
+    if antithetic_pairs_value and adaptive_value is None and runs_per_config_value % 2:
+        raise ValueError("antithetic_pairs needs an even runs_per_config")
+
     return ExperimentConfig(
         name=name_value,
         runs_per_config=runs_per_config_value,
         steps_per_run=steps_per_run_value,
         random_seed_base=random_seed_base_value,
         sweeps=sweeps,
+        common_random_numbers=common_random_numbers_value,
+        antithetic_pairs=antithetic_pairs_value,
+        adaptive=adaptive_value,
     )
 
 
@@ -77,4 +132,7 @@ def load_experiment_configuration(config_path: Path) -> Tuple[SimulationParamete
     experiment_config = _build_experiment_config(data, config_path)
     if experiment_config.steps_per_run is not None:
         simulation_parameters.max_steps = experiment_config.steps_per_run
+    uses_paired_streams = experiment_config.common_random_numbers or experiment_config.antithetic_pairs
+    if uses_paired_streams and "rng_streams" not in data.get("simulation", {}):
+        simulation_parameters.rng_streams = "per_subsystem"
     return simulation_parameters, experiment_config
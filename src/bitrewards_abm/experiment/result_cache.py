@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+import uuid
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from bitrewards_abm.domain.parameters import SimulationParameters
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+FINGERPRINT_DEPENDENCIES = ("mesa", "numpy", "pandas", "networkx")
+
+
+@lru_cache(maxsize=1)
+def code_fingerprint() -> str:
+    """Hash of every module in ``bitrewards_abm`` plus the interpreter and key dependency versions."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_ROOT.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    digest.update(f"python {sys.version_info.major}.{sys.version_info.minor}".encode())
+    for name in FINGERPRINT_DEPENDENCIES:
+        try:
+            version = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{name} {version}".encode())
+    return digest.hexdigest()
+
+
+def _resolved_parameters(parameters: SimulationParameters) -> str:
+    return json.dumps(dataclasses.asdict(parameters), sort_keys=True, default=str)
+
+
+def parameters_fingerprint(parameters: SimulationParameters) -> str:
+    """Hash of the fully resolved parameters alone, without the code fingerprint."""
+    return hashlib.sha256(_resolved_parameters(parameters).encode()).hexdigest()
+
+
+def run_cache_key(parameters: SimulationParameters, seed: int | None, fingerprint: str | None = None) -> str:
+    resolved = _resolved_parameters(parameters)
+    payload = json.dumps(
+        {"parameters": resolved, "seed": seed, "code": fingerprint or code_fingerprint()},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of run outputs addressed by ``run_cache_key``.
+
+    Entries are pickles named after their key, written under a temporary name
+    and renamed into place so concurrent workers can share one directory.
+    A hit refreshes the entry's modification time, which ``evict`` treats as
+    its last use: entries unused for ``max_age_seconds`` go first, then the
+    least recently used until the cache fits in ``max_bytes``. Unreadable
+    entries count as misses and are overwritten by the next ``put``.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        path = self._entry_path(key)
+        try:
+            with path.open("rb") as entry:
+                value = pickle.load(entry)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        with temporary.open("wb") as entry:
+            pickle.dump(value, entry, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(
+        self,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+        now: float | None = None,
+    ) -> int:
+        """Remove stale and least recently used entries; returns how many were removed."""
+        now = time.time() if now is None else now
+        entries = sorted(self._entries())
+        removed = 0
+        kept: List[Tuple[float, int, Path]] = []
+        for last_used, size, path in entries:
+            if max_age_seconds is not None and now - last_used > max_age_seconds:
+                removed += self._remove(path)
+            else:
+                kept.append((last_used, size, path))
+        if max_bytes is not None:
+            total = sum(size for _, size, _ in kept)
+            for _, size, path in kept:
+                if total <= max_bytes:
+                    break
+                removed += self._remove(path)
+                total -= size
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> int:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        return 1
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+def publish_text(path: Path, content: str) -> None:
+    """Write ``content`` under a temporary name and rename it into place."""
+    temporary = path.with_name(f".{path.name}.{socket.gethostname()}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    temporary.write_text(content)
+    os.replace(temporary, path)
+
+
+def concatenate_csv_shards(shard_paths: Iterable[Path], output_path: Path) -> None:
+    """Byte-concatenate CSV shards that share a header, keeping the first header only."""
+    with output_path.open("w", newline="") as output:
+        for index, shard_path in enumerate(shard_paths):
+            with shard_path.open(newline="") as shard:
+                header = shard.readline()
+                if index == 0:
+                    output.write(header)
+                shutil.copyfileobj(shard, output)
+
+
+def run_key(parameter_overrides: Dict[str, object], rep: int, seed: int | None, parameters_hash: str) -> str:
+    """Manifest key of a run; ``parameters_hash`` covers the fully resolved parameters."""
+    return json.dumps(
+        {"overrides": parameter_overrides, "rep": rep, "seed": seed, "parameters": parameters_hash},
+        sort_keys=True,
+    )
+
+
+class RunShardStore:
+    """Per-run CSV shards plus an append-only manifest of completed runs.
+
+    ``record`` publishes a run's ``timeseries`` and ``summary`` shards and only
+    then appends a manifest line keyed by ``(sweep point, rep, seed)`` and a
+    hash of the resolved parameters, so a manifest entry always points at
+    complete shards and an edited config never matches an old entry. The manifest is fsynced
+    after each line; a line cut short by a crash is ignored when read back.
+    """
+
+    manifest_name = "manifest.jsonl"
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.manifest_path = self.root / self.manifest_name
+
+    def reset(self) -> None:
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def shard_path(self, run_id: int, name: str) -> Path:
+        return self.root / f"run_{run_id:06d}.{name}.csv"
+
+    def completed(self) -> Dict[str, Dict[str, object]]:
+        entries: Dict[str, Dict[str, object]] = {}
+        if not self.manifest_path.exists():
+            return entries
+        with self.manifest_path.open() as manifest:
+            for line in manifest:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                run_id = int(entry["run_id"])
+                if all(self.shard_path(run_id, name).exists() for name in entry["shards"]):
+                    entries[entry["key"]] = entry
+        return entries
+
+    def record(self, run_id: int, key: str, shards: Dict[str, str]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        for name, content in shards.items():
+            publish_text(self.shard_path(run_id, name), content)
+        line = json.dumps({"key": key, "run_id": run_id, "shards": sorted(shards)}) + "\n"
+        if not self._manifest_ends_cleanly():
+            line = "\n" + line
+        with self.manifest_path.open("a") as manifest:
+            manifest.write(line)
+            manifest.flush()
+            os.fsync(manifest.fileno())
+
+    def _manifest_ends_cleanly(self) -> bool:
+        try:
+            with self.manifest_path.open("rb") as manifest:
+                manifest.seek(-1, os.SEEK_END)
+                return manifest.read(1) == b"\n"
+        except OSError:
+            # Missing or empty manifest.
+            return True
+
+    def concatenate(self, name: str, run_ids: List[int], output_path: Path) -> None:
+        concatenate_csv_shards((self.shard_path(run_id, name) for run_id in run_ids), output_path)
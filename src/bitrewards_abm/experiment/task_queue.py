@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+from bitrewards_abm.experiment.shards import publish_text
+
+
+class ClaimedTask(NamedTuple):
+    task_id: str
+    payload: Dict[str, Any]
+    claim_path: Path
+
+
+class FileTaskQueue:
+    """Task queue held in a directory that several machines can share.
+
+    A task is a JSON file under ``pending/``. A worker claims it by renaming it
+    into ``claimed/``: rename is atomic, so exactly one worker wins. While the
+    task runs, the worker touches the claimed file as a heartbeat. A claim whose
+    heartbeat is older than ``stale_after`` seconds belongs to a worker that
+    died and is renamed back to ``pending/`` by whichever worker notices first.
+    Results are written to ``results/`` under a temporary name and renamed into
+    place, so readers never see a partial shard. ``complete`` then moves the
+    task file to ``done/``. Tasks are expected to be deterministic, so a task
+    that is reclaimed while its first worker is only slow produces the same
+    shard twice.
+    """
+
+    def __init__(self, root: str | Path, stale_after: float = 600.0) -> None:
+        self.root = Path(root)
+        self.stale_after = stale_after
+        self.pending_dir = self.root / "pending"
+        self.claimed_dir = self.root / "claimed"
+        self.done_dir = self.root / "done"
+        self.results_dir = self.root / "results"
+
+    @classmethod
+    def create(
+        cls,
+        root: str | Path,
+        tasks: Dict[str, Dict[str, object]],
+        attachments: Dict[str, str] | None = None,
+        stale_after: float = 600.0,
+    ) -> FileTaskQueue:
+        """Lay out the queue directory; ``attachments`` (such as the config) are written before any task."""
+        queue = cls(root, stale_after=stale_after)
+        for directory in (queue.pending_dir, queue.claimed_dir, queue.done_dir, queue.results_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        for name, content in (attachments or {}).items():
+            queue._publish(queue.root / name, content)
+        for task_id, payload in tasks.items():
+            queue._publish(queue.pending_dir / f"{task_id}.json", json.dumps(payload))
+        return queue
+
+    def task_ids(self, state: str) -> List[str]:
+        directory = {"pending": self.pending_dir, "claimed": self.claimed_dir, "done": self.done_dir}[state]
+        return sorted(path.stem for path in directory.glob("*.json"))
+
+    def claim(self) -> ClaimedTask | None:
+        """Claim the first pending task, or return ``None`` if none is left."""
+        for path in sorted(self.pending_dir.glob("*.json")):
+            claim_path = self.claimed_dir / path.name
+            try:
+                # Refresh the timestamp first so the claim never looks stale.
+                os.utime(path)
+                os.rename(path, claim_path)
+            except FileNotFoundError:
+                continue
+            os.utime(claim_path)
+            return ClaimedTask(path.stem, json.loads(claim_path.read_text()), claim_path)
+        return None
+
+    def heartbeat(self, task: ClaimedTask) -> None:
+        try:
+            os.utime(task.claim_path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def keep_alive(self, task: ClaimedTask) -> Iterator[None]:
+        """Touch the claim every third of ``stale_after`` while the body runs."""
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(self.stale_after / 3.0):
+                self.heartbeat(task)
+
+        thread = threading.Thread(target=beat, name=f"heartbeat-{task.task_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, task: ClaimedTask) -> None:
+        try:
+            os.rename(task.claim_path, self.done_dir / task.claim_path.name)
+        except FileNotFoundError:
+            # Reclaimed as stale while we ran; the shard we wrote is still valid.
+            pass
+
+    def reclaim_stale(self, now: float | None = None) -> List[str]:
+        now = time.time() if now is None else now
+        reclaimed: List[str] = []
+        for path in sorted(self.claimed_dir.glob("*.json")):
+            try:
+                age = now - path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age < self.stale_after:
+                continue
+            try:
+                os.rename(path, self.pending_dir / path.name)
+            except FileNotFoundError:
+                continue
+            reclaimed.append(path.stem)
+        return reclaimed
+
+    def is_finished(self) -> bool:
+        return not any(self.pending_dir.glob("*.json")) and not any(self.claimed_dir.glob("*.json"))
+
+    def result_path(self, task_id: str, name: str) -> Path:
+        return self.results_dir / f"{task_id}.{name}"
+
+    def write_result(self, task_id: str, name: str, content: str) -> Path:
+        path = self.result_path(task_id, name)
+        self._publish(path, content)
+        return path
+
+    def _publish(self, path: Path, content: str) -> None:
+        publish_text(path, content)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Sequence
+
+import pandas as pd
+
+
+REPORT_METRICS = (
+    "total_income_creators",
+    "total_income_investors",
+    "total_income_users",
+    "creator_wealth_gini",
+    "investor_mean_roi",
+    "treasury_balance",
+    "contribution_count",
+)
+
+
+def _point_label(sweep_keys: Sequence[str], values: object) -> str:
+    if not isinstance(values, tuple):
+        values = (values,)
+    return ", ".join(f"{key}={value}" for key, value in zip(sweep_keys, values))
+
+
+def paired_difference_report(
+    run_summary: pd.DataFrame,
+    sweep_keys: Sequence[str],
+    metrics: Sequence[str] = REPORT_METRICS,
+    antithetic_pairs: bool = False,
+) -> pd.DataFrame:
+    """Compare every sweep point with the first one on paired replicate differences.
+
+    Replicates are paired across points by ``rep`` (by ``rep // 2`` with
+    ``antithetic_pairs``, averaging each antithetic pair into one unit), which
+    is what common random numbers make meaningful. For each metric and point
+    the report gives the mean difference from the baseline point, its standard
+    error from the paired differences, the standard error independent
+    sampling would give with the same runs (from the per-run variance at both
+    points), and ``variance_reduction = 1 - paired / independent`` variance.
+    """
+    columns = [
+        "metric",
+        "comparison",
+        "units",
+        "mean_difference",
+        "std_error",
+        "independent_std_error",
+        "variance_reduction",
+    ]
+    keys = list(sweep_keys)
+    available = [metric for metric in metrics if metric in run_summary]
+    if not keys or not available:
+        return pd.DataFrame(columns=columns)
+    frame = run_summary.assign(_unit=run_summary["rep"] // 2 if antithetic_pairs else run_summary["rep"])
+    groups = list(frame.groupby(keys, sort=False))
+    if len(groups) < 2:
+        return pd.DataFrame(columns=columns)
+    (baseline_values, baseline), *others = groups
+    baseline_label = _point_label(keys, baseline_values)
+    rows: List[Dict[str, object]] = []
+    for metric in available:
+        baseline_units = baseline.groupby("_unit")[metric].mean()
+        for values, point in others:
+            point_units = point.groupby("_unit")[metric].mean()
+            differences = (point_units - baseline_units).dropna()
+            units = len(differences)
+            paired_variance = differences.var(ddof=1) / units if units > 1 else math.nan
+            independent_variance = (
+                point[metric].var(ddof=1) / len(point) + baseline[metric].var(ddof=1) / len(baseline)
+            )
+            if independent_variance > 0.0 and not math.isnan(paired_variance):
+                reduction = 1.0 - paired_variance / independent_variance
+            else:
+                reduction = math.nan
+            rows.append(
+                {
+                    "metric": metric,
+                    "comparison": f"{_point_label(keys, values)} vs {baseline_label}",
+                    "units": units,
+                    "mean_difference": float(differences.mean()) if units else math.nan,
+                    "std_error": math.sqrt(paired_variance) if not math.isnan(paired_variance) else math.nan,
+                    "independent_std_error": math.sqrt(independent_variance)
+                    if not math.isnan(independent_variance)
+                    else math.nan,
+                    "variance_reduction": reduction,
+                }
+            )
+    return pd.DataFrame(rows, columns=columns)
@@ -1,19 +1,63 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, List, Mapping, Set, Tuple
 
 import networkx as nx
 
 
-class ContributionGraph:
+ParentEdge = Tuple[str, float, str]
+ShareVector = Tuple[Tuple[str, float], ...]
+ShareCacheKey = Tuple[str, str, float]
+RoutingEdge = Tuple[str, float, bool]
+
+GRAPH_BACKENDS = ("networkx", "array")
+
+
+class BaseContributionGraph(ABC):
+    """Royalty traversal shared by every graph backend.
+
+    Backends only provide storage primitives; ``_parent_edges`` must return a
+    node's incoming edges as ``(parent_id, split, edge_type)`` in insertion order
+    so all backends walk the DAG identically.
+
+    Resolved share distributions (single-path chains and proportional ancestor
+    splits) are memoized per root as normalized ``(recipient, fraction)``
+    vectors. Each cached entry is registered against every node its walk
+    visited, and a new parent edge on any of those nodes evicts exactly the
+    entries that depended on it.
+    """
+
     def __init__(self) -> None:
-        self.graph = nx.DiGraph()
+        self._share_cache: Dict[ShareCacheKey, Tuple[ShareVector, Tuple[str, ...]]] = {}
+        self._cache_dependents: Dict[str, Set[ShareCacheKey]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
+    @abstractmethod
     def add_contribution_node(self, contribution_id: str) -> None:
-        self.graph.add_node(contribution_id)
+        ...
+
+    @abstractmethod
+    def _store_edge(self, parent_id: str, child_id: str, split_fraction: float, edge_type: str) -> None:
+        ...
 
     def add_parent_child_edge(self, parent_id: str, child_id: str, split_fraction: float, edge_type: str = "derivative") -> None:
-        self.graph.add_edge(parent_id, child_id, split=split_fraction, edge_type=edge_type)
+        self._store_edge(parent_id, child_id, split_fraction, edge_type)
+        self._invalidate_cached_shares(child_id)
+
+    @abstractmethod
+    def contribution_exists(self, contribution_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def _parent_edges(self, contribution_id: str) -> List[ParentEdge]:
+        ...
+
+    @abstractmethod
+    def to_networkx(self) -> nx.DiGraph:
+        ...
 
     def add_royalty_edge(self, parent_identifier: str, child_identifier: str, royalty_percent: float, edge_type: str = "derivative") -> None:
         self.add_parent_child_edge(
@@ -23,31 +67,23 @@ class ContributionGraph:
             edge_type=edge_type,
         )
 
-    def contribution_exists(self, contribution_id: str) -> bool:
-        return contribution_id in self.graph.nodes
-
     def parent_count(self, contribution_id: str) -> int:
-        if contribution_id not in self.graph.nodes:
-            return 0
-        return len(list(self.graph.predecessors(contribution_id)))
+        return len(self._parent_edges(contribution_id))
 
     def get_parents(self, contribution_id: str) -> List[str]:
-        if contribution_id not in self.graph.nodes:
-            return []
-        return list(self.graph.predecessors(contribution_id))
+        return [parent for parent, _, _ in self._parent_edges(contribution_id)]
 
     def get_split_fraction(self, parent_id: str, child_id: str) -> float:
-        if not self.graph.has_edge(parent_id, child_id):
-            return 0.0
-        attributes = self.graph[parent_id][child_id]
-        value = attributes.get("split", 0.0)
-        return float(value)
+        for parent, split, _ in self._parent_edges(child_id):
+            if parent == parent_id:
+                return split
+        return 0.0
 
     def get_edge_type(self, parent_id: str, child_id: str) -> str:
-        if not self.graph.has_edge(parent_id, child_id):
-            return "other"
-        attributes = self.graph[parent_id][child_id]
-        return str(attributes.get("edge_type", "other"))
+        for parent, _, edge_type in self._parent_edges(child_id):
+            if parent == parent_id:
+                return edge_type
+        return "other"
 
     def compute_royalty_shares(
         self,
@@ -58,79 +94,343 @@ class ContributionGraph:
         keep_fraction: float = 0.0,
     ) -> Dict[str, float]:
         root_id = root_identifier if root_identifier is not None else start_id
-        if total_value <= 0.0 or root_id is None or root_id not in self.graph.nodes:
+        if total_value <= 0.0 or root_id is None or not self.contribution_exists(root_id):
             return {}
         if mode == "proportional_50_50":
-            return self._compute_proportional_shares(root_id, total_value, keep_fraction)
-        return self._compute_single_path_shares(root_id, total_value)
+            key = (root_id, mode, max(0.0, min(1.0, keep_fraction)))
+        else:
+            key = (root_id, "single_path", 0.0)
+        vector = self._cached_share_vector(key)
+        return {recipient: total_value * fraction for recipient, fraction in vector}
 
-    def _compute_single_path_shares(self, root_id: str, total_value: float) -> Dict[str, float]:
+    def cache_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "entries": len(self._share_cache),
+        }
+
+    def _cached_share_vector(self, key: ShareCacheKey) -> ShareVector:
+        entry = self._share_cache.get(key)
+        if entry is not None:
+            self.cache_hits += 1
+            return entry[0]
+        self.cache_misses += 1
+        root_id, mode, keep_fraction = key
+        visited: Set[str] = set()
+        if mode == "proportional_50_50":
+            shares = self._compute_proportional_shares(root_id, 1.0, keep_fraction, visited)
+        else:
+            shares = self._compute_single_path_shares(root_id, 1.0, visited)
+        vector = tuple(shares.items())
+        dependencies = tuple(visited)
+        self._share_cache[key] = (vector, dependencies)
+        for node_id in dependencies:
+            self._cache_dependents.setdefault(node_id, set()).add(key)
+        return vector
+
+    def _invalidate_cached_shares(self, node_id: str) -> None:
+        keys = self._cache_dependents.pop(node_id, None)
+        if not keys:
+            return
+        for key in keys:
+            entry = self._share_cache.pop(key, None)
+            if entry is None:
+                continue
+            for dependency in entry[1]:
+                if dependency == node_id:
+                    continue
+                dependents = self._cache_dependents.get(dependency)
+                if dependents is not None:
+                    dependents.discard(key)
+                    if not dependents:
+                        del self._cache_dependents[dependency]
+
+    def settle_royalty_pools(
+        self,
+        pools: Mapping[str, float],
+        mode: str = "single_path",
+        keep_fraction: float = 0.0,
+    ) -> Dict[str, float]:
+        """Push many accrued pools upstream at once and return aggregated credits.
+
+        All pools share one topological sweep over the union of their ancestors,
+        so settling costs O(nodes + edges) instead of one traversal per root.
+        Per recipient the result equals summing ``compute_royalty_shares`` over
+        every pool, up to floating-point reassociation.
+        """
+        roots = self._settleable_roots(pools)
+        if not roots:
+            return {}
+        proportional = mode == "proportional_50_50"
+        routes: Dict[str, List[RoutingEdge]] = {}
+        order = self._upstream_topological_order(roots, routes, proportional)
+        pending: Dict[str, float] = {}
+        for root_id in roots:
+            pending[root_id] = pending.get(root_id, 0.0) + pools[root_id]
+        keep = max(0.0, min(1.0, keep_fraction))
+        return self._sweep_pools(order, routes, pending, proportional, keep)
+
+    def settle_royalty_pools_by_source(
+        self,
+        pools: Mapping[str, float],
+        mode: str = "single_path",
+        keep_fraction: float = 0.0,
+    ) -> Dict[str, Dict[str, float]]:
+        """Like ``settle_royalty_pools``, but keep each pool's credits apart.
+
+        Returns ``{root_id: {recipient: amount}}`` in pool order, each inner
+        mapping equal to ``compute_royalty_shares`` for that root. The pools
+        still share one topological sweep and one read of the graph; a node
+        carries one running amount per root whose pool reaches it.
+        """
+        roots = self._settleable_roots(pools)
+        if not roots:
+            return {}
+        proportional = mode == "proportional_50_50"
+        routes: Dict[str, List[RoutingEdge]] = {}
+        order = self._upstream_topological_order(roots, routes, proportional)
+        pending: Dict[str, Dict[str, float]] = {}
+        credits: Dict[str, Dict[str, float]] = {}
+        for root_id in roots:
+            pending.setdefault(root_id, {})[root_id] = pools[root_id]
+            credits[root_id] = {}
+        keep = max(0.0, min(1.0, keep_fraction))
+        for current_id in order:
+            sourced = pending.pop(current_id, None)
+            if not sourced:
+                continue
+            for root_id, pool_value in sourced.items():
+                if pool_value <= 0.0:
+                    continue
+                shares = credits[root_id]
+                for target_id, amount, settled in self._route_pool(
+                    current_id, pool_value, routes[current_id], proportional, keep
+                ):
+                    if settled:
+                        shares[target_id] = shares.get(target_id, 0.0) + amount
+                    else:
+                        upstream = pending.setdefault(target_id, {})
+                        upstream[root_id] = upstream.get(root_id, 0.0) + amount
+        return credits
+
+    def _settleable_roots(self, pools: Mapping[str, float]) -> List[str]:
+        return [root_id for root_id, value in pools.items() if value > 0.0 and self.contribution_exists(root_id)]
+
+    def _compute_single_path_shares(
+        self,
+        root_id: str,
+        total_value: float,
+        visited: Set[str] | None = None,
+    ) -> Dict[str, float]:
         shares: Dict[str, float] = {}
         current_id = root_id
         pool_value = total_value
-        visited = set()
+        if visited is None:
+            visited = set()
         while pool_value > 0.0 and current_id not in visited:
             visited.add(current_id)
-            parents = self.get_parents(current_id)
-            if not parents:
+            route = self._routing_edges(current_id, proportional=False)
+            if not route:
                 shares[current_id] = shares.get(current_id, 0.0) + pool_value
                 break
-            parent_splits = [(parent, self.get_split_fraction(parent, current_id)) for parent in parents]
-            funding_parents = [
-                pair for pair in parent_splits if self.get_edge_type(pair[0], current_id) == "funding"
-            ]
-            if funding_parents:
-                funding_parents.sort(key=lambda x: (-x[1], x[0]))
-                selected_parent, selected_split = funding_parents[0]
-            else:
-                parent_splits.sort(key=lambda x: (-x[1], x[0]))
-                selected_parent, selected_split = parent_splits[0]
-            split = max(0.0, min(1.0, selected_split))
+            selected_parent, split, selected_is_funding = route[0]
             own_share = pool_value * (1.0 - split)
             if own_share > 0.0:
                 shares[current_id] = shares.get(current_id, 0.0) + own_share
             parent_share = pool_value * split
             if parent_share <= 0.0 or selected_parent is None:
                 break
-            if self.get_edge_type(selected_parent, current_id) == "funding":
+            if selected_is_funding:
                 shares[selected_parent] = shares.get(selected_parent, 0.0) + parent_share
                 break
             pool_value = parent_share
             current_id = selected_parent
         return shares
 
-    def _compute_proportional_shares(self, root_id: str, total_value: float, keep_fraction: float) -> Dict[str, float]:
-        shares: Dict[str, float] = {}
+    def _compute_proportional_shares(
+        self,
+        root_id: str,
+        total_value: float,
+        keep_fraction: float,
+        visited: Set[str] | None = None,
+    ) -> Dict[str, float]:
+        # Pools merge at each node before moving upstream, so every ancestor and
+        # edge is processed once per distribution no matter how many paths reach it.
+        if not self.contribution_exists(root_id):
+            return {}
+        routes: Dict[str, List[RoutingEdge]] = {}
+        order = self._upstream_topological_order([root_id], routes, proportional=True)
+        if visited is not None:
+            visited.update(order)
         keep = max(0.0, min(1.0, keep_fraction))
-        remaining: List[tuple[str, float]] = [(root_id, total_value)]
-        while remaining:
-            current_id, pool_value = remaining.pop()
-            if pool_value <= 0.0 or current_id not in self.graph.nodes:
-                continue
-            parents = self.get_parents(current_id)
-            keep_amount = pool_value * keep
-            upstream_pool = pool_value - keep_amount
-            shares[current_id] = shares.get(current_id, 0.0) + keep_amount
-            if not parents:
-                if upstream_pool > 0.0:
-                    shares[current_id] = shares.get(current_id, 0.0) + upstream_pool
+        return self._sweep_pools(order, routes, {root_id: total_value}, True, keep)
+
+    def _routing_edges(self, contribution_id: str, proportional: bool) -> List[RoutingEdge]:
+        """Return the ``(parent, clipped split, terminal)`` edges a pool leaves ``contribution_id`` by.
+
+        Proportional mode routes along every parent edge. Single-path mode keeps
+        only the selected parent (funding edges first, then highest split, then
+        lowest id); a funding parent is terminal and is credited without
+        forwarding the pool any further.
+        """
+        edges = self._parent_edges(contribution_id)
+        if proportional:
+            return [(parent, max(0.0, min(1.0, split)), False) for parent, split, _ in edges]
+        if not edges:
+            return []
+        funding_parents = [(parent, split) for parent, split, edge_type in edges if edge_type == "funding"]
+        selected_is_funding = bool(funding_parents)
+        if funding_parents:
+            funding_parents.sort(key=lambda x: (-x[1], x[0]))
+            selected_parent, selected_split = funding_parents[0]
+        else:
+            parent_splits = [(parent, split) for parent, split, _ in edges]
+            parent_splits.sort(key=lambda x: (-x[1], x[0]))
+            selected_parent, selected_split = parent_splits[0]
+        return [(selected_parent, max(0.0, min(1.0, selected_split)), selected_is_funding)]
+
+    def _upstream_topological_order(
+        self,
+        root_ids: List[str],
+        routes: Dict[str, List[RoutingEdge]],
+        proportional: bool,
+    ) -> List[str]:
+        """Order ``root_ids`` and the ancestors their pools reach so every node precedes its parents.
+
+        Fills ``routes`` with each visited node's routing edges so the sweep
+        does not read the graph a second time.
+        """
+        postorder: List[str] = []
+        for root_id in root_ids:
+            if root_id in routes:
                 continue
-            split_values = [self.get_split_fraction(parent, current_id) for parent in parents]
-            clipped = [max(0.0, min(1.0, value)) for value in split_values]
-            total_split = sum(clipped)
-            if total_split <= 0.0:
-                shares[current_id] = shares.get(current_id, 0.0) + upstream_pool
+            routes[root_id] = self._routing_edges(root_id, proportional)
+            stack: List[tuple[str, int]] = [(root_id, 0)]
+            while stack:
+                node_id, position = stack[-1]
+                route = routes[node_id]
+                if position < len(route):
+                    stack[-1] = (node_id, position + 1)
+                    parent_id, split, terminal = route[position]
+                    if split <= 0.0 or terminal or parent_id in routes:
+                        continue
+                    routes[parent_id] = self._routing_edges(parent_id, proportional)
+                    stack.append((parent_id, 0))
+                    continue
+                stack.pop()
+                postorder.append(node_id)
+        postorder.reverse()
+        return postorder
+
+    @staticmethod
+    def _route_pool(
+        current_id: str,
+        pool_value: float,
+        route: List[RoutingEdge],
+        proportional: bool,
+        keep: float,
+    ) -> List[Tuple[str, float, bool]]:
+        """Split the pool at ``current_id`` into ``(node, amount, settled)`` flows.
+
+        Settled flows are credited to ``node``; the rest join ``node``'s pool
+        further upstream.
+        """
+        if not proportional:
+            if not route:
+                return [(current_id, pool_value, True)]
+            parent_id, split, terminal = route[0]
+            flows: List[Tuple[str, float, bool]] = []
+            own_share = pool_value * (1.0 - split)
+            if own_share > 0.0:
+                flows.append((current_id, own_share, True))
+            parent_share = pool_value * split
+            if parent_share > 0.0:
+                flows.append((parent_id, parent_share, terminal))
+            return flows
+        keep_amount = pool_value * keep
+        upstream_pool = pool_value - keep_amount
+        flows = [(current_id, keep_amount, True)]
+        if not route:
+            if upstream_pool > 0.0:
+                flows.append((current_id, upstream_pool, True))
+            return flows
+        total_split = sum(split for _, split, _ in route)
+        if total_split <= 0.0:
+            flows.append((current_id, upstream_pool, True))
+            return flows
+        scale = 1.0 / total_split if total_split > 1.0 else 1.0
+        for parent_id, split, _ in route:
+            amount = upstream_pool * (split * scale if scale != 1.0 else split)
+            if amount > 0.0:
+                flows.append((parent_id, amount, False))
+        return flows
+
+    def _sweep_pools(
+        self,
+        order: List[str],
+        routes: Dict[str, List[RoutingEdge]],
+        pools: Dict[str, float],
+        proportional: bool,
+        keep: float,
+    ) -> Dict[str, float]:
+        shares: Dict[str, float] = {}
+        for current_id in order:
+            pool_value = pools.pop(current_id, 0.0)
+            if pool_value <= 0.0:
                 continue
-            if total_split > 1.0:
-                normalized = [value / total_split for value in clipped]
-            else:
-                normalized = clipped
-            for parent_id, fraction in zip(parents, normalized):
-                amount = upstream_pool * fraction
-                if amount > 0.0:
-                    remaining.append((parent_id, amount))
+            route = routes[current_id]
+            for target_id, amount, settled in self._route_pool(current_id, pool_value, route, proportional, keep):
+                target = shares if settled else pools
+                target[target_id] = target.get(target_id, 0.0) + amount
         return shares
 
+
+class ContributionGraph(BaseContributionGraph):
+    def __init__(self) -> None:
+        super().__init__()
+        self.graph = nx.DiGraph()
+
+    def add_contribution_node(self, contribution_id: str) -> None:
+        self.graph.add_node(contribution_id)
+
+    def _store_edge(self, parent_id: str, child_id: str, split_fraction: float, edge_type: str) -> None:
+        self.graph.add_edge(parent_id, child_id, split=split_fraction, edge_type=edge_type)
+
+    def contribution_exists(self, contribution_id: str) -> bool:
+        return contribution_id in self.graph.nodes
+
+    def parent_count(self, contribution_id: str) -> int:
+        if contribution_id not in self.graph.nodes:
+            return 0
+        return len(self.graph.pred[contribution_id])
+
+    def get_parents(self, contribution_id: str) -> List[str]:
+        if contribution_id not in self.graph.nodes:
+            return []
+        return list(self.graph.predecessors(contribution_id))
+
+    def get_split_fraction(self, parent_id: str, child_id: str) -> float:
+        if not self.graph.has_edge(parent_id, child_id):
+            return 0.0
+        attributes = self.graph[parent_id][child_id]
+        value = attributes.get("split", 0.0)
+        return float(value)
+
+    def get_edge_type(self, parent_id: str, child_id: str) -> str:
+        if not self.graph.has_edge(parent_id, child_id):
+            return "other"
+        attributes = self.graph[parent_id][child_id]
+        return str(attributes.get("edge_type", "other"))
+
+    def _parent_edges(self, contribution_id: str) -> List[ParentEdge]:
+        if contribution_id not in self.graph.nodes:
+            return []
+        return [
+            (parent, float(attributes.get("split", 0.0)), str(attributes.get("edge_type", "other")))
+            for parent, attributes in self.graph.pred[contribution_id].items()
+        ]
+
     def to_networkx(self) -> nx.DiGraph:
         graph_copy = nx.DiGraph()
         graph_copy.add_nodes_from(self.graph.nodes)
@@ -140,3 +440,112 @@ class ContributionGraph:
                 edge_data["royalty_percent"] = data.get("split")
             graph_copy.add_edge(parent, child, **edge_data)
         return graph_copy
+
+
+class ArrayContributionGraph(BaseContributionGraph):
+    """Graph backend storing nodes and edges in growable typed arrays.
+
+    Nodes get dense integer indexes; each node's incoming edges form a linked
+    list threaded through flat edge arrays, so traversal touches no per-edge
+    dicts. ``to_networkx`` builds a DiGraph on demand for analysis and plots.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self._first_edge = array("q")
+        self._last_edge = array("q")
+        self._edge_parent = array("q")
+        self._edge_child = array("q")
+        self._edge_split = array("d")
+        self._edge_type = array("B")
+        self._edge_next = array("q")
+        self._edge_slots: Dict[tuple[int, int], int] = {}
+        self._edge_type_names: List[str] = []
+        self._edge_type_codes: Dict[str, int] = {}
+
+    def _ensure_node(self, contribution_id: str) -> int:
+        index = self._node_index.get(contribution_id)
+        if index is not None:
+            return index
+        index = len(self._node_ids)
+        self._node_ids.append(contribution_id)
+        self._node_index[contribution_id] = index
+        self._first_edge.append(-1)
+        self._last_edge.append(-1)
+        return index
+
+    def _edge_type_code(self, edge_type: str) -> int:
+        code = self._edge_type_codes.get(edge_type)
+        if code is None:
+            code = len(self._edge_type_names)
+            self._edge_type_names.append(edge_type)
+            self._edge_type_codes[edge_type] = code
+        return code
+
+    def add_contribution_node(self, contribution_id: str) -> None:
+        self._ensure_node(contribution_id)
+
+    def _store_edge(self, parent_id: str, child_id: str, split_fraction: float, edge_type: str) -> None:
+        parent_index = self._ensure_node(parent_id)
+        child_index = self._ensure_node(child_id)
+        type_code = self._edge_type_code(edge_type)
+        slot = self._edge_slots.get((parent_index, child_index))
+        if slot is not None:
+            self._edge_split[slot] = split_fraction
+            self._edge_type[slot] = type_code
+            return
+        slot = len(self._edge_parent)
+        self._edge_parent.append(parent_index)
+        self._edge_child.append(child_index)
+        self._edge_split.append(split_fraction)
+        self._edge_type.append(type_code)
+        self._edge_next.append(-1)
+        self._edge_slots[(parent_index, child_index)] = slot
+        last = self._last_edge[child_index]
+        if last < 0:
+            self._first_edge[child_index] = slot
+        else:
+            self._edge_next[last] = slot
+        self._last_edge[child_index] = slot
+
+    def contribution_exists(self, contribution_id: str) -> bool:
+        return contribution_id in self._node_index
+
+    def _parent_edges(self, contribution_id: str) -> List[ParentEdge]:
+        index = self._node_index.get(contribution_id)
+        if index is None:
+            return []
+        edges: List[ParentEdge] = []
+        node_ids = self._node_ids
+        type_names = self._edge_type_names
+        slot = self._first_edge[index]
+        while slot >= 0:
+            edges.append(
+                (node_ids[self._edge_parent[slot]], self._edge_split[slot], type_names[self._edge_type[slot]])
+            )
+            slot = self._edge_next[slot]
+        return edges
+
+    def to_networkx(self) -> nx.DiGraph:
+        graph_copy = nx.DiGraph()
+        graph_copy.add_nodes_from(self._node_ids)
+        for slot in range(len(self._edge_parent)):
+            split = self._edge_split[slot]
+            graph_copy.add_edge(
+                self._node_ids[self._edge_parent[slot]],
+                self._node_ids[self._edge_child[slot]],
+                split=split,
+                edge_type=self._edge_type_names[self._edge_type[slot]],
+                royalty_percent=split,
+            )
+        return graph_copy
+
+
+def build_contribution_graph(backend: str = "networkx") -> BaseContributionGraph:
+    if backend == "array":
+        return ArrayContributionGraph()
+    if backend == "networkx":
+        return ContributionGraph()
+    raise ValueError(f"Unknown graph backend {backend!r}; expected one of {GRAPH_BACKENDS}")
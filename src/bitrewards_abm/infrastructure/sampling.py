@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Set
+
+
+class WeightedSampler:
+    """Keyed weighted-sampling index backed by a Fenwick tree.
+
+    Appends, weight updates and draws are O(log n). Used on its own, a draw
+    consumes exactly one ``rng.random()`` call and resolves it the same way
+    ``random.choices`` does (first key whose cumulative weight exceeds
+    ``u * total``), so it reproduces ``random.choices`` draw for draw. Inside a
+    :class:`BucketedSampler` the same value first picks a bucket, so bucketed
+    draws follow the same distribution but not the same key sequence.
+
+    Discarded keys leave a zero-weight slot behind until the ghosts outnumber the
+    live keys; the index is then rebuilt from the live keys in their original
+    order, which keeps every draw resolving to the same key.
+    """
+
+    compact_min_ghosts = 32
+
+    def __init__(self) -> None:
+        self._keys: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._weights: List[float] = []
+        self._tree: List[float] = [0.0]
+        self._top_bit = 0
+        self._ghosts: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._ghosts)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots and key not in self._ghosts
+
+    @property
+    def slot_count(self) -> int:
+        """Number of slots held, live keys and not yet compacted ghosts alike."""
+        return len(self._keys)
+
+    @property
+    def total(self) -> float:
+        return self._prefix_sum(len(self._weights))
+
+    def weight_of(self, key: str) -> float:
+        slot = self._slots.get(key)
+        if slot is None:
+            return 0.0
+        return self._weights[slot]
+
+    def add(self, key: str, weight: float) -> None:
+        if key in self._slots:
+            self.set_weight(key, weight)
+            return
+        value = max(0.0, weight)
+        self._slots[key] = len(self._keys)
+        self._keys.append(key)
+        self._weights.append(value)
+        index = len(self._weights)
+        node_value = value
+        child = index - 1
+        stop = index - (index & -index)
+        while child > stop:
+            node_value += self._tree[child]
+            child -= child & -child
+        self._tree.append(node_value)
+        self._top_bit = 1 << (index.bit_length() - 1)
+
+    def set_weight(self, key: str, weight: float) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            self.add(key, weight)
+            return
+        if self._ghosts:
+            self._ghosts.discard(key)
+        value = max(0.0, weight)
+        delta = value - self._weights[slot]
+        if delta == 0.0:
+            return
+        self._weights[slot] = value
+        index = slot + 1
+        size = len(self._weights)
+        while index <= size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def discard(self, key: str) -> None:
+        """Drop ``key`` from draws, compacting once ghost slots outnumber live keys."""
+        if key not in self._slots or key in self._ghosts:
+            return
+        self.set_weight(key, 0.0)
+        self._ghosts.add(key)
+        if len(self._ghosts) >= self.compact_min_ghosts and len(self._ghosts) > len(self):
+            self._compact()
+
+    def _compact(self) -> None:
+        live = [(key, weight) for key, weight in zip(self._keys, self._weights) if key not in self._ghosts]
+        self._keys = []
+        self._slots = {}
+        self._weights = []
+        self._tree = [0.0]
+        self._top_bit = 0
+        self._ghosts = set()
+        for key, weight in live:
+            self.add(key, weight)
+
+    def find(self, value: float) -> str | None:
+        """Return the first key whose cumulative weight exceeds ``value``."""
+        size = len(self._weights)
+        if size == 0:
+            return None
+        position = 0
+        remaining = value
+        bit = self._top_bit
+        tree = self._tree
+        while bit:
+            candidate = position + bit
+            if candidate <= size and tree[candidate] <= remaining:
+                position = candidate
+                remaining -= tree[candidate]
+            bit >>= 1
+        if position >= size:
+            position = size - 1
+        if self._weights[position] <= 0.0:
+            nearest = self._nearest_positive_slot(position)
+            if nearest is None:
+                return None
+            position = nearest
+        return self._keys[position]
+
+    def sample(self, rng: Random) -> str | None:
+        if not self._weights:
+            return None
+        total = self.total
+        if total <= 0.0:
+            return None
+        return self.find(rng.random() * total)
+
+    def _prefix_sum(self, index: int) -> float:
+        total = 0.0
+        tree = self._tree
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def _nearest_positive_slot(self, slot: int) -> int | None:
+        for candidate in range(slot + 1, len(self._weights)):
+            if self._weights[candidate] > 0.0:
+                return candidate
+        for candidate in range(slot - 1, -1, -1):
+            if self._weights[candidate] > 0.0:
+                return candidate
+        return None
+
+
+class BucketedSampler:
+    """Two-level sampler: keys live in labelled buckets, each with its own weighted index.
+
+    A draw scales every bucket's total by a caller-supplied multiplier, picks a
+    bucket and then a key inside it from a single ``rng.random()`` value, so draws
+    are distributionally equivalent to one flat ``random.choices`` over the scaled
+    weights but do not reproduce its stream. Changing the multipliers is free, and
+    moving a key between buckets is amortised O(log n).
+    """
+
+    def __init__(self, labels: Iterable[Hashable]) -> None:
+        self._buckets: Dict[Hashable, WeightedSampler] = {label: WeightedSampler() for label in labels}
+        self._bucket_of: Dict[str, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._bucket_of
+
+    def bucket_of(self, key: str) -> Hashable | None:
+        return self._bucket_of.get(key)
+
+    def weight_of(self, key: str) -> float:
+        label = self._bucket_of.get(key)
+        if label is None:
+            return 0.0
+        return self._buckets[label].weight_of(key)
+
+    def bucket_total(self, label: Hashable) -> float:
+        return self._buckets[label].total
+
+    def bucket_slots(self, label: Hashable) -> int:
+        return self._buckets[label].slot_count
+
+    def add(self, key: str, label: Hashable, weight: float) -> None:
+        current = self._bucket_of.get(key)
+        if current is not None and current != label:
+            self._buckets[current].discard(key)
+        self._bucket_of[key] = label
+        self._buckets[label].add(key, weight)
+
+    def move(self, key: str, label: Hashable) -> None:
+        current = self._bucket_of.get(key)
+        if current is None or current == label:
+            return
+        weight = self._buckets[current].weight_of(key)
+        self.add(key, label, weight)
+
+    def sample(self, rng: Random, multipliers: Mapping[Any, float]) -> str | None:
+        scaled: List[tuple[WeightedSampler, float, float]] = []
+        grand_total = 0.0
+        for label, bucket in self._buckets.items():
+            multiplier = max(0.0, multipliers.get(label, 1.0))
+            if multiplier <= 0.0 or not bucket:
+                continue
+            bucket_weight = bucket.total * multiplier
+            if bucket_weight <= 0.0:
+                continue
+            scaled.append((bucket, multiplier, bucket_weight))
+            grand_total += bucket_weight
+        if grand_total <= 0.0:
+            return None
+        value = rng.random() * grand_total
+        for bucket, multiplier, bucket_weight in scaled:
+            if value < bucket_weight:
+                return bucket.find(value / multiplier)
+            value -= bucket_weight
+        last_bucket = scaled[-1][0]
+        return last_bucket.find(last_bucket.total)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+WriteTask = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+class BackgroundWriter:
+    """Run encode-and-write tasks on one thread behind a bounded queue.
+
+    ``submit`` hands a callable and its arguments to the writer thread and only
+    blocks while ``max_pending`` tasks are already waiting, so the caller keeps
+    simulating while earlier batches are written. Tasks run in submission
+    order; once one raises, later tasks are skipped and the exception is
+    re-raised from the next ``submit``, ``wait`` or ``close``.
+
+    ``blocked_seconds`` is the time callers spent waiting for queue space and
+    ``busy_seconds`` the time the thread spent running tasks; ``stats`` returns
+    both with the task count.
+    """
+
+    def __init__(self, max_pending: int = 8, name: str = "bitrewards-writer") -> None:
+        self.max_pending = max(1, int(max_pending))
+        self._queue: queue.Queue[WriteTask | None] = queue.Queue(maxsize=self.max_pending)
+        self._error: BaseException | None = None
+        self._failed = False
+        self.blocked_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.submitted = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, task: Callable[..., Any], *args: Any) -> None:
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        self._raise_pending_error()
+        started = time.perf_counter()
+        self._queue.put((task, args))
+        self.blocked_seconds += time.perf_counter() - started
+        self.submitted += 1
+
+    def wait(self) -> None:
+        """Block until every submitted task has run; counts as blocked time."""
+        started = time.perf_counter()
+        self._queue.join()
+        self.blocked_seconds += time.perf_counter() - started
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending_error()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "submitted": self.submitted,
+            "blocked_seconds": self.blocked_seconds,
+            "busy_seconds": self.busy_seconds,
+        }
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            if not self._failed:
+                task, args = item
+                started = time.perf_counter()
+                try:
+                    task(*args)
+                except BaseException as error:
+                    self._error = error
+                    self._failed = True
+                self.busy_seconds += time.perf_counter() - started
+            self._queue.task_done()
@@ -28,9 +28,7 @@ def build_parameters_from_args(args: argparse.Namespace) -> Tuple[SimulationPara
 
 
 def run_single_simulation(parameters: SimulationParameters, seed: int | None = None) -> None:
-    model = BitRewardsModel(parameters)
-    if seed is not None:
-        model.random.seed(seed)
+    model = BitRewardsModel(parameters, seed=seed)
     for _ in range(parameters.max_steps):
         model.step()
     model_dataframe = model.datacollector.get_model_vars_dataframe()
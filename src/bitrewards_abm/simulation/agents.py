@@ -4,13 +4,17 @@ from typing import List, Set
 
 from mesa import Agent
 
-from bitrewards_abm.domain.entities import ContributionType, HonorSealStatus
+from bitrewards_abm.domain.entities import ContributionType
 from bitrewards_abm.domain.parameters import SimulationParameters
 
 
 class EconomicAgent(Agent):
     def __init__(self, unique_id: int, model, parameters: SimulationParameters) -> None:
         super().__init__(model)
+        self._statistics = None
+        self._wealth: float = 0.0
+        self._satisfaction: float = 0.0
+        self._is_active: bool = True
         self.unique_id = unique_id
         self.parameters = parameters
         self.wealth = 0.0
@@ -24,7 +28,40 @@ class EconomicAgent(Agent):
         self.roi_history: List[float] = []
         self.reputation_score: float = 1.0
         self.identity_weight: float = 1.0
-        self.escrowed_rewards: List[dict[str, float | int | str]] = []
+        statistics = getattr(model, "agent_statistics", None)
+        if statistics is not None:
+            statistics.register(self)
+            self._statistics = statistics
+
+    @property
+    def wealth(self) -> float:
+        return self._wealth
+
+    @wealth.setter
+    def wealth(self, value: float) -> None:
+        if self._statistics is not None:
+            self._statistics.wealth_changed(self, self._wealth, value)
+        self._wealth = value
+
+    @property
+    def satisfaction(self) -> float:
+        return self._satisfaction
+
+    @satisfaction.setter
+    def satisfaction(self, value: float) -> None:
+        if self._statistics is not None:
+            self._statistics.satisfaction_changed(self, self._satisfaction, value)
+        self._satisfaction = value
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        if self._statistics is not None and value != self._is_active:
+            self._statistics.activity_changed(self, value)
+        self._is_active = value
 
     def reset_step_state(self) -> None:
         self.current_income = 0.0
@@ -53,30 +90,6 @@ class EconomicAgent(Agent):
     def receive_income(self, amount: float) -> None:
         self.record_income(amount)
 
-    def unlock_escrowed_rewards(self, current_step: int) -> None:
-        if not self.escrowed_rewards:
-            return
-        remaining: List[dict[str, float | int | str]] = []
-        for entry in self.escrowed_rewards:
-            release_step = int(entry.get("release_step", 0)) - 1
-            contribution_id = str(entry.get("contribution_id", ""))
-            amount = float(entry.get("amount", 0.0))
-            payout_type = entry.get("payout_type")
-            source_contribution_id = entry.get("source_contribution_id")
-            channel = entry.get("channel")
-            if release_step < 0 and contribution_id:
-                self.model._schedule_payout(
-                    contribution_id,
-                    amount,
-                    payout_type if isinstance(payout_type, str) else None,
-                    source_contribution_id if isinstance(source_contribution_id, str) else None,
-                    channel if isinstance(channel, str) else None,
-                )
-            else:
-                entry["release_step"] = release_step
-                remaining.append(entry)
-        self.escrowed_rewards = remaining
-
 
 class CreatorAgent(EconomicAgent):
     CORE_ROLES = {"developer", "scientist", "engineer", "researcher"}
@@ -91,7 +104,7 @@ class CreatorAgent(EconomicAgent):
         if not self.is_active:
             return
         probability = self.parameters.creator_base_contribution_probability
-        if self.random.random() < probability:
+        if self.model.creator_random.random() < probability:
             self.create_contribution()
 
     def create_contribution(self) -> None:
@@ -117,7 +130,7 @@ class CreatorAgent(EconomicAgent):
 
     def draw_contribution_quality(self) -> float:
         noise_span = self.parameters.quality_noise_scale
-        raw_quality = self.skill + self.random.uniform(-noise_span, noise_span)
+        raw_quality = self.skill + self.model.creator_random.uniform(-noise_span, noise_span)
         if raw_quality < 0.0:
             return 0.0
         if raw_quality > 1.0:
@@ -127,11 +140,22 @@ class CreatorAgent(EconomicAgent):
 
 class InvestorAgent(EconomicAgent):
     def __init__(self, unique_id: int, model, parameters: SimulationParameters, initial_budget: float) -> None:
+        self._budget = 0.0
         super().__init__(unique_id, model, parameters)
         self.budget = initial_budget
         self.total_invested = 0.0
         self.funding_contribution_identifiers: Set[str] = set()
 
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: float) -> None:
+        if self._statistics is not None:
+            self._statistics.budget_changed(self, self._budget, value)
+        self._budget = value
+
     def step(self) -> None:
         if not self.is_active:
             return
@@ -160,12 +184,12 @@ class UserAgent(EconomicAgent):
             return
         if not self.model.contributions:
             return
-        if self.random.random() > self.parameters.user_usage_probability:
+        if self.model.usage_random.random() > self.parameters.user_usage_probability:
             return
         mean_usage = getattr(self.parameters, "user_mean_usage_rate", 1.0)
         if mean_usage <= 0.0:
             return
-        num_events = self.model._sample_poisson(mean_usage)
+        num_events = self.model._sample_poisson(mean_usage, self.model.usage_random)
         if num_events <= 0:
             return
         for _ in range(num_events):
@@ -180,39 +204,4 @@ class UserAgent(EconomicAgent):
             )
 
     def select_contribution_for_usage(self) -> str | None:
-        identifiers = list(self.model.contributions.keys())
-        if not identifiers:
-            return None
-        weights: List[float] = []
-        for identifier in identifiers:
-            contribution = self.model.contributions.get(identifier)
-            if contribution is None:
-                weights.append(1.0)
-                continue
-            quality = max(contribution.quality, 0.01)
-            seal_weight = self._honor_seal_weight(contribution)
-            weights.append(quality * seal_weight)
-        if not weights:
-            index = self.random.randrange(len(identifiers))
-            return identifiers[index]
-        index = self.random.choices(range(len(identifiers)), weights=weights, k=1)[0]
-        return identifiers[index]
-
-    def _honor_seal_weight(self, contribution) -> float:
-        if not getattr(self.parameters, "honor_seal_enabled", False):
-            return 1.0
-        ramp_steps = getattr(self.parameters, "honor_seal_enforcement_ramp_steps", 0)
-        if ramp_steps > 0:
-            ramp = min(1.0, self.model.current_step / ramp_steps)
-        else:
-            ramp = 1.0
-        status = getattr(contribution, "honor_seal_status", HonorSealStatus.NONE)
-        if status is HonorSealStatus.HONEST:
-            return 1.0 + ramp * (self.parameters.honor_seal_demand_multiplier - 1.0)
-        if status is HonorSealStatus.FAKE:
-            return 1.0 + ramp * (self.parameters.honor_seal_demand_multiplier - 1.0)
-        if status is HonorSealStatus.DISHONORED:
-            penalty = self.parameters.honor_seal_dishonored_penalty_multiplier
-            return max(0.0, 1.0 - ramp * (1.0 - penalty))
-        penalty = self.parameters.honor_seal_unsealed_penalty_multiplier
-        return max(0.0, 1.0 - ramp * (1.0 - penalty))
+        return self.model.sample_contribution_for_usage()
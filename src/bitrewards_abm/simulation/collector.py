@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from array import array
+from numbers import Integral
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+Reporter = Callable[[Any], Any]
+
+
+class ArrayDataCollector:
+    """Drop-in replacement for Mesa's ``DataCollector`` backed by typed NumPy columns.
+
+    Model reporter columns are allocated for ``capacity`` rows up front (and
+    doubled if a run outlives it), with the dtype taken from the first recorded
+    value: ``bool``, ``int64``, ``float64``, or ``object`` for anything else. An
+    integer column is widened to ``float64`` if it later receives a fractional
+    value. ``record_every`` keeps only steps divisible by the interval, plus
+    ``final_step``, and ``columns`` restricts collection to the named model
+    reporters. ``get_model_vars_dataframe`` returns the same shape Mesa does: one
+    column per reporter and a ``RangeIndex`` over recorded rows.
+
+    Agent reporters are optional. When given, agents are recorded sparsely by
+    ``SparseAgentRecorder``: ``get_agent_vars_dataframe`` holds only the rows
+    whose values changed, and ``reconstruct_agent_vars_dataframe`` rebuilds the
+    dense per-step view.
+    """
+
+    def __init__(
+        self,
+        model_reporters: Mapping[str, Reporter],
+        agent_reporters: Mapping[str, str | Reporter] | None = None,
+        capacity: int = 0,
+        record_every: int = 1,
+        columns: Iterable[str] | None = None,
+        final_step: int | None = None,
+    ) -> None:
+        selected = list(model_reporters) if columns is None else list(columns)
+        unknown = [name for name in selected if name not in model_reporters]
+        if unknown:
+            raise ValueError(f"Unknown model reporter columns: {unknown}")
+        self.model_reporters: Dict[str, Reporter] = {name: model_reporters[name] for name in selected}
+        self.agent_recorder = SparseAgentRecorder(agent_reporters) if agent_reporters else None
+        self.record_every = max(1, int(record_every))
+        self.final_step = final_step
+        self._capacity = max(1, int(capacity))
+        self._columns: Dict[str, np.ndarray] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def should_record(self, step: int) -> bool:
+        return step % self.record_every == 0 or step == self.final_step
+
+    def collect(self, model) -> None:
+        step = int(getattr(model, "current_step", self._rows))
+        if not self.should_record(step):
+            return
+        if self._rows == self._capacity:
+            self._grow()
+        row = self._rows
+        for name, reporter in self.model_reporters.items():
+            self._store(name, row, reporter(model))
+        self._rows += 1
+        if self.agent_recorder is not None:
+            self.agent_recorder.record(step, model.agents)
+
+    def _store(self, name: str, row: int, value: Any) -> None:
+        column = self._columns.get(name)
+        if column is None:
+            column = np.zeros(self._capacity, dtype=_dtype_for(value))
+            self._columns[name] = column
+        elif column.dtype == np.int64 and not isinstance(value, (Integral, np.integer)):
+            column = column.astype(np.float64)
+            self._columns[name] = column
+        column[row] = value
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(self._capacity, dtype=column.dtype)
+            grown[: self._rows] = column[: self._rows]
+            self._columns[name] = grown
+
+    def get_model_vars_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {name: self._columns[name][: self._rows] for name in self.model_reporters if name in self._columns},
+            columns=list(self.model_reporters),
+        )
+
+    def get_agent_vars_dataframe(self) -> pd.DataFrame:
+        if self.agent_recorder is None:
+            return _empty_agent_frame([])
+        return self.agent_recorder.to_dataframe()
+
+    def reconstruct_agent_vars_dataframe(self, steps: Sequence[int] | None = None) -> pd.DataFrame:
+        if self.agent_recorder is None:
+            return _empty_agent_frame([])
+        return reconstruct_dense_agent_vars(self.agent_recorder.to_dataframe(), steps, self.agent_recorder.steps)
+
+
+class SparseAgentRecorder:
+    """Change-only agent records stored column-wise.
+
+    Each recorded step visits every agent but appends a row only when one of its
+    reported values differs from the agent's previous row. Numeric and boolean
+    values go into typed arrays; any other value (such as the agent class name)
+    is stored as an integer code into a per-column category list and comes back
+    as a pandas ``Categorical``.
+    """
+
+    def __init__(self, reporters: Mapping[str, str | Reporter]) -> None:
+        self.reporters: Dict[str, Reporter] = {
+            name: attrgetter(reporter) if isinstance(reporter, str) else reporter
+            for name, reporter in reporters.items()
+        }
+        self.steps: List[int] = []
+        self._step_column = array("q")
+        self._agent_column = array("q")
+        self._columns: Dict[str, array | None] = {name: None for name in self.reporters}
+        self._categories: Dict[str, Dict[Any, int]] = {}
+        self._last_values: Dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._step_column)
+
+    def record(self, step: int, agents: Iterable[Any]) -> None:
+        self.steps.append(step)
+        reporters = tuple(self.reporters.items())
+        last_values = self._last_values
+        for agent in agents:
+            values = tuple(reporter(agent) for _, reporter in reporters)
+            agent_id = agent.unique_id
+            if last_values.get(agent_id) == values:
+                continue
+            last_values[agent_id] = values
+            self._step_column.append(step)
+            self._agent_column.append(agent_id)
+            for (name, _), value in zip(reporters, values):
+                self._append(name, value)
+
+    def _append(self, name: str, value: Any) -> None:
+        column = self._columns[name]
+        if column is None:
+            column = array(_typecode_for(value))
+            self._columns[name] = column
+            if column.typecode == "l":
+                self._categories[name] = {}
+        if column.typecode == "q" and not isinstance(value, (Integral, np.integer)):
+            column = array("d", column)
+            self._columns[name] = column
+        if name in self._categories:
+            codes = self._categories[name]
+            value = codes.setdefault(value, len(codes))
+        column.append(value)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        data: Dict[str, Any] = {
+            "Step": np.frombuffer(self._step_column, dtype=np.int64) if self._step_column else np.zeros(0, np.int64),
+            "AgentID": np.frombuffer(self._agent_column, dtype=np.int64) if self._agent_column else np.zeros(0, np.int64),
+        }
+        for name, column in self._columns.items():
+            if column is None:
+                data[name] = np.zeros(0)
+            elif name in self._categories:
+                categories = list(self._categories[name])
+                data[name] = pd.Categorical.from_codes(np.asarray(column, dtype=np.int64), categories=categories)
+            elif column.typecode == "b":
+                data[name] = np.asarray(column, dtype=bool)
+            else:
+                data[name] = np.asarray(column)
+        return pd.DataFrame(data).set_index(["Step", "AgentID"])
+
+
+def reconstruct_dense_agent_vars(
+    sparse: pd.DataFrame,
+    steps: Sequence[int] | None = None,
+    recorded_steps: Sequence[int] | None = None,
+) -> pd.DataFrame:
+    """Expand change-only agent rows into one row per agent per step.
+
+    ``sparse`` is indexed (or has columns) ``Step`` and ``AgentID``. Every agent
+    carries its latest values forward from the first step it was recorded at,
+    for each of ``steps`` (default: ``recorded_steps``, or the steps present in
+    ``sparse``). A frame that is already dense comes back unchanged.
+    """
+    frame = sparse.reset_index() if "Step" not in sparse.columns else sparse
+    value_columns = [column for column in frame.columns if column not in ("Step", "AgentID")]
+    if steps is None:
+        steps = recorded_steps if recorded_steps is not None else sorted(frame["Step"].unique())
+    wanted = sorted(set(int(step) for step in steps))
+    ordered = frame.sort_values(["Step"], kind="stable")
+    row_steps = ordered["Step"].to_numpy()
+    row_agents = ordered["AgentID"].to_numpy()
+    positions = np.arange(len(ordered))
+    latest_row: Dict[int, int] = {}
+    selected_rows: List[int] = []
+    output_steps: List[int] = []
+    cursor = 0
+    for step in wanted:
+        while cursor < len(row_steps) and row_steps[cursor] <= step:
+            latest_row[int(row_agents[cursor])] = int(positions[cursor])
+            cursor += 1
+        for row in latest_row.values():
+            selected_rows.append(row)
+            output_steps.append(step)
+    dense = ordered.iloc[selected_rows][["AgentID", *value_columns]].copy()
+    dense.insert(0, "Step", np.asarray(output_steps, dtype=np.int64))
+    return dense.set_index(["Step", "AgentID"])
+
+
+def _empty_agent_frame(columns: List[str]) -> pd.DataFrame:
+    return pd.DataFrame(columns=["Step", "AgentID", *columns]).set_index(["Step", "AgentID"])
+
+
+def _typecode_for(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "b"
+    if isinstance(value, (Integral, np.integer)):
+        return "q"
+    if isinstance(value, (float, np.floating)):
+        return "d"
+    return "l"
+
+
+def _dtype_for(value: Any) -> type:
+    if isinstance(value, (bool, np.bool_)):
+        return np.bool_
+    if isinstance(value, (Integral, np.integer)):
+        return np.int64
+    if isinstance(value, (float, np.floating)):
+        return np.float64
+    return object
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bitrewards_abm.infrastructure.writer import BackgroundWriter
+
+
+COLUMN_KINDS = ("int", "float", "category", "optional_int")
+EVENT_LOG_MODES = ("memory", "disk")
+
+_COLUMN_DTYPES = {"int": np.int64, "float": np.float64, "category": np.int32, "optional_int": np.int64}
+_COLUMN_TYPECODES = {"int": "q", "float": "d", "category": "i", "optional_int": "q"}
+
+REWARD_EVENT_COLUMNS = {
+    "step": "int",
+    "payout_type": "category",
+    "channel": "category",
+    "amount": "float",
+    "recipient_id": "int",
+    "recipient_role": "category",
+    "source_contribution_id": "category",
+}
+
+USAGE_EVENT_COLUMNS = {
+    "step": "int",
+    "contribution_id": "category",
+    "user_id": "optional_int",
+    "gross_value": "float",
+}
+
+
+class EventBuffer:
+    """Append-only event log kept as one typed column per field.
+
+    ``columns`` maps each column name to its kind: ``"int"`` and ``"float"`` are
+    64-bit columns, ``"optional_int"`` stores ``None`` as a masked slot, and
+    ``"category"`` interns the value and stores a 32-bit code, so repeated
+    labels and contribution ids cost four bytes per event. ``append`` takes the
+    values in column order and adds them to growable ``array`` columns.
+    While the buffer is open, ``to_dataframe`` and ``column`` copy the filled
+    rows into NumPy, so a frame taken mid-run does not block or see later
+    appends. ``close`` ends appends; from then on they return zero-copy views
+    of the columns.
+
+    Iterating yields one dict per event, which is convenient in tests but
+    materialises every row; use ``to_dataframe`` for analysis. This is also the
+    in-memory event sink: ``iter_chunks`` yields the whole log as one frame and
+    ``flush`` does nothing.
+    """
+
+    def __init__(self, columns: Mapping[str, str]) -> None:
+        unknown = {kind for kind in columns.values() if kind not in COLUMN_KINDS}
+        if unknown:
+            raise ValueError(f"Unknown column kinds {sorted(unknown)}; expected one of {COLUMN_KINDS}")
+        self.columns: Dict[str, str] = dict(columns)
+        self._values: Dict[str, array] = {name: array(_COLUMN_TYPECODES[kind]) for name, kind in self.columns.items()}
+        self._masks: Dict[str, array] = {
+            name: array("B") for name, kind in self.columns.items() if kind == "optional_int"
+        }
+        self._categories: Dict[str, Dict[Any, int]] = {
+            name: {} for name, kind in self.columns.items() if kind == "category"
+        }
+        # Per column: the value appender, the category map and the null-mask appender.
+        self._layout = tuple(
+            (
+                self._values[name].append,
+                self._categories.get(name),
+                self._masks[name].append if name in self._masks else None,
+            )
+            for name in self.columns
+        )
+        self._size = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def append(self, *values: Any) -> None:
+        if self._closed:
+            raise ValueError("Cannot append to a closed event buffer")
+        if len(values) != len(self._layout):
+            raise ValueError(f"Expected {len(self._layout)} values, got {len(values)}")
+        for (append_value, categories, append_mask), value in zip(self._layout, values):
+            if categories is not None:
+                code = categories.get(value)
+                if code is None:
+                    code = len(categories)
+                    categories[value] = code
+                append_value(code)
+            elif append_mask is not None:
+                if value is None:
+                    append_value(0)
+                    append_mask(1)
+                else:
+                    append_value(value)
+                    append_mask(0)
+            else:
+                append_value(value)
+        self._size += 1
+
+    def clear(self) -> None:
+        """Forget the buffered rows but keep the interned categories and their codes."""
+        self._size = 0
+        for store in (self._values, self._masks):
+            for staged in store.values():
+                del staged[:]
+
+    def categories(self, name: str) -> List[Any]:
+        return list(self._categories[name])
+
+    def _array(self, name: str) -> np.ndarray:
+        return self._as_numpy(self._values[name], _COLUMN_DTYPES[self.columns[name]])
+
+    def _mask(self, name: str) -> np.ndarray:
+        return self._as_numpy(self._masks[name], np.bool_)
+
+    def _as_numpy(self, staged: array, dtype: Any) -> np.ndarray:
+        view = np.frombuffer(staged, dtype=dtype)
+        # An exported view pins the array's memory, so it could no longer grow.
+        return view if self._closed else view.copy()
+
+    def column(self, name: str) -> np.ndarray | pd.Categorical | pd.arrays.IntegerArray:
+        kind = self.columns[name]
+        values = self._array(name)
+        if kind == "category":
+            return pd.Categorical.from_codes(values, categories=self.categories(name))
+        if kind == "optional_int":
+            return pd.arrays.IntegerArray(values, self._mask(name))
+        return values
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame({name: self.column(name) for name in self.columns}, copy=False)
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        if self._size:
+            yield self.to_dataframe()
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._closed = True
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        lookups = {name: list(categories) for name, categories in self._categories.items()}
+        for row in range(self._size):
+            event: Dict[str, Any] = {}
+            for name, kind in self.columns.items():
+                value = self._values[name][row]
+                if kind == "category":
+                    value = lookups[name][value]
+                elif kind == "optional_int" and self._masks[name][row]:
+                    value = None
+                event[name] = value
+            yield event
+
+
+class ChunkedFileEventSink:
+    """Event sink that spills fixed-size batches to a binary columnar file.
+
+    Rows collect in an ``EventBuffer`` of ``chunk_size`` rows. When it fills,
+    the batch is converted to NumPy once, appended to ``path`` and the buffer
+    is reused, so memory stays
+    at one chunk however long the run is (plus the interned category labels,
+    which grow with distinct contributions rather than with events). The file
+    starts with a JSON header naming the columns; each chunk then stores, per
+    column, the raw values (plus the null mask for ``optional_int``), with
+    ``category`` columns storing only the labels first seen in that chunk
+    followed by the codes. Every record is a ``.npy`` array, so the file reads
+    back with ``np.load`` and no pickling. Category labels are stored as text.
+
+    With a ``writer``, full batches are copied out and encoded on its thread,
+    so ``append`` only waits when the writer's queue is full. ``iter_chunks``
+    flushes pending rows (waiting for the writer) and streams the file back
+    one chunk at a time; ``read_event_chunks`` does the same for a file on its
+    own. With ``delete_on_close`` the sink owns ``path`` and removes it in
+    ``close``, so the log must be read before then.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Mapping[str, str],
+        chunk_size: int = 65536,
+        writer: BackgroundWriter | None = None,
+        delete_on_close: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = max(1, int(chunk_size))
+        self.writer = writer
+        self.delete_on_close = delete_on_close
+        self._buffer = EventBuffer(columns)
+        self.columns = self._buffer.columns
+        self._written_categories = {name: 0 for name in self._buffer._categories}
+        self._written_rows = 0
+        self._handle: BinaryIO | None = open(self.path, "wb")
+        np.save(self._handle, np.array(json.dumps(self.columns)), allow_pickle=False)
+        self._handle.flush()
+
+    def __len__(self) -> int:
+        return self._written_rows + len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def append(self, *values: Any) -> None:
+        self._buffer.append(*values)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def categories(self, name: str) -> List[Any]:
+        return self._buffer.categories(name)
+
+    def flush(self) -> None:
+        """Write out the buffered rows, or queue them on ``writer`` if one was given."""
+        rows = len(self._buffer)
+        if rows == 0 or self._handle is None:
+            return
+        records: List[np.ndarray] = []
+        for name, kind in self.columns.items():
+            if kind == "category":
+                labels = self._buffer.categories(name)
+                new_labels = [str(label) for label in labels[self._written_categories[name]:]]
+                records.append(np.array(new_labels, dtype=str))
+                self._written_categories[name] = len(labels)
+            records.append(self._buffer._array(name))
+            if kind == "optional_int":
+                records.append(self._buffer._mask(name))
+        self._written_rows += rows
+        self._buffer.clear()
+        if self.writer is None:
+            _write_records(self._handle, records)
+        else:
+            self.writer.submit(_write_records, self._handle, records)
+
+    def close(self) -> None:
+        self.flush()
+        if self._handle is None:
+            return
+        if self.writer is None:
+            self._handle.close()
+        else:
+            self.writer.submit(self._handle.close)
+            self.writer.wait()
+        self._handle = None
+        if self.delete_on_close:
+            self.path.unlink(missing_ok=True)
+
+    def _sync(self) -> None:
+        self.flush()
+        if self.writer is not None:
+            self.writer.wait()
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        self._sync()
+        return read_event_chunks(self.path)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        self._sync()
+        return read_event_log(self.path)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for chunk in self.iter_chunks():
+            yield from chunk.to_dict("records")
+
+
+def _write_records(handle: BinaryIO, records: List[np.ndarray]) -> None:
+    for record in records:
+        np.save(handle, record, allow_pickle=False)
+    handle.flush()
+
+
+def _read_raw_chunks(path: str | Path) -> Iterator[Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, Any]]]:
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        columns: Dict[str, str] = json.loads(str(np.load(handle, allow_pickle=False)))
+        categories: Dict[str, List[str]] = {name: [] for name, kind in columns.items() if kind == "category"}
+        while handle.tell() < size:
+            data: Dict[str, Any] = {}
+            for name, kind in columns.items():
+                if kind == "category":
+                    categories[name].extend(np.load(handle, allow_pickle=False).tolist())
+                values = np.load(handle, allow_pickle=False)
+                if kind == "optional_int":
+                    values = (values, np.load(handle, allow_pickle=False))
+                data[name] = values
+            yield columns, categories, data
+
+
+def _chunk_frame(columns: Dict[str, str], categories: Dict[str, List[str]], data: Dict[str, Any]) -> pd.DataFrame:
+    frame: Dict[str, Any] = {}
+    for name, kind in columns.items():
+        values = data[name]
+        if kind == "category":
+            frame[name] = pd.Categorical.from_codes(values, categories=list(categories[name]))
+        elif kind == "optional_int":
+            frame[name] = pd.arrays.IntegerArray(*values)
+        else:
+            frame[name] = values
+    return pd.DataFrame(frame, copy=False)
+
+
+def read_event_chunks(path: str | Path) -> Iterator[pd.DataFrame]:
+    """Stream an event log written by ``ChunkedFileEventSink`` one chunk at a time."""
+    for columns, categories, data in _read_raw_chunks(path):
+        yield _chunk_frame(columns, categories, data)
+
+
+def read_event_log(path: str | Path) -> pd.DataFrame:
+    """Load a whole event log, with every categorical column on its final category list."""
+    columns: Dict[str, str] = {}
+    categories: Dict[str, List[str]] = {}
+    collected: Dict[str, List[Any]] = {}
+    for columns, categories, data in _read_raw_chunks(path):
+        for name, values in data.items():
+            collected.setdefault(name, []).append(values)
+    if not columns:
+        with open(path, "rb") as handle:
+            columns = json.loads(str(np.load(handle, allow_pickle=False)))
+        return EventBuffer(columns).to_dataframe()
+    merged: Dict[str, Any] = {}
+    for name, kind in columns.items():
+        parts = collected[name]
+        if kind == "optional_int":
+            merged[name] = (np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]))
+        else:
+            merged[name] = np.concatenate(parts)
+    return _chunk_frame(columns, categories, merged)
+
+
+EventSink = EventBuffer | ChunkedFileEventSink
+
+
+def build_event_sink(
+    mode: str,
+    columns: Mapping[str, str],
+    path: str | Path | None = None,
+    chunk_size: int = 65536,
+    writer: BackgroundWriter | None = None,
+) -> EventSink:
+    if mode == "memory":
+        return EventBuffer(columns)
+    if mode == "disk":
+        delete_on_close = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(prefix="bitrewards_events_", suffix=".events")
+            os.close(handle)
+        return ChunkedFileEventSink(
+            path, columns, chunk_size=chunk_size, writer=writer, delete_on_close=delete_on_close
+        )
+    raise ValueError(f"Unknown event log mode {mode!r}; expected one of {EVENT_LOG_MODES}")
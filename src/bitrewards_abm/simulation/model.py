@@ -1,31 +1,78 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Type
+from pathlib import Path
+from random import Random
+from typing import Dict, List, Set, Type
 
 from mesa import Model
-from mesa.datacollection import DataCollector
 
 from bitrewards_abm.domain.entities import (
     Contribution,
     ContributionType,
+    EscrowedReward,
     UsageEvent,
     TreasuryState,
     HonorSealStatus,
 )
 from bitrewards_abm.domain.parameters import SimulationParameters
-from bitrewards_abm.infrastructure.graph_store import ContributionGraph
+from bitrewards_abm.infrastructure.graph_store import build_contribution_graph
+from bitrewards_abm.infrastructure.order_statistics import build_gini_tracker
+from bitrewards_abm.infrastructure.random_streams import build_random_streams
+from bitrewards_abm.infrastructure.sampling import BucketedSampler, WeightedSampler
+from bitrewards_abm.infrastructure.writer import BackgroundWriter
 from bitrewards_abm.simulation.agents import CreatorAgent, EconomicAgent, InvestorAgent, UserAgent
+from bitrewards_abm.simulation.collector import ArrayDataCollector
+from bitrewards_abm.simulation.events import REWARD_EVENT_COLUMNS, USAGE_EVENT_COLUMNS, EventSink, build_event_sink
+from bitrewards_abm.simulation.payouts import PayoutAllocation, PayoutLedger
+from bitrewards_abm.simulation.statistics import AgentStatistics
 
 
 class BitRewardsModel(Model):
-    def __init__(self, parameters: SimulationParameters) -> None:
-        super().__init__()
+    def __init__(self, parameters: SimulationParameters, seed: int | None = None) -> None:
+        super().__init__(seed=seed)
         self.parameters = parameters
-        self.contribution_graph = ContributionGraph()
+        streams = build_random_streams(
+            getattr(parameters, "rng_streams", "shared"),
+            self.random,
+            seed,
+            antithetic=getattr(parameters, "rng_antithetic", False),
+        )
+        self.population_random = streams["population"]
+        self.arrivals_random = streams["arrivals"]
+        self.creator_random = streams["creators"]
+        self.investor_random = streams["investors"]
+        self.usage_random = streams["usage"]
+        self.tracing_random = streams["tracing"]
+        self.honor_seal_random = streams["honor_seal"]
+        self.churn_random = streams["churn"]
+        self.contribution_graph = build_contribution_graph(getattr(parameters, "graph_backend", "networkx"))
         self.contributions: Dict[str, Contribution] = {}
-        self.reward_events: List[dict[str, object]] = []
-        self.usage_events: List[dict[str, object]] = []
+        self.contribution_type_counts: Dict[ContributionType, int] = {
+            contribution_type: 0 for contribution_type in ContributionType
+        }
+        self.honor_seal_counts: Dict[HonorSealStatus, int] = {status: 0 for status in HonorSealStatus}
+        self.agent_statistics = AgentStatistics(
+            wealth_trackers={
+                CreatorAgent: build_gini_tracker(
+                    getattr(parameters, "creator_gini_mode", "exact"),
+                    getattr(parameters, "creator_gini_bin_growth", 1.01),
+                )
+            }
+        )
+        self.contribution_ids: List[str] = []
+        self.contribution_positions: Dict[str, int] = {}
+        self.usage_sampler = BucketedSampler(HonorSealStatus)
+        self.parent_sampler = WeightedSampler()
+        self.funding_target_sampler = WeightedSampler()
+        writer_queue = getattr(parameters, "event_log_writer_queue", 0)
+        self.event_writer = (
+            BackgroundWriter(max_pending=writer_queue)
+            if getattr(parameters, "event_log_mode", "memory") == "disk" and writer_queue > 0
+            else None
+        )
+        self.reward_events = self._build_event_sink("reward_events", REWARD_EVENT_COLUMNS)
+        self.usage_events = self._build_event_sink("usage_events", USAGE_EVENT_COLUMNS)
         self.pending_usage_events: List[UsageEvent] = []
         self.next_contribution_index = 0
         self.total_fee_distributed_this_step = 0.0
@@ -40,7 +87,14 @@ class BitRewardsModel(Model):
         self.new_creators_this_step: int = 0
         self.new_investors_this_step: int = 0
         self.new_users_this_step: int = 0
-        self.pending_payouts: List[dict[str, object]] = []
+        self.pending_payouts = PayoutLedger()
+        self.pending_royalty_accruals: Set[str] = set()
+        self.lockup_clock: int = 0
+        self.locked_funding_expiries: Dict[str, int] = {}
+        self.funding_lockup_calendar: Dict[int, List[str]] = {}
+        self.escrow_clock: int = 0
+        self.escrow_sequence: int = 0
+        self.escrow_calendar: Dict[int, List[EscrowedReward]] = {}
         self.treasury = TreasuryState()
         self.total_funding_invested = 0.0
         self.initial_total_wealth = 0.0
@@ -69,7 +123,8 @@ class BitRewardsModel(Model):
             "false_positive_links": 0,
             "missed_true_links": 0,
         }
-        self.datacollector = DataCollector(
+        record_every = max(1, getattr(parameters, "record_every", 1))
+        self.datacollector = ArrayDataCollector(
             model_reporters={
                 "step": lambda m: m.current_step,
                 "contribution_count": contribution_count,
@@ -117,11 +172,35 @@ class BitRewardsModel(Model):
                 "satisfaction": "satisfaction",
                 "active": "is_active",
                 "agent_type": lambda agent: agent.__class__.__name__,
-            },
+            }
+            if getattr(parameters, "record_agents", False)
+            else None,
+            capacity=parameters.max_steps // record_every + 1,
+            record_every=record_every,
+            columns=getattr(parameters, "recorded_columns", None),
+            final_step=parameters.max_steps,
         )
         self.create_initial_population()
         self.initial_total_wealth = self._compute_total_wealth()
 
+    def _build_event_sink(self, name: str, columns: Dict[str, str]) -> EventSink:
+        mode = getattr(self.parameters, "event_log_mode", "memory")
+        directory = getattr(self.parameters, "event_log_dir", None)
+        path = Path(directory) / f"{name}.events" if mode == "disk" and directory is not None else None
+        return build_event_sink(
+            mode,
+            columns,
+            path=path,
+            chunk_size=getattr(self.parameters, "event_log_chunk_size", 65536),
+            writer=self.event_writer,
+        )
+
+    def close_event_logs(self) -> None:
+        self.reward_events.close()
+        self.usage_events.close()
+        if self.event_writer is not None:
+            self.event_writer.close()
+
     def _agent_role_label(self, agent: EconomicAgent) -> str:
         if isinstance(agent, CreatorAgent):
             return agent.role
@@ -146,26 +225,18 @@ class BitRewardsModel(Model):
         agent = self.agent_by_identifier.get(recipient_id)
         if agent is None:
             return
-        role_label = self._agent_role_label(agent)
         self.reward_events.append(
-            {
-                "step": int(step),
-                "payout_type": payout_type,
-                "channel": channel,
-                "amount": float(amount),
-                "recipient_id": int(recipient_id),
-                "recipient_role": role_label,
-                "source_contribution_id": source_contribution_id,
-            }
+            step,
+            payout_type,
+            channel,
+            amount,
+            recipient_id,
+            self._agent_role_label(agent),
+            source_contribution_id,
         )
 
     def _compute_total_wealth(self) -> float:
-        total = 0.0
-        for agent in self.agent_by_identifier.values():
-            total += getattr(agent, "wealth", 0.0)
-            total += getattr(agent, "budget", 0.0)
-        total += self.treasury.balance
-        return total
+        return self.agent_statistics.total_wealth + self.treasury.balance
 
     def reset_step_internal_state(self) -> None:
         self.reset_agents_for_new_step()
@@ -228,6 +299,7 @@ class BitRewardsModel(Model):
             self._apply_honor_seal_to_root(contribution, creator)
         else:
             self._inherit_honor_seal(contribution, parent_for_inheritance)
+        self._index_contribution(contribution)
         self.tracing_metrics["true_links"] += len(true_parents)
         if not true_parents:
             return identifier
@@ -238,19 +310,14 @@ class BitRewardsModel(Model):
             min(1.0, getattr(self.parameters, "tracing_false_positive_rate", 0.0)),
         )
         edge_parent: str | None = None
-        if self.random.random() < tracing_accuracy:
+        if self.tracing_random.random() < tracing_accuracy:
             edge_parent = true_parent_id
             self.tracing_metrics["detected_true_links"] += 1
         else:
             self.tracing_metrics["missed_true_links"] += 1
-            if self.random.random() < false_positive_rate:
-                candidates = [
-                    cid
-                    for cid in self.contributions.keys()
-                    if cid not in true_parents and cid != identifier
-                ]
-                if candidates:
-                    edge_parent = self.random.choice(candidates)
+            if self.tracing_random.random() < false_positive_rate:
+                edge_parent = self._draw_contribution_excluding([*true_parents, identifier])
+                if edge_parent is not None:
                     self.tracing_metrics["false_positive_links"] += 1
         if edge_parent is not None:
             contribution.parents = [edge_parent]
@@ -271,7 +338,7 @@ class BitRewardsModel(Model):
         adoption_rate = getattr(self.parameters, "honor_seal_initial_adoption_rate", 0.0)
         if adoption_rate <= 0.0:
             return
-        if self.random.random() > adoption_rate:
+        if self.honor_seal_random.random() > adoption_rate:
             return
         cost = getattr(self.parameters, "honor_seal_mint_cost_btc", 0.0)
         if cost > 0.0 and creator.wealth < cost:
@@ -281,7 +348,7 @@ class BitRewardsModel(Model):
             self.treasury.balance += cost
             self.treasury.cumulative_inflows += cost
         fake_rate = getattr(self.parameters, "honor_seal_fake_rate", 0.0)
-        if fake_rate > 0.0 and self.random.random() < fake_rate:
+        if fake_rate > 0.0 and self.honor_seal_random.random() < fake_rate:
             contribution.honor_seal_status = HonorSealStatus.FAKE
         else:
             contribution.honor_seal_status = HonorSealStatus.HONEST
@@ -306,8 +373,8 @@ class BitRewardsModel(Model):
         if max_available <= 0.0:
             return None
         min_available = min(self.parameters.funding_min_amount, max_available)
-        amount = self.random.uniform(min_available, max_available)
-        royalty_percent = self.random.uniform(
+        amount = self.investor_random.uniform(min_available, max_available)
+        royalty_percent = self.investor_random.uniform(
             self.parameters.funding_royalty_min,
             self.parameters.funding_royalty_max,
         )
@@ -329,9 +396,14 @@ class BitRewardsModel(Model):
             funding_cumulative_rewards=0.0,
         )
         lockup_steps = max(0, self.parameters.funding_lockup_period_steps)
-        contribution.lockup_remaining_steps = lockup_steps
         self.contributions[identifier] = contribution
+        if lockup_steps > 0:
+            expiry = self.lockup_clock + lockup_steps
+            contribution.lockup_expiry_step = expiry
+            self.locked_funding_expiries[identifier] = expiry
+            self.funding_lockup_calendar.setdefault(expiry, []).append(identifier)
         self.contribution_graph.add_contribution_node(identifier)
+        self._index_contribution(contribution)
         self.total_funding_invested += amount
         treasury_fraction = self.parameters.treasury_funding_rate
         treasury_amount = max(0.0, min(1.0, treasury_fraction)) * amount
@@ -356,13 +428,71 @@ class BitRewardsModel(Model):
             )
         return identifier
 
+    def _honor_seal_ramp(self) -> float:
+        ramp_steps = getattr(self.parameters, "honor_seal_enforcement_ramp_steps", 0)
+        if ramp_steps > 0:
+            return min(1.0, self.current_step / ramp_steps)
+        return 1.0
+
+    def honor_seal_usage_multiplier(self, status: HonorSealStatus) -> float:
+        if not getattr(self.parameters, "honor_seal_enabled", False):
+            return 1.0
+        ramp = self._honor_seal_ramp()
+        if status is HonorSealStatus.HONEST:
+            return 1.0 + ramp * (self.parameters.honor_seal_demand_multiplier - 1.0)
+        if status is HonorSealStatus.FAKE:
+            return 1.0 + ramp * (self.parameters.honor_seal_demand_multiplier - 1.0)
+        if status is HonorSealStatus.DISHONORED:
+            penalty = self.parameters.honor_seal_dishonored_penalty_multiplier
+            return max(0.0, 1.0 - ramp * (1.0 - penalty))
+        penalty = self.parameters.honor_seal_unsealed_penalty_multiplier
+        return max(0.0, 1.0 - ramp * (1.0 - penalty))
+
+    def _index_contribution(self, contribution: Contribution) -> None:
+        identifier = contribution.contribution_id
+        status = getattr(contribution, "honor_seal_status", HonorSealStatus.NONE)
+        if identifier not in self.contribution_positions:
+            self.contribution_positions[identifier] = len(self.contribution_ids)
+            self.contribution_ids.append(identifier)
+            self.contribution_type_counts[contribution.contribution_type] += 1
+            self.honor_seal_counts[status] += 1
+        weight = max(contribution.quality, 0.01)
+        self.usage_sampler.add(identifier, status, weight)
+        self.parent_sampler.add(identifier, weight)
+        if (
+            contribution.contribution_type is not ContributionType.FUNDING
+            and contribution.quality >= self.parameters.investor_min_target_quality
+        ):
+            self.funding_target_sampler.add(identifier, weight)
+
+    def _draw_contribution_excluding(self, excluded: List[str]) -> str | None:
+        # Uniform over the dense index minus ``excluded``: draw a rank among the
+        # remaining ids and step over the excluded positions below it. This is O(1)
+        # for the handful of exclusions tracing needs and consumes the same single
+        # randbelow call as random.choice over the filtered candidate list.
+        skipped = sorted(
+            {self.contribution_positions[cid] for cid in excluded if cid in self.contribution_positions}
+        )
+        candidate_count = len(self.contribution_ids) - len(skipped)
+        if candidate_count <= 0:
+            return None
+        position = self.tracing_random.randrange(candidate_count)
+        for excluded_position in skipped:
+            if position >= excluded_position:
+                position += 1
+        return self.contribution_ids[position]
+
+    def sample_contribution_for_usage(self) -> str | None:
+        multipliers = {status: self.honor_seal_usage_multiplier(status) for status in HonorSealStatus}
+        return self.usage_sampler.sample(self.usage_random, multipliers)
+
     def register_usage_event(self, contribution_identifier: str, gross_value: float, user_id: int | None = None) -> None:
         if contribution_identifier not in self.contributions:
             return
         adjusted_value = gross_value
         if self.parameters.usage_shock_std > 0.0:
             adjusted_value = adjusted_value * math.exp(
-                self.random.gauss(0.0, self.parameters.usage_shock_std)
+                self.usage_random.gauss(0.0, self.parameters.usage_shock_std)
             )
         usage_event = UsageEvent(
             contribution_id=contribution_identifier,
@@ -370,41 +500,34 @@ class BitRewardsModel(Model):
             fee_amount=0.0,
         )
         self.pending_usage_events.append(usage_event)
-        self.usage_events.append(
-            {
-                "step": int(self.current_step),
-                "contribution_id": contribution_identifier,
-                "user_id": int(user_id) if user_id is not None else None,
-                "gross_value": float(adjusted_value),
-            }
-        )
+        self.usage_events.append(self.current_step, contribution_identifier, user_id, adjusted_value)
 
     def next_contribution_identifier(self) -> str:
         identifier = f"c{self.next_contribution_index}"
         self.next_contribution_index += 1
         return identifier
 
-    def _sample_creator_role(self) -> str:
+    def _sample_creator_role(self, rng: Random) -> str:
         supporting_fraction = getattr(self.parameters, "supporting_creator_fraction", 0.0)
         if supporting_fraction < 0.0:
             supporting_fraction = 0.0
         elif supporting_fraction > 1.0:
             supporting_fraction = 1.0
-        is_supporting = self.random.random() < supporting_fraction
+        is_supporting = rng.random() < supporting_fraction
         if is_supporting and CreatorAgent.SUPPORTING_ROLES:
             roles = tuple(CreatorAgent.SUPPORTING_ROLES)
         else:
             roles = tuple(CreatorAgent.CORE_ROLES)
         if not roles:
             return "developer"
-        index = self.random.randrange(len(roles))
+        index = rng.randrange(len(roles))
         return roles[index]
 
     def create_initial_population(self) -> None:
         identifier = 0
         for _ in range(self.parameters.creator_count):
-            role = self._sample_creator_role()
-            skill = self.random.uniform(
+            role = self._sample_creator_role(self.population_random)
+            skill = self.population_random.uniform(
                 self.parameters.min_creator_skill,
                 self.parameters.max_creator_skill,
             )
@@ -444,7 +567,7 @@ class BitRewardsModel(Model):
             if isinstance(agent, EconomicAgent):
                 agent.reset_step_state()
 
-    def _sample_poisson(self, lam: float) -> int:
+    def _sample_poisson(self, lam: float, rng: Random) -> int:
         if lam <= 0.0:
             return 0
         limit = math.exp(-lam)
@@ -452,7 +575,7 @@ class BitRewardsModel(Model):
         p = 1.0
         while True:
             k += 1
-            p *= self.random.random()
+            p *= rng.random()
             if p <= limit:
                 return k - 1
 
@@ -488,10 +611,10 @@ class BitRewardsModel(Model):
             self.parameters.creator_arrival_roi_sensitivity,
             self.creators,
         )
-        num_creators = self._sample_poisson(creator_lambda)
+        num_creators = self._sample_poisson(creator_lambda, self.arrivals_random)
         for _ in range(num_creators):
-            role = self._sample_creator_role()
-            skill = self.random.uniform(
+            role = self._sample_creator_role(self.arrivals_random)
+            skill = self.arrivals_random.uniform(
                 self.parameters.min_creator_skill,
                 self.parameters.max_creator_skill,
             )
@@ -518,7 +641,7 @@ class BitRewardsModel(Model):
             self.parameters.investor_arrival_roi_sensitivity,
             self.investors,
         )
-        num_investors = self._sample_poisson(investor_lambda)
+        num_investors = self._sample_poisson(investor_lambda, self.arrivals_random)
         for _ in range(num_investors):
             investor = InvestorAgent(
                 unique_id=self.next_agent_identifier,
@@ -542,7 +665,7 @@ class BitRewardsModel(Model):
             self.parameters.user_arrival_roi_sensitivity,
             self.users,
         )
-        num_users = self._sample_poisson(user_lambda)
+        num_users = self._sample_poisson(user_lambda, self.arrivals_random)
         for _ in range(num_users):
             user = UserAgent(
                 unique_id=self.next_agent_identifier,
@@ -561,18 +684,44 @@ class BitRewardsModel(Model):
                 self.treasury.cumulative_inflows += identity_cost
 
     def _unlock_all_escrows(self) -> None:
-        for agent in self.agent_by_identifier.values():
-            if hasattr(agent, "unlock_escrowed_rewards"):
-                agent.unlock_escrowed_rewards(self.current_step)
+        # Escrows sit in a calendar keyed by the unlock tick they mature on, so each
+        # call only touches the rewards released now. Releasing them by owner and
+        # then escrow order matches the former per-agent sweep.
+        self.escrow_clock += 1
+        maturing = self.escrow_calendar.pop(self.escrow_clock, None)
+        if not maturing:
+            return
+        maturing.sort()
+        for entry in maturing:
+            self._schedule_payout(
+                entry.contribution_id,
+                entry.amount,
+                entry.payout_type,
+                entry.source_contribution_id,
+                entry.channel,
+            )
+
+    def escrowed_rewards_for(self, owner_id: int) -> List[EscrowedReward]:
+        return sorted(
+            entry
+            for entries in self.escrow_calendar.values()
+            for entry in entries
+            if entry.owner_id == owner_id
+        )
+
+    def funding_lockup_remaining(self, contribution: Contribution) -> int:
+        """Lockup ticks left on a funding position (0 once it has expired)."""
+        if contribution.contribution_type is not ContributionType.FUNDING:
+            return 0
+        return max(0, contribution.lockup_expiry_step - self.lockup_clock)
 
     def _decrement_funding_lockups(self, unlock: bool = True) -> None:
-        if self.parameters.funding_lockup_period_steps > 0:
-            for contribution in self.contributions.values():
-                if contribution.contribution_type is not ContributionType.FUNDING:
-                    continue
-                remaining = getattr(contribution, "lockup_remaining_steps", 0)
-                if remaining > 0:
-                    contribution.lockup_remaining_steps = remaining - 1
+        # Expiries are absolute ``lockup_clock`` ticks, so advancing the clock only
+        # touches the positions whose lockup ends on this tick.
+        self.lockup_clock += 1
+        for identifier in self.funding_lockup_calendar.pop(self.lockup_clock, ()):
+            if self.locked_funding_expiries.get(identifier) == self.lockup_clock:
+                del self.locked_funding_expiries[identifier]
         if unlock:
             self._unlock_all_escrows()
 
@@ -588,13 +737,6 @@ class BitRewardsModel(Model):
             return
         lag = self.parameters.payout_lag_steps
         payout_channel = channel if channel is not None else payout_type
-        entry = {
-            "contribution_id": contribution_identifier,
-            "amount": amount,
-            "payout_type": payout_type,
-            "source_contribution_id": source_contribution_id,
-            "channel": payout_channel,
-        }
         if lag <= 0:
             self.pay_contribution_owner(
                 contribution_identifier,
@@ -604,7 +746,13 @@ class BitRewardsModel(Model):
                 payout_channel,
             )
             return
-        self.pending_payouts.append(entry)
+        self.pending_payouts.add(
+            contribution_identifier,
+            amount,
+            payout_type,
+            source_contribution_id,
+            payout_channel,
+        )
 
     def _credit_reward(
         self,
@@ -625,15 +773,19 @@ class BitRewardsModel(Model):
             owner = self.agent_by_identifier.get(contribution.owner_id)
             if owner is None or not getattr(owner, "is_active", False):
                 return
-            owner.escrowed_rewards.append(
-                {
-                    "contribution_id": contribution_identifier,
-                    "amount": amount,
-                    "release_step": lock_duration,
-                    "payout_type": payout_type,
-                    "source_contribution_id": source_contribution_id,
-                    "channel": channel if channel is not None else payout_type,
-                }
+            # Released on the (lock_duration + 1)-th unlock from now.
+            release_tick = self.escrow_clock + lock_duration + 1
+            self.escrow_sequence += 1
+            self.escrow_calendar.setdefault(release_tick, []).append(
+                EscrowedReward(
+                    owner_id=contribution.owner_id,
+                    sequence=self.escrow_sequence,
+                    contribution_id=contribution_identifier,
+                    amount=amount,
+                    payout_type=payout_type,
+                    source_contribution_id=source_contribution_id,
+                    channel=channel if channel is not None else payout_type,
+                )
             )
             return
         self._schedule_payout(
@@ -652,20 +804,11 @@ class BitRewardsModel(Model):
             return
         if self.current_step % lag != 0:
             return
-        for entry in list(self.pending_payouts):
-            contribution_identifier = str(entry.get("contribution_id"))
-            amount = float(entry.get("amount", 0.0))
-            payout_type = entry.get("payout_type")
-            source_contribution_id = entry.get("source_contribution_id")
-            channel = entry.get("channel")
-            self.pay_contribution_owner(
-                contribution_identifier,
-                amount,
-                payout_type if isinstance(payout_type, str) else None,
-                source_contribution_id if isinstance(source_contribution_id, str) else None,
-                channel if isinstance(channel, str) else None,
-            )
-        self.pending_payouts.clear()
+        # Each contribution is settled once per flush: gating and the investor cap
+        # see the summed amount, and the paid total is split back across the
+        # buffered (payout_type, source, channel) allocations for reward events.
+        for contribution_identifier, allocations in self.pending_payouts.drain():
+            self._settle_contribution_payout(contribution_identifier, allocations)
 
     def run_phase_for_agent_type(self, agent_type: Type[EconomicAgent]) -> None:
         if agent_type is CreatorAgent:
@@ -680,32 +823,14 @@ class BitRewardsModel(Model):
             agent.step()
 
     def select_parent_for_new_contribution(self) -> str | None:
-        if not self.contributions:
-            return None
-        identifiers = list(self.contributions.keys())
-        qualities = [self.contributions[i].quality for i in identifiers]
-        minimum_quality = 0.01
-        weights = [max(q, minimum_quality) for q in qualities]
-        chosen_identifier = self.random.choices(identifiers, weights=weights, k=1)[0]
-        return chosen_identifier
+        return self.parent_sampler.sample(self.creator_random)
 
     def select_contribution_for_funding(self) -> str | None:
-        candidates = [
-            c
-            for c in self.contributions.values()
-            if c.contribution_type != ContributionType.FUNDING
-            and c.quality >= self.parameters.investor_min_target_quality
-        ]
-        if not candidates:
-            return None
-        identifiers = [c.contribution_id for c in candidates]
-        qualities = [c.quality for c in candidates]
-        minimum_quality = 0.01
-        weights = [max(q, minimum_quality) for q in qualities]
-        chosen_identifier = self.random.choices(identifiers, weights=weights, k=1)[0]
-        return chosen_identifier
+        return self.funding_target_sampler.sample(self.investor_random)
 
     def distribute_usage_event_fees(self) -> None:
+        aggregate_gas = getattr(self.parameters, "gas_settlement_mode", "per_event") == "per_step"
+        gross_by_contribution: Dict[str, float] = {}
         for event in self.pending_usage_events:
             contribution = self.contributions.get(event.contribution_id)
             if contribution is None:
@@ -714,12 +839,19 @@ class BitRewardsModel(Model):
             status = getattr(contribution, "honor_seal_status", HonorSealStatus.NONE)
             if status in self.usage_events_by_honor_seal_this_step:
                 self.usage_events_by_honor_seal_this_step[status] += 1
-            self._apply_gas_rewards(event.contribution_id, event.gross_value)
-            increment = self.parameters.royalty_accrual_per_usage
-            if increment > 0.0:
-                contribution.accrued_royalty_value += increment
+            if aggregate_gas:
+                gross_by_contribution[event.contribution_id] = (
+                    gross_by_contribution.get(event.contribution_id, 0.0) + event.gross_value
+                )
+            else:
+                self._apply_gas_rewards(event.contribution_id, event.gross_value)
+            self._accrue_royalty(contribution, self.parameters.royalty_accrual_per_usage)
             if hasattr(contribution, "usage_count"):
                 contribution.usage_count += 1
+        # Fees are linear in gross value, so one traversal per distinct used
+        # contribution pays the same pool as one per event.
+        for contribution_id, gross_value in gross_by_contribution.items():
+            self._apply_gas_rewards(contribution_id, gross_value)
         self.pending_usage_events.clear()
 
     def _enforce_honor_seal(self) -> None:
@@ -731,8 +863,11 @@ class BitRewardsModel(Model):
         for contribution in self.contributions.values():
             if contribution.honor_seal_status is not HonorSealStatus.FAKE:
                 continue
-            if self.random.random() < detection_prob:
+            if self.honor_seal_random.random() < detection_prob:
+                self.honor_seal_counts[HonorSealStatus.FAKE] -= 1
+                self.honor_seal_counts[HonorSealStatus.DISHONORED] += 1
                 contribution.honor_seal_status = HonorSealStatus.DISHONORED
+                self.usage_sampler.move(contribution.contribution_id, HonorSealStatus.DISHONORED)
 
     def _apply_gas_rewards(self, used_identifier: str, gross_value: float) -> None:
         if gross_value <= 0.0:
@@ -779,7 +914,7 @@ class BitRewardsModel(Model):
                 continue
             lockup_steps = 0
             if contribution.contribution_type is ContributionType.FUNDING:
-                lockup_steps = max(0, getattr(contribution, "lockup_remaining_steps", 0))
+                lockup_steps = self.funding_lockup_remaining(contribution)
             self._credit_reward(
                 contribution_id,
                 amount,
@@ -789,13 +924,31 @@ class BitRewardsModel(Model):
                 channel=channel,
             )
 
+    def _accrue_royalty(self, contribution: Contribution, amount: float) -> None:
+        if amount <= 0.0:
+            return
+        contribution.accrued_royalty_value += amount
+        self.pending_royalty_accruals.add(contribution.contribution_id)
+
     def _distribute_batched_royalties(self) -> None:
+        if not self.pending_royalty_accruals:
+            return
+        # Settle in registration order, as the full contribution scan used to.
+        fallback_position = len(self.contribution_positions)
         pending: List[tuple[str, float]] = []
-        for contribution_id, contribution in self.contributions.items():
-            if contribution.accrued_royalty_value > 0.0:
+        for contribution_id in sorted(
+            self.pending_royalty_accruals,
+            key=lambda identifier: self.contribution_positions.get(identifier, fallback_position),
+        ):
+            contribution = self.contributions.get(contribution_id)
+            if contribution is not None and contribution.accrued_royalty_value > 0.0:
                 pending.append((contribution_id, contribution.accrued_royalty_value))
+        self.pending_royalty_accruals.clear()
         if not pending:
             return
+        if getattr(self.parameters, "royalty_settlement_mode", "per_root") == "sweep":
+            self._settle_batched_royalties_in_sweep(pending)
+            return
         for root_identifier, total_value in pending:
             self._distribute_value_pool(
                 root_identifier=root_identifier,
@@ -806,6 +959,31 @@ class BitRewardsModel(Model):
             contribution = self.contributions[root_identifier]
             contribution.accrued_royalty_value = 0.0
 
+    def _settle_batched_royalties_in_sweep(self, pending: List[tuple[str, float]]) -> None:
+        credits_by_root = self.contribution_graph.settle_royalty_pools_by_source(
+            dict(pending),
+            mode=getattr(self.parameters, "royalty_mode", "single_path"),
+            keep_fraction=getattr(self.parameters, "royalty_keep_fraction", 0.5),
+        )
+        for root_identifier, _ in pending:
+            self.contributions[root_identifier].accrued_royalty_value = 0.0
+        for root_identifier, credits in credits_by_root.items():
+            for contribution_id, amount in credits.items():
+                contribution = self.contributions.get(contribution_id)
+                if contribution is None or amount <= 0.0:
+                    continue
+                lockup_steps = 0
+                if contribution.contribution_type is ContributionType.FUNDING:
+                    lockup_steps = self.funding_lockup_remaining(contribution)
+                self._credit_reward(
+                    contribution_id,
+                    amount,
+                    lockup_steps,
+                    payout_type="royalty",
+                    source_contribution_id=root_identifier,
+                    channel="royalty",
+                )
+
     def _update_agent_satisfaction_and_churn(self) -> None:
         if getattr(self.parameters, "disable_churn", False):
             return
@@ -834,7 +1012,7 @@ class BitRewardsModel(Model):
                     signal = 0.0
             satisfaction = 1.0 / (1.0 + math.exp(-k * (signal - 1.0)))
             if noise_std > 0.0:
-                satisfaction += self.random.gauss(0.0, noise_std)
+                satisfaction += self.churn_random.gauss(0.0, noise_std)
             if satisfaction < 0.0:
                 satisfaction = 0.0
             elif satisfaction > 1.0:
@@ -870,7 +1048,7 @@ class BitRewardsModel(Model):
             return
         lockup_steps = 0
         if contribution.contribution_type is ContributionType.FUNDING:
-            lockup_steps = max(0, getattr(contribution, "lockup_remaining_steps", 0))
+            lockup_steps = self.funding_lockup_remaining(contribution)
         self._credit_reward(contribution_identifier, amount, lockup_steps)
 
     def distribute_fee_pool_for_event(
@@ -906,6 +1084,19 @@ class BitRewardsModel(Model):
         source_contribution_id: str | None = None,
         channel: str | None = None,
     ) -> None:
+        if amount <= 0.0:
+            return
+        self._settle_contribution_payout(
+            contribution_identifier,
+            [PayoutAllocation(payout_type, source_contribution_id, channel, amount, 1)],
+        )
+
+    def _settle_contribution_payout(
+        self,
+        contribution_identifier: str,
+        allocations: List[PayoutAllocation],
+    ) -> None:
+        amount = sum(allocation.amount for allocation in allocations)
         if amount <= 0.0:
             return
         contribution = self.contributions.get(contribution_identifier)
@@ -944,7 +1135,8 @@ class BitRewardsModel(Model):
                 agent.record_income(gated_amount)
                 gain = self.parameters.reputation_gain_per_usage
                 if gain > 0.0:
-                    agent.reputation_score = min(1.0, agent.reputation_score + gain)
+                    payment_count = sum(allocation.payment_count for allocation in allocations)
+                    agent.reputation_score = min(1.0, agent.reputation_score + gain * payment_count)
             else:
                 agent.receive_income(gated_amount)
         contribution_type = contribution.contribution_type
@@ -955,19 +1147,23 @@ class BitRewardsModel(Model):
             return
         self.reward_paid_by_role_this_step[role_name] += gated_amount
         self.total_reward_paid_by_role[role_name] += gated_amount
-        if payout_type is None or source_contribution_id is None:
-            return
         if gated_amount <= 0.0:
             return
-        payout_channel = channel if channel is not None else payout_type
-        self._record_reward_event(
-            step=self.current_step,
-            payout_type=payout_type,
-            amount=gated_amount,
-            recipient_id=owner_identifier,
-            source_contribution_id=source_contribution_id,
-            channel=payout_channel,
-        )
+        paid_fraction = gated_amount / amount
+        for allocation in allocations:
+            if allocation.payout_type is None or allocation.source_contribution_id is None:
+                continue
+            paid = gated_amount if len(allocations) == 1 else allocation.amount * paid_fraction
+            if paid <= 0.0:
+                continue
+            self._record_reward_event(
+                step=self.current_step,
+                payout_type=allocation.payout_type,
+                amount=paid,
+                recipient_id=owner_identifier,
+                source_contribution_id=allocation.source_contribution_id,
+                channel=allocation.channel if allocation.channel is not None else allocation.payout_type,
+            )
 
     def _apply_investor_payout_structure(
         self,
@@ -1040,15 +1236,7 @@ def count_active_agents_for_type(
     model: BitRewardsModel,
     agent_type: Type[EconomicAgent],
 ) -> int:
-    if agent_type is CreatorAgent:
-        agents = model.creators
-    elif agent_type is InvestorAgent:
-        agents = model.investors
-    elif agent_type is UserAgent:
-        agents = model.users
-    else:
-        agents = []
-    return sum(1 for agent in agents if agent.is_active)
+    return model.agent_statistics.active(agent_type)
 
 
 def gini(values: List[float]) -> float:
@@ -1068,8 +1256,7 @@ def gini(values: List[float]) -> float:
 
 
 def creator_wealth_gini(model: BitRewardsModel) -> float:
-    creator_values = [agent.wealth for agent in model.creators]
-    return gini(creator_values)
+    return model.agent_statistics.wealth_gini(CreatorAgent)
 
 
 def investor_mean_roi(model: BitRewardsModel) -> float:
@@ -1085,44 +1272,34 @@ def investor_mean_roi(model: BitRewardsModel) -> float:
 
 
 def mean_creator_satisfaction(model: BitRewardsModel) -> float:
-    return mean_satisfaction(model.creators)
+    return model.agent_statistics.mean_satisfaction(CreatorAgent)
 
 
 def mean_investor_satisfaction(model: BitRewardsModel) -> float:
-    return mean_satisfaction(model.investors)
+    return model.agent_statistics.mean_satisfaction(InvestorAgent)
 
 
 def mean_user_satisfaction(model: BitRewardsModel) -> float:
-    return mean_satisfaction(model.users)
-
-
-def mean_satisfaction(agents: List[EconomicAgent]) -> float:
-    if not agents:
-        return 0.0
-    return sum(agent.satisfaction for agent in agents) / len(agents)
+    return model.agent_statistics.mean_satisfaction(UserAgent)
 
 
 def creator_churned_count(model: BitRewardsModel) -> int:
-    return churned_count(model.creators)
+    return model.agent_statistics.churned(CreatorAgent)
 
 
 def investor_churned_count(model: BitRewardsModel) -> int:
-    return churned_count(model.investors)
+    return model.agent_statistics.churned(InvestorAgent)
 
 
 def user_churned_count(model: BitRewardsModel) -> int:
-    return churned_count(model.users)
-
-
-def churned_count(agents: List[EconomicAgent]) -> int:
-    return sum(1 for agent in agents if not agent.is_active)
+    return model.agent_statistics.churned(UserAgent)
 
 
 def contribution_count_for_type(
     model: BitRewardsModel,
     contribution_type: ContributionType,
 ) -> int:
-    return sum(1 for contribution in model.contributions.values() if contribution.contribution_type is contribution_type)
+    return model.contribution_type_counts.get(contribution_type, 0)
 
 
 def core_research_contribution_count(model: BitRewardsModel) -> int:
@@ -1219,26 +1396,19 @@ def new_users_this_step(model: BitRewardsModel) -> int:
 
 
 def locked_funding_positions(model: BitRewardsModel) -> int:
-    count = 0
-    for contribution in model.contributions.values():
-        if (
-            contribution.contribution_type is ContributionType.FUNDING
-            and getattr(contribution, "lockup_remaining_steps", 0) > 0
-        ):
-            count += 1
-    return count
+    return len(model.locked_funding_expiries)
 
 
 def honor_seal_honest_contribution_count(model: BitRewardsModel) -> int:
-    return sum(1 for c in model.contributions.values() if c.honor_seal_status is HonorSealStatus.HONEST)
+    return model.honor_seal_counts.get(HonorSealStatus.HONEST, 0)
 
 
 def honor_seal_fake_contribution_count(model: BitRewardsModel) -> int:
-    return sum(1 for c in model.contributions.values() if c.honor_seal_status is HonorSealStatus.FAKE)
+    return model.honor_seal_counts.get(HonorSealStatus.FAKE, 0)
 
 
 def honor_seal_dishonored_contribution_count(model: BitRewardsModel) -> int:
-    return sum(1 for c in model.contributions.values() if c.honor_seal_status is HonorSealStatus.DISHONORED)
+    return model.honor_seal_counts.get(HonorSealStatus.DISHONORED, 0)
 
 
 def honor_seal_sealed_usage_share(model: BitRewardsModel) -> float:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+LedgerKey = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+class PayoutAllocation(NamedTuple):
+    payout_type: Optional[str]
+    source_contribution_id: Optional[str]
+    channel: Optional[str]
+    amount: float
+    payment_count: int
+
+
+class PayoutLedger:
+    """Pending payouts aggregated by ``(contribution, payout_type, source, channel)``.
+
+    Amounts and micro-payout counts live in parallel typed arrays indexed by a
+    slot per key, so buffering a credit is a dict lookup and an in-place add.
+    ``drain`` hands the buffered value back grouped by contribution, in the
+    order each contribution first received a credit, and empties the ledger.
+    """
+
+    def __init__(self) -> None:
+        self._slots: Dict[LedgerKey, int] = {}
+        self._keys: List[LedgerKey] = []
+        self._amounts = array("d")
+        self._counts = array("q")
+        self._slots_by_contribution: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    @property
+    def total(self) -> float:
+        return sum(self._amounts)
+
+    def add(
+        self,
+        contribution_id: str,
+        amount: float,
+        payout_type: str | None = None,
+        source_contribution_id: str | None = None,
+        channel: str | None = None,
+    ) -> None:
+        if amount <= 0.0:
+            return
+        key = (contribution_id, payout_type, source_contribution_id, channel)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = len(self._keys)
+            self._slots[key] = slot
+            self._keys.append(key)
+            self._amounts.append(amount)
+            self._counts.append(1)
+            self._slots_by_contribution.setdefault(contribution_id, []).append(slot)
+            return
+        self._amounts[slot] += amount
+        self._counts[slot] += 1
+
+    def pending_for(self, contribution_id: str) -> float:
+        return sum(self._amounts[slot] for slot in self._slots_by_contribution.get(contribution_id, ()))
+
+    def drain(self) -> List[Tuple[str, List[PayoutAllocation]]]:
+        keys, amounts, counts = self._keys, self._amounts, self._counts
+        drained = [
+            (
+                contribution_id,
+                [
+                    PayoutAllocation(keys[slot][1], keys[slot][2], keys[slot][3], amounts[slot], counts[slot])
+                    for slot in slots
+                ],
+            )
+            for contribution_id, slots in self._slots_by_contribution.items()
+        ]
+        self.clear()
+        return drained
+
+    def clear(self) -> None:
+        self._slots = {}
+        self._keys = []
+        self._amounts = array("d")
+        self._counts = array("q")
+        self._slots_by_contribution = {}
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping
+
+from bitrewards_abm.infrastructure.order_statistics import BinnedGini, IncrementalGini
+
+
+class AgentStatistics:
+    """Running per-class counts and sums that back the model reporters.
+
+    Agents register once on construction and then report every change to
+    ``wealth``, ``budget``, ``satisfaction`` and ``is_active`` through their
+    property setters, so reading a statistic never scans the population.
+    Classes listed in ``wealth_trackers`` also keep their wealth distribution
+    in an order-statistics tracker that answers ``wealth_gini`` directly.
+    Wealth changes for those classes only mark the agent dirty, remembering
+    the value the tracker last saw; ``wealth_gini`` applies each dirty agent's
+    net change once, so a read costs at most ``min(agents, changes)`` tracker
+    updates however often wealth moved in between. Only when the tracker's
+    ``prefers_reset`` cost check says those updates would cost more than
+    reloading the whole class is it rebuilt from current wealth instead.
+    ``gini_updates`` and ``gini_reloads`` count which path each read took.
+    """
+
+    def __init__(self, wealth_trackers: Mapping[type, IncrementalGini | BinnedGini] | None = None) -> None:
+        self.wealth_trackers: Dict[type, IncrementalGini | BinnedGini] = dict(wealth_trackers or {})
+        self.agent_count: Dict[type, int] = {}
+        self.active_count: Dict[type, int] = {}
+        self.satisfaction_sum: Dict[type, float] = {}
+        self.total_wealth = 0.0
+        self._pending_wealth: Dict[type, Dict[Any, float]] = {group: {} for group in self.wealth_trackers}
+        self._tracked_agents: Dict[type, List[Any]] = {group: [] for group in self.wealth_trackers}
+        self.gini_updates = 0
+        self.gini_reloads = 0
+
+    def register(self, agent) -> None:
+        group = type(agent)
+        self.agent_count[group] = self.agent_count.get(group, 0) + 1
+        if agent.is_active:
+            self.active_count[group] = self.active_count.get(group, 0) + 1
+        self.satisfaction_sum[group] = self.satisfaction_sum.get(group, 0.0) + agent.satisfaction
+        self.total_wealth += agent.wealth + getattr(agent, "budget", 0.0)
+        tracker = self.wealth_trackers.get(group)
+        if tracker is not None:
+            tracker.add(agent.wealth)
+            self._tracked_agents[group].append(agent)
+
+    def wealth_changed(self, agent, old_value: float, new_value: float) -> None:
+        self.total_wealth += new_value - old_value
+        pending = self._pending_wealth.get(type(agent))
+        if pending is not None and agent not in pending:
+            pending[agent] = old_value
+
+    def budget_changed(self, agent, old_value: float, new_value: float) -> None:
+        self.total_wealth += new_value - old_value
+
+    def satisfaction_changed(self, agent, old_value: float, new_value: float) -> None:
+        group = type(agent)
+        self.satisfaction_sum[group] = self.satisfaction_sum.get(group, 0.0) + new_value - old_value
+
+    def activity_changed(self, agent, is_active: bool) -> None:
+        group = type(agent)
+        self.active_count[group] = self.active_count.get(group, 0) + (1 if is_active else -1)
+
+    def count(self, group: type) -> int:
+        return self.agent_count.get(group, 0)
+
+    def active(self, group: type) -> int:
+        return self.active_count.get(group, 0)
+
+    def churned(self, group: type) -> int:
+        return self.count(group) - self.active(group)
+
+    def wealth_gini(self, group: type) -> float:
+        tracker = self.wealth_trackers.get(group)
+        if tracker is None:
+            return 0.0
+        self._apply_pending_wealth(group, tracker)
+        return tracker.gini()
+
+    def _apply_pending_wealth(self, group: type, tracker: IncrementalGini | BinnedGini) -> None:
+        pending = self._pending_wealth[group]
+        if not pending:
+            return
+        if tracker.prefers_reset(len(pending)):
+            tracker.reset([agent.wealth for agent in self._tracked_agents[group]])
+            self.gini_reloads += 1
+        else:
+            for agent, tracked_value in pending.items():
+                tracker.update(tracked_value, agent.wealth)
+            self.gini_updates += len(pending)
+        pending.clear()
+
+    def mean_satisfaction(self, group: type) -> float:
+        count = self.count(group)
+        if count == 0:
+            return 0.0
+        return self.satisfaction_sum.get(group, 0.0) / count
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import random
+from typing import Callable, Sequence
+
+import pytest
+
+from bitrewards_abm.infrastructure.graph_store import BaseContributionGraph
+
+
+DEFAULT_SPLIT_CHOICES = (0.0, 0.25, 0.5, 0.75)
+
+
+def _build_random_dag(
+    graph: BaseContributionGraph,
+    seed: int,
+    node_count: int = 120,
+    split_choices: Sequence[float] = DEFAULT_SPLIT_CHOICES,
+) -> None:
+    rng = random.Random(seed)
+    for index in range(node_count):
+        node_id = f"c{index}"
+        graph.add_contribution_node(node_id)
+        if index == 0:
+            continue
+        for _ in range(rng.randint(0, 3)):
+            parent_id = f"c{rng.randrange(index)}"
+            edge_type = rng.choice(["derivative", "supporting", "funding"])
+            graph.add_royalty_edge(parent_id, node_id, rng.choice(list(split_choices)), edge_type)
+
+
+@pytest.fixture
+def build_random_dag() -> Callable[..., None]:
+    """Fill a contribution graph with a seeded random DAG of up to three parents per node."""
+    return _build_random_dag
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from textwrap import dedent
+
+import pandas as pd
+import pytest
+
+import experiments.run_batch as run_batch
+from bitrewards_abm.experiment.adaptive import AdaptiveScheduler, confidence_half_width, t_quantile
+from bitrewards_abm.experiment.config import AdaptiveReplication
+from bitrewards_abm.experiment.shards import RunShardStore
+
+
+def _write_config(tmp_path: Path) -> Path:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 4
+        investor_count = 1
+        user_count = 6
+        max_steps = 8
+
+        [experiment]
+        name = "adaptive"
+        random_seed_base = 5
+
+        [experiment.adaptive]
+        metrics = ["creator_wealth_gini"]
+        target_half_width = 0.1
+        min_reps = 3
+        max_reps = 12
+
+        [experiment.sweeps]
+        creator_base_contribution_probability = [0.2, 0.5]
+        """
+    ).strip()
+    config_path = tmp_path / "adaptive.toml"
+    config_path.write_text(config_text)
+    return config_path
+
+
+def test_t_quantile_matches_tables() -> None:
+    assert t_quantile(0.975, 1) == pytest.approx(12.7062, rel=1e-4)
+    assert t_quantile(0.975, 2) == pytest.approx(4.3027, rel=1e-4)
+    assert t_quantile(0.975, 4) == pytest.approx(2.7764, rel=1e-3)
+    assert t_quantile(0.975, 10) == pytest.approx(2.2281, rel=1e-4)
+    assert confidence_half_width([1.0, 2.0, 3.0], 0.95) == pytest.approx(4.3027 / 3**0.5, rel=1e-4)
+
+
+def test_scheduler_stops_each_point_at_its_own_precision() -> None:
+    settings = AdaptiveReplication(metrics=["roi"], target_half_width={"roi": 0.5}, min_reps=4, max_reps=200)
+    scheduler = AdaptiveScheduler(settings, point_count=3)
+    spreads = [0.0, 1.0, 50.0]
+    rng = random.Random(1)
+    rounds = 0
+    while slots := scheduler.next_round():
+        rounds += 1
+        for point, rep in slots:
+            scheduler.record(point, rep, {"roi": rng.gauss(0.0, spreads[point])})
+
+    assert scheduler.reps(0) == 4
+    assert scheduler.converged(1)
+    # Roughly (1.96 * 1.0 / 0.5) ** 2 = 16 reps, reached without overshooting far.
+    assert 10 <= scheduler.reps(1) <= 30
+    assert scheduler.reps(2) == 200
+    assert not scheduler.converged(2)
+    assert rounds > 2
+
+
+def test_scheduler_keeps_antithetic_pairs_together() -> None:
+    settings = AdaptiveReplication(metrics=["roi"], target_half_width={"roi": 0.01}, min_reps=6, max_reps=10)
+    scheduler = AdaptiveScheduler(settings, point_count=1, rep_step=2)
+    slots = scheduler.next_round()
+    assert slots == [(0, rep) for rep in range(6)]
+    for point, rep in slots:
+        scheduler.record(point, rep, {"roi": float(rep // 2)})
+    assert scheduler.half_widths(0)["roi"] == pytest.approx(confidence_half_width([0.0, 1.0, 2.0], 0.95))
+    assert len(scheduler.next_round()) % 2 == 0
+
+
+def test_adaptive_batch_records_precision_and_resumes(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path)
+    out_dir = tmp_path / "out"
+    summary_df, _ = run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+
+    for _, point in summary_df.groupby("creator_base_contribution_probability"):
+        reps = point["adaptive_reps"].iloc[0]
+        assert sorted(point["rep"]) == list(range(reps))
+        assert 3 <= reps <= 12
+        width = point["ci_half_width_creator_wealth_gini"].iloc[0]
+        assert width == pytest.approx(confidence_half_width(point["creator_wealth_gini"].tolist(), 0.95))
+        assert point["adaptive_converged"].iloc[0] == (width <= 0.1)
+    expected = {name: (out_dir / name).read_bytes() for name in ("timeseries.csv", "run_summary.csv")}
+    assert list(pd.read_csv(out_dir / "run_summary.csv")["run_id"]) == list(range(len(summary_df)))
+
+    store = RunShardStore(out_dir / "shards")
+    lines = store.manifest_path.read_text().splitlines(keepends=True)
+    store.manifest_path.write_text("".join(lines[:4]))
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir, resume=True)
+
+    for name, content in expected.items():
+        assert (out_dir / name).read_bytes() == content
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pandas as pd
+
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.collector import SparseAgentRecorder, reconstruct_dense_agent_vars
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def _agent(unique_id: int, wealth: float, kind: str = "CreatorAgent") -> SimpleNamespace:
+    return SimpleNamespace(unique_id=unique_id, wealth=wealth, kind=kind)
+
+
+def test_agent_recording_is_off_by_default() -> None:
+    model = BitRewardsModel(parameters=SimulationParameters(creator_count=2, investor_count=1, user_count=2, max_steps=3))
+    for _ in range(3):
+        model.step()
+    assert model.datacollector.agent_recorder is None
+    assert model.datacollector.get_agent_vars_dataframe().empty
+
+
+def test_sparse_recorder_keeps_only_changed_rows_with_categorical_type() -> None:
+    recorder = SparseAgentRecorder({"wealth": "wealth", "agent_type": "kind"})
+    agents = [_agent(1, 0.0), _agent(2, 5.0, "UserAgent")]
+    recorder.record(1, agents)
+    recorder.record(2, agents)
+    agents[0].wealth = 3.0
+    recorder.record(3, agents)
+
+    sparse = recorder.to_dataframe()
+    assert list(sparse.index) == [(1, 1), (1, 2), (3, 1)]
+    assert isinstance(sparse["agent_type"].dtype, pd.CategoricalDtype)
+    assert list(sparse["agent_type"].cat.categories) == ["CreatorAgent", "UserAgent"]
+
+    dense = reconstruct_dense_agent_vars(sparse, recorded_steps=recorder.steps)
+    assert len(dense) == 6
+    assert dense.loc[(2, 1), "wealth"] == 0.0
+    assert dense.loc[(3, 1), "wealth"] == 3.0
+    assert dense.loc[(3, 2), "agent_type"] == "UserAgent"
+
+
+def test_reconstructed_agent_view_matches_final_model_state() -> None:
+    params = SimulationParameters(
+        creator_count=4,
+        investor_count=2,
+        user_count=6,
+        max_steps=12,
+        record_agents=True,
+    )
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    collector = model.datacollector
+
+    sparse = collector.get_agent_vars_dataframe()
+    dense = collector.reconstruct_agent_vars_dataframe()
+    assert len(sparse) < len(dense)
+    assert sorted(dense.index.get_level_values("Step").unique()) == collector.agent_recorder.steps
+
+    final = collector.reconstruct_agent_vars_dataframe(steps=[params.max_steps]).loc[params.max_steps]
+    for agent in model.agents:
+        row = final.loc[agent.unique_id]
+        assert row["wealth"] == agent.wealth
+        assert row["satisfaction"] == agent.satisfaction
+        assert bool(row["active"]) == agent.is_active
+        assert row["agent_type"] == type(agent).__name__
@@ -4,7 +4,7 @@ import math
 
 from bitrewards_abm.domain.entities import ContributionType
 from bitrewards_abm.domain.parameters import SimulationParameters
-from bitrewards_abm.simulation.model import BitRewardsModel
+from bitrewards_abm.simulation.model import BitRewardsModel, locked_funding_positions
 
 
 def test_creator_arrivals_are_positive_with_nonzero_lambda() -> None:
@@ -104,3 +104,62 @@ def test_payout_lag_delays_income_until_flush() -> None:
             assert math.isclose(creator.wealth, 0.0, rel_tol=1e-9, abs_tol=1e-9)
         if step == 2:
             assert math.isclose(creator.wealth, total_fee * 2, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_locked_funding_positions_expire_from_calendar() -> None:
+    parameters = SimulationParameters(
+        creator_count=1,
+        investor_count=1,
+        user_count=0,
+        creator_base_contribution_probability=0.0,
+        funding_min_amount=1.0,
+        funding_max_amount=1.0,
+        funding_lockup_period_steps=2,
+    )
+    model = BitRewardsModel(parameters=parameters)
+    target = model.register_creator_contribution(
+        creator=model.creators[0],
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=1.0,
+        parent_identifier=None,
+    )
+    first = model.register_funding_contribution(investor=model.investors[0], target_identifier=target)
+    model._decrement_funding_lockups(unlock=False)
+    second = model.register_funding_contribution(investor=model.investors[0], target_identifier=target)
+    assert locked_funding_positions(model) == 2
+    assert model.funding_lockup_remaining(model.contributions[first]) == 1
+    model._decrement_funding_lockups(unlock=False)
+    assert set(model.locked_funding_expiries) == {second}
+    assert model.funding_lockup_remaining(model.contributions[first]) == 0
+    model._decrement_funding_lockups(unlock=False)
+    assert locked_funding_positions(model) == 0
+
+
+def test_escrowed_rewards_release_on_their_calendar_tick() -> None:
+    parameters = SimulationParameters(
+        creator_count=1,
+        investor_count=1,
+        user_count=0,
+        creator_base_contribution_probability=0.0,
+        payout_lag_steps=0,
+    )
+    model = BitRewardsModel(parameters=parameters)
+    investor = model.investors[0]
+    target = model.register_creator_contribution(
+        creator=model.creators[0],
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=1.0,
+        parent_identifier=None,
+    )
+    funding = model.register_funding_contribution(investor=investor, target_identifier=target)
+    wealth_start = investor.wealth
+    model._credit_reward(funding, 2.0, lockup_steps=2, payout_type="gas", source_contribution_id=target)
+    model._unlock_all_escrows()
+    model._credit_reward(funding, 3.0, lockup_steps=1, payout_type="gas", source_contribution_id=target)
+    assert [entry.amount for entry in model.escrowed_rewards_for(investor.unique_id)] == [2.0, 3.0]
+    assert list(model.escrow_calendar) == [3]
+    model._unlock_all_escrows()
+    assert math.isclose(investor.wealth, wealth_start, rel_tol=1e-9, abs_tol=1e-9)
+    model._unlock_all_escrows()
+    assert math.isclose(investor.wealth, wealth_start + 5.0, rel_tol=1e-9, abs_tol=1e-9)
+    assert model.escrow_calendar == {}
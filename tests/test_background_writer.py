@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from textwrap import dedent
+
+import pandas as pd
+import pytest
+
+from bitrewards_abm.infrastructure.writer import BackgroundWriter
+from bitrewards_abm.simulation.events import ChunkedFileEventSink, read_event_log
+from experiments.run_batch import run_experiments_for_config
+
+
+def test_writer_runs_tasks_in_order_and_counts_blocked_time() -> None:
+    release = threading.Event()
+    written: list[int] = []
+
+    def slow_write(value: int) -> None:
+        release.wait()
+        written.append(value)
+
+    writer = BackgroundWriter(max_pending=1)
+    writer.submit(slow_write, 0)
+    writer.submit(slow_write, 1)
+    threading.Timer(0.05, release.set).start()
+    writer.submit(slow_write, 2)
+    writer.close()
+
+    assert written == [0, 1, 2]
+    assert writer.blocked_seconds >= 0.04
+    assert writer.stats()["submitted"] == 3
+
+
+def test_writer_reraises_task_errors_and_skips_later_tasks() -> None:
+    written: list[int] = []
+
+    def fail() -> None:
+        raise OSError("disk full")
+
+    writer = BackgroundWriter(max_pending=4)
+    writer.submit(fail)
+    writer.submit(written.append, 1)
+    with pytest.raises(OSError):
+        writer.wait()
+    writer.close()
+    assert written == []
+
+
+def test_event_sink_with_background_writer_matches_inline_writes(tmp_path: Path) -> None:
+    columns = {"step": "int", "label": "category", "amount": "float"}
+    writer = BackgroundWriter(max_pending=2)
+    threaded = ChunkedFileEventSink(tmp_path / "threaded.events", columns, chunk_size=3, writer=writer)
+    inline = ChunkedFileEventSink(tmp_path / "inline.events", columns, chunk_size=3)
+    for index in range(10):
+        row = (index, f"c{index % 4}", index / 10.0)
+        threaded.append(*row)
+        inline.append(*row)
+    assert len(threaded.to_dataframe()) == 10
+    threaded.close()
+    inline.close()
+    writer.close()
+
+    pd.testing.assert_frame_equal(read_event_log(threaded.path), read_event_log(inline.path))
+    assert writer.submitted >= 4
+
+
+def test_run_batch_background_writer_produces_same_csv(tmp_path: Path) -> None:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 3
+        investor_count = 1
+        user_count = 5
+        max_steps = 6
+
+        [experiment]
+        name = "writer"
+        runs_per_config = 2
+        random_seed_base = 11
+
+        [experiment.sweeps]
+        gas_fee_share_rate = [0.002, 0.004]
+        """
+    ).strip()
+    config_path = tmp_path / "writer.toml"
+    config_path.write_text(config_text)
+
+    _, timeseries_df = run_experiments_for_config(config_path, out_dir=tmp_path / "threaded", writer_queue=2)
+    written = pd.read_csv(tmp_path / "threaded" / "timeseries.csv")
+
+    assert list(written.columns) == list(timeseries_df.columns)
+    assert len(written) == len(timeseries_df)
+    assert written["run_id"].tolist() == timeseries_df["run_id"].tolist()
+    assert (tmp_path / "threaded" / "run_summary.csv").exists()
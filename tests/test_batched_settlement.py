@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from bitrewards_abm.analysis.visualization import true_ancestor_reward_totals
+from bitrewards_abm.domain.entities import ContributionType
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.infrastructure.graph_store import ContributionGraph
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+@pytest.mark.parametrize("mode", ["single_path", "proportional_50_50"])
+def test_sweep_matches_sum_of_per_root_distributions(mode: str, build_random_dag) -> None:
+    graph = ContributionGraph()
+    build_random_dag(graph, seed=3)
+    rng = random.Random(8)
+    pools = {f"c{index}": rng.uniform(0.5, 4.0) for index in rng.sample(range(120), 60)}
+    expected: dict[str, float] = {}
+    for root_id, value in pools.items():
+        for recipient, amount in graph.compute_royalty_shares(root_id, value, mode=mode, keep_fraction=0.5).items():
+            expected[recipient] = expected.get(recipient, 0.0) + amount
+    settled = graph.settle_royalty_pools(pools, mode=mode, keep_fraction=0.5)
+    assert set(settled) == set(expected)
+    for recipient, amount in expected.items():
+        assert math.isclose(settled[recipient], amount, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def settle_chain(settlement_mode: str) -> BitRewardsModel:
+    params = SimulationParameters(
+        creator_count=2,
+        investor_count=0,
+        user_count=0,
+        royalty_settlement_mode=settlement_mode,
+        tracing_accuracy=1.0,
+        tracing_false_positive_rate=0.0,
+        creator_base_contribution_probability=0.0,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    first, second = model.creators
+    parent = None
+    chain = []
+    for index in range(6):
+        parent = model.register_creator_contribution(
+            creator=first if index % 2 == 0 else second,
+            contribution_type=ContributionType.CORE_RESEARCH,
+            quality=0.8,
+            parent_identifier=parent,
+        )
+        chain.append(parent)
+    for index, identifier in enumerate(chain):
+        model._accrue_royalty(model.contributions[identifier], float(index + 1))
+    model._distribute_batched_royalties()
+    return model
+
+
+def test_sweep_settlement_pays_same_royalty_totals_as_per_root() -> None:
+    per_root = settle_chain("per_root")
+    sweep = settle_chain("sweep")
+    for expected, actual in zip(per_root.creators, sweep.creators):
+        assert math.isclose(actual.cumulative_income, expected.cumulative_income, rel_tol=1e-9)
+    assert all(contribution.accrued_royalty_value == 0.0 for contribution in sweep.contributions.values())
+    per_root_events = [event for event in per_root.reward_events if event["payout_type"] == "royalty"]
+    sweep_events = [event for event in sweep.reward_events if event["payout_type"] == "royalty"]
+    def by_recipient_and_source(events: list[dict]) -> dict[tuple[int, str], float]:
+        totals: dict[tuple[int, str], float] = {}
+        for event in events:
+            key = (event["recipient_id"], event["source_contribution_id"])
+            totals[key] = totals.get(key, 0.0) + event["amount"]
+        return totals
+
+    expected = by_recipient_and_source(per_root_events)
+    actual = by_recipient_and_source(sweep_events)
+    assert set(actual) == set(expected)
+    for key, amount in expected.items():
+        assert math.isclose(actual[key], amount, rel_tol=1e-9)
+
+
+@pytest.mark.parametrize("mode", ["single_path", "proportional_50_50"])
+def test_sourced_sweep_matches_each_root_distribution(mode: str, build_random_dag) -> None:
+    graph = ContributionGraph()
+    build_random_dag(graph, seed=5)
+    rng = random.Random(2)
+    pools = {f"c{index}": rng.uniform(0.5, 4.0) for index in rng.sample(range(120), 60)}
+    settled = graph.settle_royalty_pools_by_source(pools, mode=mode, keep_fraction=0.5)
+    assert list(settled) == list(pools)
+    for root_id, value in pools.items():
+        expected = graph.compute_royalty_shares(root_id, value, mode=mode, keep_fraction=0.5)
+        assert set(settled[root_id]) == set(expected)
+        for recipient, amount in expected.items():
+            assert math.isclose(settled[root_id][recipient], amount, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_sweep_keeps_tracing_panel_totals_of_per_root_settlement() -> None:
+    def tracing_totals(settlement_mode: str) -> tuple[float, float]:
+        params = SimulationParameters(
+            creator_count=8,
+            investor_count=2,
+            user_count=20,
+            max_steps=30,
+            royalty_batch_interval=5,
+            royalty_settlement_mode=settlement_mode,
+            tracing_accuracy=0.6,
+            tracing_false_positive_rate=0.5,
+            disable_churn=True,
+        )
+        model = BitRewardsModel(parameters=params, seed=4)
+        for _ in range(params.max_steps):
+            model.step()
+        return true_ancestor_reward_totals(model.reward_events.iter_chunks(), model)
+
+    per_root = tracing_totals("per_root")
+    sweep = tracing_totals("sweep")
+    assert per_root[0] > 0.0 and per_root[1] > 0.0
+    for expected, actual in zip(per_root, sweep):
+        assert math.isclose(actual, expected, rel_tol=1e-9)
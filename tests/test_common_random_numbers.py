@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+
+import pandas as pd
+import pytest
+
+import experiments.run_batch as run_batch
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.experiment.config import load_experiment_configuration
+from bitrewards_abm.experiment.variance_reduction import paired_difference_report
+from bitrewards_abm.infrastructure.random_streams import SubstreamRandom
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def _write_config(tmp_path: Path, extra: str) -> Path:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 4
+        investor_count = 1
+        user_count = 6
+        max_steps = 8
+
+        [experiment]
+        name = "crn"
+        runs_per_config = 4
+        random_seed_base = 50
+        {extra}
+
+        [experiment.sweeps]
+        creator_base_contribution_probability = [0.3, 0.4]
+        """
+    ).format(extra=extra).strip()
+    config_path = tmp_path / "crn.toml"
+    config_path.write_text(config_text)
+    return config_path
+
+
+def test_common_random_numbers_reuse_seeds_across_sweep_points(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path, "common_random_numbers = true\nantithetic_pairs = true")
+    parameters, experiment_config = load_experiment_configuration(config_path)
+    tasks = run_batch.run_tasks_for_config(experiment_config)
+
+    assert parameters.rng_streams == "per_subsystem"
+    assert [task.seed for task in tasks] == [50, 50, 52, 52] * 2
+    assert [task.parameter_overrides["rng_antithetic"] for task in tasks] == [False, True] * 4
+
+
+def test_antithetic_stream_mirrors_plain_stream() -> None:
+    plain = SubstreamRandom("7/usage")
+    mirrored = SubstreamRandom("7/usage", antithetic=True)
+    for _ in range(50):
+        assert plain.random() + mirrored.random() == pytest.approx(1.0)
+        assert plain.randrange(10) + mirrored.randrange(10) == 9
+        assert plain.gauss(1.0, 2.0) - 1.0 == pytest.approx(1.0 - mirrored.gauss(1.0, 2.0))
+
+
+def test_subsystem_streams_stay_aligned_when_other_draw_counts_change() -> None:
+    def creator_skills_and_roles(probability: float) -> list[tuple[float, str]]:
+        parameters = SimulationParameters(
+            creator_count=5,
+            max_steps=10,
+            creator_arrival_rate=1.0,
+            creator_base_contribution_probability=probability,
+            rng_streams="per_subsystem",
+        )
+        model = BitRewardsModel(parameters, seed=3)
+        for _ in range(parameters.max_steps):
+            model.step()
+        return [(creator.skill, creator.role) for creator in model.creators]
+
+    # Contribution draws differ, but population and arrival draws do not.
+    assert creator_skills_and_roles(0.2) == creator_skills_and_roles(0.6)
+
+
+def test_antithetic_runs_require_subsystem_streams() -> None:
+    with pytest.raises(ValueError):
+        BitRewardsModel(SimulationParameters(rng_antithetic=True), seed=1)
+
+
+def test_paired_difference_report_measures_reduction() -> None:
+    shared_noise = [0.0, 4.0, -3.0, 8.0]
+    summary = pd.DataFrame(
+        {
+            "rate": [0.1] * 4 + [0.2] * 4,
+            "rep": list(range(4)) * 2,
+            "treasury_balance": [10.0 + noise for noise in shared_noise] + [12.0 + noise for noise in shared_noise],
+        }
+    )
+    report = paired_difference_report(summary, ["rate"], metrics=["treasury_balance"])
+
+    row = report.iloc[0]
+    assert row["comparison"] == "rate=0.2 vs rate=0.1"
+    assert row["mean_difference"] == pytest.approx(2.0)
+    assert row["std_error"] == pytest.approx(0.0)
+    assert row["variance_reduction"] == pytest.approx(1.0)
+
+
+def test_batch_writes_variance_reduction_report(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path, "common_random_numbers = true")
+    out_dir = tmp_path / "out"
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+
+    report = pd.read_csv(out_dir / "variance_reduction.csv")
+    assert set(report["units"]) == {4}
+    assert set(report["comparison"]) == {
+        "creator_base_contribution_probability=0.4 vs creator_base_contribution_probability=0.3"
+    }
+    assert "total_income_creators" in set(report["metric"])
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.collector import ArrayDataCollector
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def test_record_every_keeps_interval_steps_and_final_step() -> None:
+    params = SimulationParameters(creator_count=3, investor_count=1, user_count=5, max_steps=23, record_every=5)
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    df = model.datacollector.get_model_vars_dataframe()
+    assert df["step"].tolist() == [5, 10, 15, 20, 23]
+    assert list(df.index) == list(range(5))
+    assert df["contribution_count"].dtype == "int64"
+    assert df["treasury_balance"].dtype == "float64"
+
+
+def test_recorded_columns_limit_model_reporters() -> None:
+    params = SimulationParameters(
+        creator_count=3,
+        investor_count=1,
+        user_count=5,
+        max_steps=4,
+        recorded_columns=["step", "treasury_balance"],
+    )
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    df = model.datacollector.get_model_vars_dataframe()
+    assert list(df.columns) == ["step", "treasury_balance"]
+    assert len(df) == 4
+
+
+def test_collector_grows_past_capacity_and_widens_int_columns() -> None:
+    class Probe:
+        current_step = 0
+        agents: list = []
+
+    values = iter([1, 2, 3.5, 4])
+    collector = ArrayDataCollector(
+        {"step": lambda probe: probe.current_step, "value": lambda probe: next(values)},
+        capacity=1,
+    )
+    probe = Probe()
+    for step in range(1, 5):
+        probe.current_step = step
+        collector.collect(probe)
+    df = collector.get_model_vars_dataframe()
+    assert df["step"].tolist() == [1, 2, 3, 4]
+    assert df["value"].tolist() == [1.0, 2.0, 3.5, 4.0]
+    assert df["value"].dtype == "float64"
+
+
+def test_unknown_recorded_column_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        BitRewardsModel(parameters=SimulationParameters(recorded_columns=["not_a_reporter"]))
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitrewards_abm.analysis.metrics import collect_metrics_from_model
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.events import (
+    ChunkedFileEventSink,
+    EventBuffer,
+    build_event_sink,
+    read_event_chunks,
+    read_event_log,
+)
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def test_event_buffer_grows_and_round_trips_rows() -> None:
+    buffer = EventBuffer({"step": "int", "label": "category", "user": "optional_int", "amount": "float"})
+    rows = [(0, "gas", 4, 1.5), (1, "royalty", None, 2.0), (1, "gas", 7, 0.25)]
+    for row in rows:
+        buffer.append(*row)
+
+    assert len(buffer) == 3
+    assert [tuple(event.values()) for event in buffer] == rows
+    assert buffer.categories("label") == ["gas", "royalty"]
+
+    frame = buffer.to_dataframe()
+    assert list(frame.columns) == ["step", "label", "user", "amount"]
+    assert isinstance(frame["label"].dtype, pd.CategoricalDtype)
+    assert frame["user"].isna().tolist() == [False, True, False]
+    assert frame["amount"].tolist() == [1.5, 2.0, 0.25]
+
+    buffer.append(2, "gas", 1, 3.0)
+    assert len(frame) == 3
+    assert frame["amount"].tolist() == [1.5, 2.0, 0.25]
+
+
+def test_closed_event_buffer_hands_out_views_instead_of_copies() -> None:
+    buffer = EventBuffer({"step": "int", "user": "optional_int", "amount": "float"})
+    for step in range(4):
+        buffer.append(step, None if step == 2 else step * 10, step * 0.5)
+    assert not np.shares_memory(buffer.column("amount"), buffer.column("amount"))
+
+    buffer.close()
+    frame = buffer.to_dataframe()
+    assert np.shares_memory(buffer.column("amount"), buffer.column("amount"))
+    assert np.shares_memory(frame["step"].to_numpy(), buffer.column("step"))
+    assert frame["user"].isna().tolist() == [False, False, True, False]
+    with pytest.raises(ValueError):
+        buffer.append(4, 40, 2.0)
+
+
+def test_event_buffer_rejects_wrong_arity_and_unknown_kinds() -> None:
+    buffer = EventBuffer({"step": "int", "amount": "float"})
+    with pytest.raises(ValueError):
+        buffer.append(1)
+    with pytest.raises(ValueError):
+        EventBuffer({"step": "bytes"})
+
+
+def test_metrics_keep_event_columns_from_model_buffers() -> None:
+    params = SimulationParameters(creator_count=4, investor_count=2, user_count=8, max_steps=10)
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    metrics = collect_metrics_from_model(model)
+
+    assert list(metrics.reward_events.columns) == [
+        "step",
+        "payout_type",
+        "channel",
+        "amount",
+        "recipient_id",
+        "recipient_role",
+        "source_contribution_id",
+    ]
+    assert list(metrics.usage_events.columns) == ["step", "contribution_id", "user_id", "gross_value"]
+    assert len(metrics.reward_events) == len(model.reward_events) > 0
+    assert metrics.role_income_by_step["amount"].sum() == pytest.approx(metrics.reward_events["amount"].sum())
+
+
+def test_chunked_file_sink_streams_back_what_was_appended(tmp_path) -> None:
+    columns = {"step": "int", "label": "category", "user": "optional_int", "amount": "float"}
+    sink = ChunkedFileEventSink(tmp_path / "events.events", columns, chunk_size=4)
+    memory = EventBuffer(columns)
+    for index in range(11):
+        row = (index // 3, f"c{index % 5}", None if index % 4 == 0 else index, index * 0.5)
+        sink.append(*row)
+        memory.append(*row)
+        assert len(sink._buffer) < sink.chunk_size
+
+    chunks = list(sink.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+    assert len(sink) == 11
+    sink.close()
+
+    expected = memory.to_dataframe()
+    loaded = read_event_log(sink.path)
+    assert list(loaded["label"].cat.categories) == list(expected["label"].cat.categories)
+    pd.testing.assert_frame_equal(loaded, expected)
+    streamed = pd.concat(list(read_event_chunks(sink.path)), ignore_index=True)
+    assert streamed["label"].astype(str).tolist() == expected["label"].astype(str).tolist()
+    assert streamed["user"].isna().tolist() == expected["user"].isna().tolist()
+
+
+def test_disk_sink_without_a_path_removes_its_temporary_file_on_close(tmp_path) -> None:
+    sink = build_event_sink("disk", {"step": "int", "amount": "float"}, chunk_size=2)
+    for step in range(5):
+        sink.append(step, step * 0.5)
+    assert sink.to_dataframe()["amount"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert sink.path.exists()
+    sink.close()
+    assert not sink.path.exists()
+
+    kept = build_event_sink("disk", {"step": "int"}, path=tmp_path / "kept.events")
+    kept.append(1)
+    kept.close()
+    assert read_event_log(tmp_path / "kept.events")["step"].tolist() == [1]
+
+
+def test_disk_event_log_metrics_stream_without_loading_events(tmp_path) -> None:
+    params = SimulationParameters(
+        creator_count=4,
+        investor_count=2,
+        user_count=8,
+        max_steps=10,
+        event_log_mode="disk",
+        event_log_dir=str(tmp_path),
+        event_log_chunk_size=16,
+    )
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    model.close_event_logs()
+
+    metrics = collect_metrics_from_model(model, load_events=False)
+    assert metrics.reward_events.empty
+    assert (tmp_path / "reward_events.events").exists()
+    rewards = read_event_log(tmp_path / "reward_events.events")
+    assert len(rewards) == len(model.reward_events) > 16
+    assert sum(len(chunk) for chunk in metrics.iter_reward_event_chunks()) == len(rewards)
+    assert metrics.role_income_by_step["amount"].sum() == pytest.approx(rewards["amount"].sum())
+    assert metrics.gas_vs_royalty_by_role["amount"].sum() == pytest.approx(rewards["amount"].sum())
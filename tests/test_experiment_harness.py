@@ -49,3 +49,37 @@ def test_experiment_harness_writes_outputs(tmp_path: Path) -> None:
     assert "run_id" in timeseries_df.columns
     assert "run_id" in summary_df.columns
     assert summary_df["run_id"].nunique() == 1
+
+
+def test_parallel_workers_match_serial_outputs(tmp_path: Path) -> None:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 3
+        investor_count = 1
+        user_count = 5
+        max_steps = 8
+
+        [experiment]
+        name = "parallel"
+        runs_per_config = 2
+        random_seed_base = 40
+
+        [experiment.sweeps]
+        gas_fee_share_rate = [0.002, 0.004]
+        funding_split_fraction = [0.01, 0.02]
+        """
+    ).strip()
+    config_path = tmp_path / "parallel.toml"
+    config_path.write_text(config_text)
+
+    serial_summary, serial_timeseries = run_experiments_for_config(config_path, out_dir=tmp_path / "serial")
+    parallel_summary, parallel_timeseries = run_experiments_for_config(
+        config_path, out_dir=tmp_path / "parallel", workers=3
+    )
+
+    assert parallel_summary["run_id"].tolist() == list(range(8))
+    pd.testing.assert_frame_equal(parallel_summary, serial_summary)
+    pd.testing.assert_frame_equal(parallel_timeseries, serial_timeseries)
+    for name in ("timeseries.csv", "run_summary.csv"):
+        assert (tmp_path / "parallel" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import math
+
+from bitrewards_abm.domain.entities import ContributionType
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def run_usage_step(gas_settlement_mode: str) -> BitRewardsModel:
+    params = SimulationParameters(
+        creator_count=2,
+        investor_count=0,
+        user_count=0,
+        gas_fee_share_rate=0.2,
+        treasury_fee_rate=0.1,
+        tracing_accuracy=1.0,
+        tracing_false_positive_rate=0.0,
+        creator_base_contribution_probability=0.0,
+        gas_settlement_mode=gas_settlement_mode,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    first, second = model.creators
+    root = model.register_creator_contribution(
+        creator=first,
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=1.0,
+        parent_identifier=None,
+    )
+    child = model.register_creator_contribution(
+        creator=second,
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=1.0,
+        parent_identifier=root,
+    )
+    model.reset_step_internal_state()
+    for gross_value in (1.0, 2.0, 0.5, 4.0):
+        model.register_usage_event(contribution_identifier=child, gross_value=gross_value)
+    model.register_usage_event(contribution_identifier=root, gross_value=3.0)
+    model.distribute_usage_event_fees()
+    return model
+
+
+def test_per_step_gas_settlement_pays_same_totals_with_one_traversal_per_contribution() -> None:
+    per_event = run_usage_step("per_event")
+    per_step = run_usage_step("per_step")
+    for expected, actual in zip(per_event.creators, per_step.creators):
+        assert math.isclose(actual.wealth, expected.wealth, rel_tol=1e-9)
+    assert math.isclose(per_step.treasury.balance, per_event.treasury.balance, rel_tol=1e-9)
+    assert math.isclose(per_step.total_fee_distributed_this_step, per_event.total_fee_distributed_this_step, rel_tol=1e-9)
+    assert per_step.total_usage_events_this_step == per_event.total_usage_events_this_step == 5
+    assert len(per_step.reward_events) == 3
+    assert len(per_event.reward_events) == 9
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from bitrewards_abm.infrastructure.graph_store import (
+    ArrayContributionGraph,
+    ContributionGraph,
+    build_contribution_graph,
+)
+
+
+# Adds a small split so near-zero shares are compared too.
+SPLIT_CHOICES = (0.0, 0.02, 0.25, 0.5, 0.75)
+
+
+@pytest.mark.parametrize("mode", ["single_path", "proportional_50_50"])
+def test_array_backend_matches_networkx_bit_for_bit(mode: str, build_random_dag) -> None:
+    networkx_graph = ContributionGraph()
+    array_graph = ArrayContributionGraph()
+    build_random_dag(networkx_graph, seed=11, node_count=150, split_choices=SPLIT_CHOICES)
+    build_random_dag(array_graph, seed=11, node_count=150, split_choices=SPLIT_CHOICES)
+    for index in range(150):
+        node_id = f"c{index}"
+        expected = networkx_graph.compute_royalty_shares(node_id, 3.7, mode=mode, keep_fraction=0.5)
+        actual = array_graph.compute_royalty_shares(node_id, 3.7, mode=mode, keep_fraction=0.5)
+        assert list(actual.items()) == list(expected.items())
+
+
+def test_array_backend_updates_duplicate_edges_in_place() -> None:
+    graph = ArrayContributionGraph()
+    graph.add_parent_child_edge("p", "c", split_fraction=0.2)
+    graph.add_parent_child_edge("q", "c", split_fraction=0.3, edge_type="funding")
+    graph.add_parent_child_edge("p", "c", split_fraction=0.6)
+    assert graph.get_parents("c") == ["p", "q"]
+    assert graph.get_split_fraction("p", "c") == 0.6
+    assert graph.get_edge_type("q", "c") == "funding"
+    exported = graph.to_networkx()
+    assert exported["p"]["c"]["royalty_percent"] == 0.6
+    assert set(exported.nodes) == {"p", "c", "q"}
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        build_contribution_graph("sqlite")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+
+from bitrewards_abm.domain.entities import ContributionType, HonorSealStatus
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.agents import EconomicAgent
+from bitrewards_abm.simulation.model import (
+    BitRewardsModel,
+    active_creator_count,
+    contribution_count_for_type,
+    honor_seal_dishonored_contribution_count,
+    honor_seal_fake_contribution_count,
+    honor_seal_honest_contribution_count,
+    investor_churned_count,
+    mean_user_satisfaction,
+    total_wealth,
+)
+
+
+# Full scans the counter-backed reporters replaced, kept as reference implementations.
+def mean_satisfaction(agents: list[EconomicAgent]) -> float:
+    if not agents:
+        return 0.0
+    return sum(agent.satisfaction for agent in agents) / len(agents)
+
+
+def churned_count(agents: list[EconomicAgent]) -> int:
+    return sum(1 for agent in agents if not agent.is_active)
+
+
+def test_incremental_reporters_match_full_scans() -> None:
+    params = SimulationParameters(
+        creator_count=12,
+        investor_count=4,
+        user_count=20,
+        max_steps=60,
+        honor_seal_enabled=True,
+        honor_seal_initial_adoption_rate=1.0,
+        honor_seal_fake_rate=1.0,
+        honor_seal_fake_detection_prob_per_step=0.1,
+        creator_arrival_rate=0.5,
+        user_arrival_rate=0.5,
+        identity_creation_cost=0.01,
+        satisfaction_churn_window=5,
+        roi_churn_window=5,
+        satisfaction_noise_std=0.05,
+    )
+    model = BitRewardsModel(parameters=params)
+    for _ in range(params.max_steps):
+        model.step()
+    contributions = list(model.contributions.values())
+    for contribution_type in ContributionType:
+        expected = sum(1 for c in contributions if c.contribution_type is contribution_type)
+        assert contribution_count_for_type(model, contribution_type) == expected
+    assert honor_seal_honest_contribution_count(model) == sum(
+        1 for c in contributions if c.honor_seal_status is HonorSealStatus.HONEST
+    )
+    assert honor_seal_fake_contribution_count(model) == sum(
+        1 for c in contributions if c.honor_seal_status is HonorSealStatus.FAKE
+    )
+    assert honor_seal_dishonored_contribution_count(model) == sum(
+        1 for c in contributions if c.honor_seal_status is HonorSealStatus.DISHONORED
+    )
+    assert active_creator_count(model) == sum(1 for agent in model.creators if agent.is_active)
+    assert investor_churned_count(model) == churned_count(model.investors)
+    assert math.isclose(mean_user_satisfaction(model), mean_satisfaction(model.users), rel_tol=1e-9, abs_tol=1e-12)
+    scanned_wealth = model.treasury.balance + sum(
+        agent.wealth + getattr(agent, "budget", 0.0) for agent in model.agent_by_identifier.values()
+    )
+    assert math.isclose(total_wealth(model), scanned_wealth, rel_tol=1e-9)
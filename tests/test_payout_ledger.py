@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+
+from bitrewards_abm.domain.entities import ContributionType
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.model import BitRewardsModel
+from bitrewards_abm.simulation.payouts import PayoutLedger
+
+
+def test_ledger_aggregates_by_contribution_type_source_and_channel() -> None:
+    ledger = PayoutLedger()
+    ledger.add("c1", 1.0, "gas", "c3", "gas")
+    ledger.add("c2", 2.0, "royalty", "c2", "royalty")
+    ledger.add("c1", 0.5, "gas", "c3", "gas")
+    ledger.add("c1", 0.25, "royalty", "c3", "royalty")
+    ledger.add("c1", 0.0, "gas", "c3", "gas")
+    assert len(ledger) == 3
+    assert math.isclose(ledger.pending_for("c1"), 1.75)
+    drained = ledger.drain()
+    assert [contribution_id for contribution_id, _ in drained] == ["c1", "c2"]
+    gas, royalty = drained[0][1]
+    assert (gas.payout_type, gas.amount, gas.payment_count) == ("gas", 1.5, 2)
+    assert (royalty.payout_type, royalty.amount, royalty.payment_count) == ("royalty", 0.25, 1)
+    assert not ledger
+
+
+def build_capped_investor_model(payout_lag_steps: int) -> tuple[BitRewardsModel, str]:
+    params = SimulationParameters(
+        creator_count=1,
+        investor_count=1,
+        user_count=0,
+        gas_fee_share_rate=1.0,
+        funding_min_amount=10.0,
+        funding_max_amount=10.0,
+        funding_royalty_min=1.0,
+        funding_royalty_max=1.0,
+        investor_return_cap_multiple=1.0,
+        investor_post_cap_payout_fraction=0.25,
+        creator_base_contribution_probability=0.0,
+        user_usage_probability=0.0,
+        payout_lag_steps=payout_lag_steps,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    core_id = model.register_creator_contribution(
+        creator=model.creators[0],
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=1.0,
+        parent_identifier=None,
+    )
+    model.register_funding_contribution(investor=model.investors[0], target_identifier=core_id)
+    return model, core_id
+
+
+def test_lagged_flush_settles_once_per_contribution_with_same_totals() -> None:
+    immediate, immediate_core = build_capped_investor_model(payout_lag_steps=0)
+    lagged, lagged_core = build_capped_investor_model(payout_lag_steps=2)
+    for step in range(1, 3):
+        for model, core_id in ((immediate, immediate_core), (lagged, lagged_core)):
+            model.current_step = step
+            model.reset_step_internal_state()
+            for _ in range(3):
+                model.register_usage_event(contribution_identifier=core_id, gross_value=3.0)
+            model.distribute_usage_event_fees()
+            model._flush_pending_payouts_if_due()
+    assert not lagged.pending_payouts
+    assert math.isclose(lagged.investors[0].wealth, immediate.investors[0].wealth, rel_tol=1e-9)
+    assert math.isclose(lagged.treasury.balance, immediate.treasury.balance, rel_tol=1e-9)
+    lagged_events = [event for event in lagged.reward_events if event["recipient_id"] == lagged.investors[0].unique_id]
+    assert len(lagged_events) == 1
+    assert math.isclose(lagged_events[0]["amount"], lagged.investors[0].wealth, rel_tol=1e-9)
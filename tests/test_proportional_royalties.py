@@ -23,3 +23,44 @@ def test_proportional_royalties_splits_half_upstream() -> None:
     assert math.isclose(shares.get("p1", 0.0), 25.0, rel_tol=1e-9, abs_tol=1e-9)
     assert math.isclose(shares.get("p2", 0.0), 25.0, rel_tol=1e-9, abs_tol=1e-9)
     assert math.isclose(sum(shares.values()), total_value, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_proportional_royalties_merge_pools_on_stacked_diamonds() -> None:
+    graph = ContributionGraph()
+    layers = 40
+    graph.add_contribution_node("n0")
+    for layer in range(layers):
+        left, right, bottom = f"l{layer}", f"r{layer}", f"n{layer + 1}"
+        for node in (left, right, bottom):
+            graph.add_contribution_node(node)
+        graph.add_parent_child_edge(f"n{layer}", left, split_fraction=1.0)
+        graph.add_parent_child_edge(f"n{layer}", right, split_fraction=1.0)
+        graph.add_parent_child_edge(left, bottom, split_fraction=0.5)
+        graph.add_parent_child_edge(right, bottom, split_fraction=0.5)
+    shares = graph.compute_royalty_shares(
+        start_id=f"n{layers}",
+        total_value=100.0,
+        mode="proportional_50_50",
+        keep_fraction=0.5,
+    )
+    assert math.isclose(sum(shares.values()), 100.0, rel_tol=1e-9)
+    assert math.isclose(shares[f"l{layers - 1}"], 12.5, rel_tol=1e-9)
+    assert math.isclose(shares[f"n{layers - 1}"], 12.5, rel_tol=1e-9)
+    assert graph.cache_stats()["misses"] == 1
+
+
+def test_proportional_share_cache_is_invalidated_by_new_upstream_edge() -> None:
+    graph = ContributionGraph()
+    for node in ("root", "mid", "leaf", "extra"):
+        graph.add_contribution_node(node)
+    graph.add_parent_child_edge("root", "mid", split_fraction=1.0)
+    graph.add_parent_child_edge("mid", "leaf", split_fraction=1.0)
+    first = graph.compute_royalty_shares("leaf", 8.0, mode="proportional_50_50", keep_fraction=0.5)
+    again = graph.compute_royalty_shares("leaf", 16.0, mode="proportional_50_50", keep_fraction=0.5)
+    assert math.isclose(again["root"], 2 * first["root"], rel_tol=1e-9)
+    assert graph.cache_stats()["hits"] == 1
+    graph.add_parent_child_edge("extra", "mid", split_fraction=1.0)
+    updated = graph.compute_royalty_shares("leaf", 8.0, mode="proportional_50_50", keep_fraction=0.5)
+    assert math.isclose(updated["extra"], 1.0, rel_tol=1e-9)
+    assert math.isclose(updated["root"], 1.0, rel_tol=1e-9)
+    assert graph.cache_stats()["misses"] == 2
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+from pathlib import Path
+from textwrap import dedent
+
+import experiments.run_batch as run_batch
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.experiment.result_cache import ResultCache, run_cache_key
+
+
+def _write_config(tmp_path: Path) -> Path:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 3
+        investor_count = 1
+        user_count = 5
+        max_steps = 6
+
+        [experiment]
+        name = "cache"
+        runs_per_config = 2
+        random_seed_base = 11
+
+        [experiment.sweeps]
+        gas_fee_share_rate = [0.002, 0.004]
+        """
+    ).strip()
+    config_path = tmp_path / "cache.toml"
+    config_path.write_text(config_text)
+    return config_path
+
+
+def test_cached_batch_matches_fresh_run_without_simulating(tmp_path: Path, monkeypatch) -> None:
+    config_path = _write_config(tmp_path)
+    cache_dir = tmp_path / "cache"
+    run_batch.run_experiments_for_config(config_path, out_dir=tmp_path / "first", cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*/*.pkl"))) == 4
+
+    def fail_model(*args, **kwargs):
+        raise AssertionError("a cached run was simulated again")
+
+    monkeypatch.setattr(run_batch, "BitRewardsModel", fail_model)
+    run_batch.run_experiments_for_config(config_path, out_dir=tmp_path / "second", cache_dir=cache_dir)
+
+    for name in ("timeseries.csv", "run_summary.csv"):
+        assert (tmp_path / "second" / name).read_bytes() == (tmp_path / "first" / name).read_bytes()
+
+
+def test_cache_key_covers_parameters_seed_and_code() -> None:
+    parameters = SimulationParameters()
+    key = run_cache_key(parameters, 1, fingerprint="code-a")
+
+    assert run_cache_key(SimulationParameters(), 1, fingerprint="code-a") == key
+    assert run_cache_key(parameters, 2, fingerprint="code-a") != key
+    assert run_cache_key(parameters, 1, fingerprint="code-b") != key
+    changed = dataclasses.replace(parameters, gas_fee_share_rate=parameters.gas_fee_share_rate + 0.001)
+    assert run_cache_key(changed, 1, fingerprint="code-a") != key
+
+
+def test_evict_drops_stale_then_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path)
+    now = 1_000_000.0
+    for index, key in enumerate(("aa01", "bb02", "cc03", "dd04")):
+        cache.put(key, b"x" * 1000)
+        os.utime(cache._entry_path(key), (now - 100 * (4 - index), now - 100 * (4 - index)))
+    entry_size = cache._entry_path("aa01").stat().st_size
+
+    assert cache.evict(max_age_seconds=350, now=now) == 1
+    assert cache.get("aa01") is None
+
+    # The hit refreshes bb02, so cc03 is now the least recently used entry.
+    assert cache.get("bb02") == b"x" * 1000
+    assert cache.evict(max_bytes=2 * entry_size) == 1
+    assert cache.get("cc03") is None
+    assert cache.get("dd04") is not None
+    assert cache.size_bytes() == 2 * entry_size
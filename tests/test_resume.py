@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+
+import pandas as pd
+
+import bitrewards_abm.experiment.result_cache as result_cache
+import experiments.run_batch as run_batch
+from bitrewards_abm.experiment.shards import RunShardStore
+
+
+def _write_config(tmp_path: Path) -> Path:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 3
+        investor_count = 1
+        user_count = 5
+        max_steps = 6
+
+        [experiment]
+        name = "resume"
+        runs_per_config = 2
+        random_seed_base = 3
+
+        [experiment.sweeps]
+        gas_fee_share_rate = [0.002, 0.004, 0.006]
+        """
+    ).strip()
+    config_path = tmp_path / "resume.toml"
+    config_path.write_text(config_text)
+    return config_path
+
+
+def test_resume_skips_completed_runs_and_rebuilds_outputs(tmp_path: Path, monkeypatch) -> None:
+    config_path = _write_config(tmp_path)
+    out_dir = tmp_path / "out"
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+    expected = {name: (out_dir / name).read_bytes() for name in ("timeseries.csv", "run_summary.csv")}
+
+    store = RunShardStore(out_dir / "shards")
+    assert len(store.completed()) == 6
+    lines = store.manifest_path.read_text().splitlines(keepends=True)
+    store.manifest_path.write_text("".join(lines[:4]) + lines[4][:10])
+    (out_dir / "timeseries.csv").unlink()
+    (out_dir / "run_summary.csv").unlink()
+
+    executed: list[int] = []
+    original = run_batch._execute_run
+
+    def counting_execute(task, *args):
+        executed.append(task.run_id)
+        return original(task, *args)
+
+    monkeypatch.setattr(run_batch, "_execute_run", counting_execute)
+    summary_df, timeseries_df = run_batch.run_experiments_for_config(config_path, out_dir=out_dir, resume=True)
+
+    assert executed == [4, 5]
+    for name, content in expected.items():
+        assert (out_dir / name).read_bytes() == content
+    assert summary_df["run_id"].tolist() == list(range(6))
+    assert len(timeseries_df) == len(pd.read_csv(out_dir / "timeseries.csv"))
+    assert len(store.completed()) == 6
+
+
+def test_fresh_run_clears_previous_shards(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path)
+    out_dir = tmp_path / "out"
+    stale = RunShardStore(out_dir / "shards")
+    stale.record(99, "stale", {"timeseries": "a\n1\n", "summary": "a\n1\n"})
+
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+
+    completed = RunShardStore(out_dir / "shards").completed()
+    assert "stale" not in completed
+    assert sorted(int(entry["run_id"]) for entry in completed.values()) == list(range(6))
+
+
+def test_resume_reruns_everything_after_a_config_edit(tmp_path: Path, monkeypatch) -> None:
+    config_path = _write_config(tmp_path)
+    out_dir = tmp_path / "out"
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+    config_path.write_text(config_path.read_text().replace("max_steps = 6", "max_steps = 7"))
+
+    executed: list[int] = []
+    original = run_batch._execute_run
+
+    def counting_execute(task, *args):
+        executed.append(task.run_id)
+        return original(task, *args)
+
+    monkeypatch.setattr(run_batch, "_execute_run", counting_execute)
+    _, timeseries_df = run_batch.run_experiments_for_config(config_path, out_dir=out_dir, resume=True)
+
+    assert executed == list(range(6))
+    assert set(timeseries_df.groupby("run_id").size()) == {7}
+
+
+def test_resume_reuses_runs_after_a_code_only_change(tmp_path: Path, monkeypatch) -> None:
+    config_path = _write_config(tmp_path)
+    out_dir = tmp_path / "out"
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir)
+
+    executed: list[int] = []
+    monkeypatch.setattr(result_cache, "code_fingerprint", lambda: "edited-plotting-module")
+    monkeypatch.setattr(run_batch, "_execute_run", lambda task, *args: executed.append(task.run_id))
+    run_batch.run_experiments_for_config(config_path, out_dir=out_dir, resume=True)
+
+    assert executed == []
@@ -51,3 +51,27 @@ def test_diamond_selects_single_branch() -> None:
     assert math.isclose(shares.get("root", 0.0), 25.0, rel_tol=1e-9, abs_tol=1e-9)
     assert "b" not in shares or math.isclose(shares.get("b", 0.0), 0.0, rel_tol=1e-9, abs_tol=1e-9)
     assert math.isclose(sum(shares.values()), total_value, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_single_path_chain_is_cached_until_an_ancestor_gains_a_parent() -> None:
+    graph = ContributionGraph()
+    for node_id in ("c0", "c1", "c2", "other"):
+        graph.add_contribution_node(node_id)
+    graph.add_parent_child_edge("c0", "c1", split_fraction=0.5)
+    graph.add_parent_child_edge("c1", "c2", split_fraction=0.5)
+    graph.compute_royalty_shares(start_id="c2", total_value=100.0)
+    graph.compute_royalty_shares(start_id="other", total_value=10.0)
+    shares = graph.compute_royalty_shares(start_id="c2", total_value=40.0)
+    assert math.isclose(shares["c0"], 10.0, rel_tol=1e-9, abs_tol=1e-9)
+    assert graph.cache_stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+    graph.add_contribution_node("f0")
+    graph.add_parent_child_edge("f0", "c1", split_fraction=0.25, edge_type="funding")
+    assert graph.cache_stats()["entries"] == 1
+    shares = graph.compute_royalty_shares(start_id="c2", total_value=100.0)
+    assert math.isclose(shares["c2"], 50.0, rel_tol=1e-9, abs_tol=1e-9)
+    assert math.isclose(shares["c1"], 37.5, rel_tol=1e-9, abs_tol=1e-9)
+    assert math.isclose(shares["f0"], 12.5, rel_tol=1e-9, abs_tol=1e-9)
+    assert "c0" not in shares
+    graph.compute_royalty_shares(start_id="other", total_value=10.0)
+    assert graph.cache_stats() == {"hits": 2, "misses": 3, "entries": 2}
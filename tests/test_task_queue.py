@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from textwrap import dedent
+
+from bitrewards_abm.experiment.task_queue import FileTaskQueue
+from experiments.run_batch import enqueue_config, merge_queue_results, run_experiments_for_config, work_on_queue
+
+
+def test_claims_are_exclusive_and_stale_claims_are_reclaimed(tmp_path: Path) -> None:
+    queue = FileTaskQueue.create(tmp_path, {"a": {"value": 1}, "b": {"value": 2}}, stale_after=60.0)
+    first = queue.claim()
+    second = queue.claim()
+    assert first is not None and second is not None
+    assert {first.task_id, second.task_id} == {"a", "b"}
+    assert queue.claim() is None
+    assert first.payload == {"value": 1}
+
+    queue.complete(second)
+    assert queue.reclaim_stale() == []
+    long_ago = time.time() - 120.0
+    os.utime(first.claim_path, (long_ago, long_ago))
+    assert queue.reclaim_stale() == ["a"]
+    assert queue.task_ids("pending") == ["a"]
+    assert queue.task_ids("done") == ["b"]
+    assert not queue.is_finished()
+
+    reclaimed = queue.claim()
+    assert reclaimed is not None and reclaimed.task_id == "a"
+    queue.complete(first)
+    assert queue.is_finished()
+
+
+def _worker(queue_dir: Path) -> None:
+    work_on_queue(queue_dir, stale_after=1.0, poll_interval=0.05)
+
+
+def test_local_worker_processes_drain_queue_and_merge_matches_serial(tmp_path: Path) -> None:
+    config_text = dedent(
+        """
+        [simulation]
+        creator_count = 3
+        investor_count = 1
+        user_count = 5
+        max_steps = 6
+
+        [experiment]
+        name = "shared_fs"
+        runs_per_config = 2
+        random_seed_base = 7
+
+        [experiment.sweeps]
+        gas_fee_share_rate = [0.002, 0.004, 0.006]
+        """
+    ).strip()
+    config_path = tmp_path / "shared.toml"
+    config_path.write_text(config_text)
+    queue_dir = tmp_path / "queue"
+    queue = enqueue_config(config_path, queue_dir, stale_after=1.0)
+
+    crashed = queue.claim()
+    assert crashed is not None
+    long_ago = time.time() - 10.0
+    os.utime(crashed.claim_path, (long_ago, long_ago))
+
+    workers = [multiprocessing.Process(target=_worker, args=(queue_dir,)) for _ in range(3)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    assert queue.is_finished()
+    assert len(queue.task_ids("done")) == 6
+    merge_queue_results(queue_dir, tmp_path / "merged")
+    run_experiments_for_config(config_path, out_dir=tmp_path / "serial")
+    for name in ("timeseries.csv", "run_summary.csv"):
+        assert (tmp_path / "merged" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
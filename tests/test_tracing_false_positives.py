@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+
+from bitrewards_abm.domain.entities import ContributionType
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def build_model_with_roots(count: int) -> BitRewardsModel:
+    params = SimulationParameters(
+        creator_count=1,
+        investor_count=0,
+        user_count=0,
+        tracing_accuracy=0.0,
+        tracing_false_positive_rate=1.0,
+        creator_base_contribution_probability=0.0,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    for _ in range(count):
+        model.register_creator_contribution(
+            creator=model.creators[0],
+            contribution_type=ContributionType.CORE_RESEARCH,
+            quality=1.0,
+            parent_identifier=None,
+        )
+    return model
+
+
+def test_excluding_draw_matches_choice_over_filtered_candidates() -> None:
+    model = build_model_with_roots(12)
+    excluded = ["c3", "c7"]
+    candidates = [cid for cid in model.contributions if cid not in excluded]
+    reference = random.Random(9)
+    model.random.seed(9)
+    for _ in range(200):
+        assert model._draw_contribution_excluding(excluded) == reference.choice(candidates)
+
+
+def test_false_positive_parent_is_never_the_true_parent_or_self() -> None:
+    model = build_model_with_roots(3)
+    for _ in range(50):
+        identifier = model.register_creator_contribution(
+            creator=model.creators[0],
+            contribution_type=ContributionType.CORE_RESEARCH,
+            quality=1.0,
+            parent_identifier="c0",
+        )
+        parents = model.contributions[identifier].parents
+        assert parents and parents[0] not in {"c0", identifier}
+    assert model.tracing_metrics["false_positive_links"] == 50
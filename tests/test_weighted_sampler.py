@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import random
+
+from bitrewards_abm.domain.entities import ContributionType, HonorSealStatus
+from bitrewards_abm.domain.parameters import SimulationParameters
+from bitrewards_abm.infrastructure.sampling import BucketedSampler, WeightedSampler
+from bitrewards_abm.simulation.model import BitRewardsModel
+
+
+def test_sampler_matches_random_choices_for_same_seed() -> None:
+    keys = [f"c{i}" for i in range(200)]
+    weights = [0.01 + (i * 37 % 11) / 10.0 for i in range(200)]
+    sampler = WeightedSampler()
+    for key, weight in zip(keys, weights):
+        sampler.add(key, weight)
+    rng_sampler = random.Random(5)
+    rng_reference = random.Random(5)
+    for _ in range(500):
+        expected = rng_reference.choices(keys, weights=weights, k=1)[0]
+        assert sampler.sample(rng_sampler) == expected
+
+
+def test_sampler_skips_zero_weight_keys_after_update() -> None:
+    sampler = WeightedSampler()
+    sampler.add("a", 1.0)
+    sampler.add("b", 1.0)
+    sampler.add("c", 1.0)
+    sampler.set_weight("b", 0.0)
+    rng = random.Random(1)
+    draws = {sampler.sample(rng) for _ in range(300)}
+    assert draws == {"a", "c"}
+
+
+def test_dishonored_contribution_weight_is_updated_in_usage_index() -> None:
+    params = SimulationParameters(
+        creator_count=1,
+        investor_count=0,
+        user_count=0,
+        honor_seal_enabled=True,
+        honor_seal_initial_adoption_rate=1.0,
+        honor_seal_fake_rate=1.0,
+        honor_seal_fake_detection_prob_per_step=1.0,
+        honor_seal_demand_multiplier=2.0,
+        honor_seal_dishonored_penalty_multiplier=0.25,
+        creator_base_contribution_probability=0.0,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    identifier = model.register_creator_contribution(
+        creator=model.creators[0],
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=0.5,
+        parent_identifier=None,
+    )
+    assert model.contributions[identifier].honor_seal_status is HonorSealStatus.FAKE
+    assert model.usage_sampler.bucket_of(identifier) is HonorSealStatus.FAKE
+    model._enforce_honor_seal()
+    assert model.contributions[identifier].honor_seal_status is HonorSealStatus.DISHONORED
+    assert model.usage_sampler.bucket_of(identifier) is HonorSealStatus.DISHONORED
+    assert model.usage_sampler.weight_of(identifier) == 0.5
+    assert model.usage_sampler.bucket_total(HonorSealStatus.FAKE) == 0.0
+
+
+def test_bucketed_sampler_scales_buckets_by_multiplier() -> None:
+    sampler = BucketedSampler(["sealed", "unsealed"])
+    sampler.add("s0", "sealed", 1.0)
+    sampler.add("u0", "unsealed", 1.0)
+    sampler.add("u1", "unsealed", 1.0)
+    rng = random.Random(3)
+    draws = [sampler.sample(rng, {"sealed": 8.0, "unsealed": 1.0}) for _ in range(2000)]
+    sealed_share = draws.count("s0") / len(draws)
+    assert 0.75 < sealed_share < 0.85
+    assert sampler.sample(rng, {"sealed": 0.0, "unsealed": 1.0}) in {"u0", "u1"}
+
+
+def test_bucketed_sampler_compacts_slots_left_behind_by_moves() -> None:
+    labels = ["sealed", "unsealed", "dishonored"]
+    sampler = BucketedSampler(labels)
+    keys = [f"c{i}" for i in range(1000)]
+    for index, key in enumerate(keys):
+        sampler.add(key, labels[0], 1.0 + index % 7)
+    rng = random.Random(11)
+    for round_index in range(30):
+        for key in rng.sample(keys, 400):
+            sampler.move(key, labels[(labels.index(sampler.bucket_of(key)) + 1 + round_index % 2) % 3])
+        for label in labels:
+            live = sum(1 for key in keys if sampler.bucket_of(key) == label)
+            assert sampler.bucket_slots(label) <= 2 * live + WeightedSampler.compact_min_ghosts
+    for key in keys:
+        sampler.move(key, "unsealed")
+    assert sampler.bucket_slots("sealed") <= WeightedSampler.compact_min_ghosts
+    assert sampler.bucket_slots("dishonored") <= WeightedSampler.compact_min_ghosts
+    assert sampler.bucket_total("unsealed") == sum(1.0 + index % 7 for index in range(1000))
+    draws = {sampler.sample(rng, {"sealed": 5.0, "unsealed": 1.0, "dishonored": 5.0}) for _ in range(200)}
+    assert draws <= set(keys)
+
+
+def test_funding_target_index_skips_funding_and_low_quality_contributions() -> None:
+    params = SimulationParameters(
+        creator_count=1,
+        investor_count=1,
+        user_count=0,
+        investor_min_target_quality=0.5,
+        funding_min_amount=1.0,
+        funding_max_amount=1.0,
+        creator_base_contribution_probability=0.0,
+        max_steps=1,
+    )
+    model = BitRewardsModel(parameters=params)
+    creator = model.creators[0]
+    strong = model.register_creator_contribution(
+        creator=creator,
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=0.9,
+        parent_identifier=None,
+    )
+    weak = model.register_creator_contribution(
+        creator=creator,
+        contribution_type=ContributionType.CORE_RESEARCH,
+        quality=0.1,
+        parent_identifier=None,
+    )
+    funding = model.register_funding_contribution(investor=model.investors[0], target_identifier=strong)
+    assert funding is not None
+    assert strong in model.funding_target_sampler
+    assert weak not in model.funding_target_sampler
+    assert funding not in model.funding_target_sampler
+    assert {strong, weak, funding} == {key for key in model.contributions if key in model.parent_sampler}
+    assert {model.select_contribution_for_funding() for _ in range(50)} == {strong}
@@ -7,6 +7,8 @@ from typing import List
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from bitrewards_abm.simulation.collector import reconstruct_dense_agent_vars
+
 
 def load_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
@@ -53,6 +55,8 @@ def plot_creator_wealth_histogram(agent_path: Path, output_path: Path) -> None:
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"Missing columns in agent data: {missing}")
+    if {"Step", "AgentID"} <= set(df.columns):
+        df = reconstruct_dense_agent_vars(df, steps=[df["Step"].max()]).reset_index()
     creators = df[df["agent_type"] == "CreatorAgent"].copy()
     if creators.empty:
         raise ValueError("No creator rows in agent data")